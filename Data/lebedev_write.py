@@ -201,17 +201,9 @@ def Lebedev(n):
     return None
 
 if __name__ == '__main__':
-    print "#!/usr/bin/env python"
-    print "Lebedev = {"
+    # Write the binary tables read by PyQuante/Lebedev.py. Run this
+    # from the top of the source tree.
+    from numpy import array
     for i in [6,14,26,38,50,74,86,110,146,170,194]:
-        print "    %d : [" % i
         lf = LebFunc[i]()
-        for xyzw in lf:
-            print "        (%16.12f,%16.12f,%16.12f,%16.12f)," % xyzw
-        print "    ],"
-    print "}"
-
-
-    
-
-
+        array(lf,'<f8').tofile("PyQuante/GridData/lebedev_%d.dat" % i)
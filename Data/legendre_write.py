@@ -31,14 +31,12 @@ r[28],w[28] = p_roots(28)
 r[32],w[32] = p_roots(32)
 r[36],w[36] = p_roots(36)
 
-print "Legendre = {"
+# Write the binary tables read by PyQuante/Legendre.py. Run this
+# from the top of the source tree.
+from numpy import array
 for i in [20,24,28,32,36]:
-    print "    %d: [" % i
     roots,weights = r[i],w[i]
-    for ii in range(i):
-        if roots[ii].imag:
-            raise "Error, P_%d root %d complex"
-        print "        (%20.15f,%20.15f)," % (roots[ii].real,weights[ii])
-    print "    ],"
-print "}"
-
+    if roots.imag.any():
+        raise Exception("Error, P_%d has complex roots" % i)
+    array(zip(roots.real,weights),'<f8').tofile(
+        "PyQuante/GridData/legendre_%d.dat" % i)
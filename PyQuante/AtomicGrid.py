@@ -20,7 +20,7 @@ from GridPoint import GridPoint
 from Lebedev import Lebedev
 from Legendre import Legendre
 from math import sin,cos,pi
-from NumWrap import zeros,array
+from NumWrap import zeros,array,concatenate
 from Constants import ang2bohr
 
 # Where do these values come from? What are the units?
@@ -60,9 +60,6 @@ class AtomicGrid:
         # and in an array of shells of points. The goal is to move
         # to only having the array of shells 
         self.do_grad_dens = kwargs.get('do_grad_dens',settings.DFTDensityGradient)
-        radial = kwargs.get('radial',settings.DFTRadialGridType)
-        nrad = kwargs.get('nrad',settings.DFTGridRadii)
-        fineness = kwargs.get('fineness',settings.DFTGridFineness)
         self.points = []
         self.shells = []
         self.Z = atom.atno
@@ -70,12 +67,7 @@ class AtomicGrid:
 
         x,y,z = atom.pos()
 
-        if radial == 'Legendre':
-            self.grid = LegendreGrid(nrad,self.Rmax,fineness)
-        else:
-            self.grid = EulerMaclaurinGrid(nrad,self.Z,do_sg1=False)
-            #self.grid = EulerMaclaurinGrid(50,self.Z,nang=194,do_sg1=False)
-        # Could also call for EML or SG1 grids:
+        self.grid = atomic_shells(self.Z,**kwargs)
 
         for rrad,wrad,nangpts in self.grid:
             shell = []
@@ -98,7 +90,15 @@ class AtomicGrid:
 
     def set_bf_amps(self,bfs,**kwargs):
         "Set the basis function amplitude at each grid point"
-        for point in self.points: point.set_bf_amps(bfs,**kwargs)
+        from PyQuante.CGBF import eval_bfs
+        xyz = array([point.xyzw()[:3] for point in self.points])
+        if self.do_grad_dens:
+            amps,grads = eval_bfs(bfs,xyz,1)
+        else:
+            amps = eval_bfs(bfs,xyz)
+        for i in xrange(len(self.points)):
+            self.points[i].bfs = amps[i]
+            if self.do_grad_dens: self.points[i].bfgrads = grads[i]
         return
 
     def setdens(self,D,**kwargs):
@@ -159,32 +159,95 @@ class AtomicGrid:
             point.scale_density(factor)
         return
 
+def atomic_grid_xyzw(atom,cache=None,**kwargs):
+    """\
+    xyzw = atomic_grid_xyzw(atom,cache=None,**options)
+
+    Form the (npts,4) array of the x,y,z and weight of each point in
+    the atomic grid directly from the radial and Lebedev tables, without
+    making any GridPoint objects. Takes the same options as AtomicGrid,
+    and gives the same points in the same order. If cache, a dictionary
+    owned by the caller, is given, the unpartitioned grid about the
+    origin is kept there, keyed on the element and the grid options,
+    so later calls only translate a copy of it.
+    """
+    radial = kwargs.get('radial',settings.DFTRadialGridType)
+    nrad = kwargs.get('nrad',settings.DFTGridRadii)
+    fineness = kwargs.get('fineness',settings.DFTGridFineness)
+    pruning = kwargs.get('pruning',settings.DFTGridPruning)
+    Z = atom.atno
+    key = (Z,radial,nrad,fineness,pruning,settings.DFTGridAngularPoints)
+    if cache is None: cache = {}
+    if key not in cache:
+        shells = []
+        for rrad,wrad,nangpts in atomic_shells(Z,**kwargs):
+            ang = Lebedev[nangpts]
+            shell = zeros(ang.shape,'d')
+            shell[:,:3] = rrad*ang[:,:3]
+            shell[:,3] = wrad*ang[:,3]
+            shells.append(shell)
+        cache[key] = concatenate(shells)
+    xyzw = cache[key].copy()
+    xyzw[:,:3] += array(atom.pos())
+    return xyzw
+
+def atomic_shells(Z,**kwargs):
+    """\
+    grid = atomic_shells(Z,**kwargs)
+
+    The [(ri,wi,nangi)] shells of the atomic grid of element Z.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    radial        EulerMaclaurin  Radial grid, or Legendre
+    nrad          32      Number of radial shells
+    fineness      1       Angular fineness of unpruned Legendre grids
+    pruning       None    SG1, SG2 or SG3 for the pruned grids in
+                          PrunedGrids. An Euler-Maclaurin grid then
+                          uses the number of shells of the pruned grid,
+                          not nrad.
+    """
+    radial = kwargs.get('radial',settings.DFTRadialGridType)
+    nrad = kwargs.get('nrad',settings.DFTGridRadii)
+    fineness = kwargs.get('fineness',settings.DFTGridFineness)
+    pruning = kwargs.get('pruning',settings.DFTGridPruning)
+    if radial == 'Legendre':
+        return LegendreGrid(nrad,0.5*Bragg[Z]*ang2bohr,fineness,Z=Z,
+                            pruning=pruning)
+    if pruning: nrad = PrunedGrids[pruning][0]
+    return EulerMaclaurinGrid(nrad,Z,pruning=pruning)
+
 # The following two routines return [(ri,wi,nangi)] for nrad shells.
 # The ri's are properly adjusted to go to the proper distances.
 # The wi's are adjusted to only have to be multiplied by wrad from
 # the lebedev shell
 def EulerMaclaurinGrid(nrad,Z,**kwargs):
-    do_sg1 = kwargs.get('do_sg1',settings.DFTGridSG1)
+    pruning = kwargs.get('pruning')
+    if kwargs.get('do_sg1'): pruning = 'SG1' # the older option
     nang = kwargs.get('nang',settings.DFTGridAngularPoints)
     radial = EulerMaclaurinRadialGrid(nrad,Z)
-    if do_sg1:
-        grid = [(r,w,SG1Angs(r,Z)) for r,w in radial]
+    if pruning:
+        grid = [(r,w,PrunedAngs(r,Z,pruning)) for r,w in radial]
     else:
         grid = [(r,w,nang) for r,w in radial]
     return grid
 
-def LegendreGrid(nrad,Rmax,fineness):
+def LegendreGrid(nrad,Rmax,fineness,**kwargs):
     #Rmax = 0.5*Bragg[Z]*ang2bohr
+    pruning = kwargs.get('pruning')
+    Z = kwargs.get('Z')
 
-    radial = Legendre[nrad]
+    xrads,wrads = Legendre[nrad].T
+    rrads = BeckeRadMap(xrads,Rmax)
+    wrads = wrads*4*pi*rrads*rrads*2*Rmax/(1-xrads)**2
     grid = []
     for i in xrange(nrad):
-        xrad,wrad = radial[i]
-        rrad = BeckeRadMap(xrad,Rmax)
-        dr = 2*Rmax/pow(1-xrad,2)
-        vol = 4*pi*rrad*rrad*dr
-        nangpts = ang_mesh(float(i+1)/nrad,fineness)
-        grid.append((rrad,wrad*vol,nangpts))
+        rrad,wrad = rrads[i],wrads[i]
+        if pruning:
+            nangpts = PrunedAngs(rrad,Z,pruning)
+        else:
+            nangpts = ang_mesh(float(i+1)/nrad,fineness)
+        grid.append((rrad,wrad,nangpts))
     return grid
     
 def BeckeRadMap(x,Rmax):
@@ -305,9 +368,29 @@ def EulerMaclaurinRadialGrid(nrad,Z):
         grid.append((r,w))
     return grid
 
+# Pruned grids: the number of Euler-Maclaurin radial shells, and the
+# Lebedev orders in the five regions of each atom that SG1Angs bounds
+# with the alphas. SG1 is the SG-1 grid of Gill, Johnson and Pople,
+# CPL 209, 506 (1993). SG2 and SG3 prune the same way with more shells
+# and points, in the spirit of Dasgupta and Herbert, JCC 38, 869 (2017),
+# but their published grids need Lebedev orders past the 194 in Lebedev.
+PrunedGrids = {
+    'SG1' : (50,[6,38,86,194,86]),
+    'SG2' : (75,[26,110,146,194,110]),
+    'SG3' : (99,[50,146,194,194,146]),
+    }
+
 def SG1Angs(r,Z):
     # Gill, Johnson, Pople rules for SG-1 angular densities
-    R = PopleRadii[Z]
+    return PrunedAngs(r,Z,'SG1')
+
+def PrunedAngs(r,Z,pruning):
+    "Lebedev order at radius r of the pruned grid pruning for element Z"
+    nangs = PrunedGrids[pruning][1]
+    if Z < len(PopleRadii):
+        R = PopleRadii[Z]
+    else: # no SG-1 radius, so use the Bragg radius
+        R = Bragg[Z]*ang2bohr
     if Z in xrange(1,3): # H-He
         alphas = [0.25,0.5,1.0,4.5]
     elif Z in xrange(3,11): # Li-Ne
@@ -315,8 +398,6 @@ def SG1Angs(r,Z):
     else: # only fit for Na-Ar
         alphas = [0.1,0.4,0.8,2.5]
 
-    if r < alphas[0]*R: return 6
-    elif r < alphas[1]*R: return 38
-    elif r < alphas[2]*R: return 86
-    elif r < alphas[3]*R: return 194
-    return 86
+    for alpha,nang in zip(alphas,nangs):
+        if r < alpha*R: return nang
+    return nangs[-1]
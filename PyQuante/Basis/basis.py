@@ -14,6 +14,10 @@ class BasisSet(object):
         """
         # Option to omit f basis functions from imported basis sets
         omit_f = kwargs.get('omit_f',False)
+        # Optional dictionary of the contraction norms of each element,
+        #  atno -> [norm,...] in basis function order. Elements found
+        #  there skip the normalization; the others are added to it.
+        basis_norms = kwargs.get('basis_norms')
         if not basis_data:
             from PyQuante.Basis.p631ss import basis_data
         elif type(basis_data) == type(''):
@@ -26,6 +30,11 @@ class BasisSet(object):
         shells = []# Shell list
         for atom in atoms:
             bs = basis_data[atom.atno]
+            norms = None
+            if basis_norms is not None:
+                norms = basis_norms.setdefault(atom.atno,[])
+            nnorm = len(norms or [])
+            ibf = 0
             for sym,prims in bs: # Shell Symbol S,P,D,F
                 if omit_f and sym == "F": continue
                 shell = Shell(sym)
@@ -38,7 +47,12 @@ class BasisSet(object):
                     #bf = ContractedGTO(primlist,coefs)
                     #bf.normalize()
                     [cgbf.add_primitive(alpha,coef) for alpha,coef in prims]
-                    cgbf.normalize()
+                    if ibf < nnorm:
+                        cgbf.norm = norms[ibf]
+                    else:
+                        cgbf.normalize()
+                        if norms is not None: norms.append(cgbf.norm)
+                    ibf += 1
                     bfs.append(cgbf) # Normal ordering
                     
                     # Shell ordering
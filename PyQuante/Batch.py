@@ -0,0 +1,139 @@
+"""\
+ Batch.py Run many independent SCF calculations over a process pool
+
+ for result in run_batch(molecules,method='DFT',nprocs=8):
+     print result.name,result.energy,result.time
+
+ Each job runs in a worker process, so the module-level state in the
+ integral and SCF code is never shared between concurrent jobs. The
+ workers persist for the whole batch, and each keeps a cache of the
+ basis set data and contraction norms of every element in the batch,
+ keyed on the basis name and element, which is filled in when the
+ worker starts and reused by all of its jobs. Every job still starts
+ from its own core guess; there is no cache of atomic guesses.
+
+ This program is part of the PyQuante quantum chemistry program suite.
+
+ Copyright (c) 2004, Richard P. Muller. All Rights Reserved. 
+
+ PyQuante version 1.2 and later is covered by the modified BSD
+ license. Please see the file LICENSE that is part of this
+ distribution. 
+"""
+import time,traceback,logging
+import settings
+from PyQuante.Bunch import Bunch
+
+logger = logging.getLogger("pyquante")
+
+# Per-process basis cache: (basis,omit_f) -> (basis_data,{atno:[norm,...]})
+_basis_cache = {}
+
+def init_worker(basis,omit_f,atnos):
+    """\
+    init_worker(basis,omit_f,atnos)
+    Pool initializer: fill this process's basis cache with the
+    elements in atnos, so that the jobs only look them up.
+    """
+    from PyQuante.Basis.basis import BasisSet
+    from PyQuante.Molecule import Molecule
+    basis_data,basis_norms = get_cached_basis(basis,omit_f)
+    atoms = Molecule('elements',[(atno,(0,0,0)) for atno in atnos])
+    BasisSet(atoms,basis_data,omit_f=omit_f,basis_norms=basis_norms)
+    return
+
+def get_cached_basis(basis,omit_f=False):
+    """\
+    basis_data,basis_norms = get_cached_basis(basis,omit_f=False)
+    Return this process's cached basis data and contraction norms for
+    the basis set named basis (None is the default 6-31G**).
+    """
+    key = (basis,omit_f)
+    if key not in _basis_cache:
+        from PyQuante.Basis.Tools import get_basis_data
+        if basis:
+            basis_data = get_basis_data(basis)
+        else:
+            from PyQuante.Basis.p631ss import basis_data
+        _basis_cache[key] = (basis_data,{})
+    return _basis_cache[key]
+
+def run_batch(molecules,**kwargs):
+    """\
+    for result in run_batch(molecules,**options): ...
+
+    Run an SCF calculation on each of the molecules over a pool of
+    worker processes, and yield the results as the jobs finish, which
+    need not be in the order of the molecules. Each result is a Bunch
+    with the attributes
+
+      index      Position of the molecule in molecules
+      name       Name of the molecule
+      energy     Final SCF energy, or None if the job failed
+      converged  Whether the SCF converged
+      niter      Number of SCF iterations
+      time       Wall time for the job, in seconds
+      error      Traceback of the failure, or None
+
+    Options:      Value   Description
+    --------      -----   -----------
+    nprocs        None    Number of worker processes. None uses one per
+                          CPU; 1 runs the jobs in this process
+    chunksize     1       Number of jobs sent to a worker at a time
+
+    All other options (method, basis, functional, etol, ...) are passed
+    to SCF and to iterate for every job. Unless bfs or basis_data is
+    given, the basis functions are made from the per-process cache.
+    """
+    from multiprocessing import Pool
+    nprocs = kwargs.get('nprocs',settings.BatchProcesses)
+    chunksize = kwargs.get('chunksize',1)
+    jobs = [(i,molecule,kwargs) for i,molecule in enumerate(molecules)]
+    logger.info("Running %d SCF jobs" % len(jobs))
+    if nprocs == 1:
+        for job in jobs:
+            yield run_job(job)
+        return
+    atnos = sorted(set(atom.atno for molecule in molecules
+                       for atom in molecule))
+    initargs = (kwargs.get('basis'),kwargs.get('omit_f',False),atnos)
+    pool = Pool(nprocs,initializer=init_worker,initargs=initargs)
+    try:
+        for result in pool.imap_unordered(run_job,jobs,chunksize):
+            yield result
+        pool.close()
+    except:
+        # Also reached if the caller stops iterating early
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return
+
+def run_job(job):
+    """\
+    result = run_job((index,molecule,options))
+    Run a single job of run_batch. Failures are caught and returned in
+    result.error, so that one bad job doesn't stop the batch.
+    """
+    from PyQuante.PyQuante2 import SCF
+    index,molecule,kwargs = job
+    result = Bunch(index=index,name=molecule.name,energy=None,
+                   converged=False,niter=0,time=0,error=None)
+    start = time.time()
+    try:
+        if not kwargs.get('bfs') and not kwargs.get('basis_data'):
+            basis_data,basis_norms = get_cached_basis(
+                kwargs.get('basis'),kwargs.get('omit_f',False))
+            kwargs = dict(kwargs,basis_data=basis_data,
+                          basis_norms=basis_norms)
+        solver = SCF(molecule,**kwargs)
+        solver.iterate(**kwargs)
+        result.energy = solver.energy
+        result.converged = solver.iterator.converged
+        result.niter = solver.iterator.iter
+    except Exception:
+        result.error = traceback.format_exc()
+        logger.warning("Batch job %d (%s) failed" % (index,molecule.name))
+    result.time = time.time()-start
+    return result
@@ -195,3 +195,98 @@ def three_center(a,b,c):
                 sum += ac*bc*cc*PGBF.three_center(ap,bp,cp)
     return a.norm*b.norm*c.norm*sum
 
+
+def eval_bfs(bfs,xyz,deriv=0):
+    """\
+    amps = eval_bfs(bfs,xyz)
+    amps,grads = eval_bfs(bfs,xyz,1)
+    amps,grads,laps = eval_bfs(bfs,xyz,2)
+
+    Evaluate the basis functions bfs at an (npts,3) array of points xyz,
+    giving the (npts,nbf) amplitudes, plus the (npts,nbf,3) gradients if
+    deriv > 0 and the (npts,nbf) laplacians if deriv > 1. The exponentials
+    are computed once per primitive for each shell of functions sharing
+    a center and exponents, rather than once per function and point.
+    """
+    from PyQuante.NumWrap import exp,dot,newaxis
+    npts = len(xyz)
+    nbf = len(bfs)
+    amps = zeros((npts,nbf),'d')
+    if deriv > 0: grads = zeros((npts,nbf,3),'d')
+    if deriv > 1: laps = zeros((npts,nbf),'d')
+
+    for origin,exps,ibfs in bf_shells(bfs):
+        d = xyz - array(origin)
+        r2 = (d*d).sum(1)
+        alpha = array(exps)
+        E = exp(-r2[:,newaxis]*alpha)
+        for ibf in ibfs:
+            bf = bfs[ibf]
+            l,m,n = bf.powers
+            c = bf.norm*array(bf.pcoefs)*array(bf.pnorms)
+            # Radial part, and the polynomial part P = x^l y^m z^n
+            g = dot(E,c)
+            px,py,pz = pow(d[:,0],l),pow(d[:,1],m),pow(d[:,2],n)
+            P = px*py*pz
+            amps[:,ibf] = P*g
+            if deriv < 1: continue
+            ga = dot(E,c*alpha)
+            dP = (dpow(d[:,0],l)*py*pz,px*dpow(d[:,1],m)*pz,
+                  px*py*dpow(d[:,2],n))
+            for k in xrange(3):
+                grads[:,ibf,k] = dP[k]*g - 2*d[:,k]*P*ga
+            if deriv < 2: continue
+            gaa = dot(E,c*alpha*alpha)
+            lapP = d2pow(d[:,0],l)*py*pz + px*d2pow(d[:,1],m)*pz \
+                   + px*py*d2pow(d[:,2],n)
+            # grad(P).r = (l+m+n)P, since P is homogeneous
+            laps[:,ibf] = lapP*g - 4*(l+m+n)*P*ga + P*(4*r2*gaa-6*ga)
+
+    if deriv > 1: return amps,grads,laps
+    if deriv > 0: return amps,grads
+    return amps
+
+def cutoff_radius(bf,tol):
+    """\
+    Distance from its center beyond which every primitive of bf is
+    smaller than tol. Uses |c*x^i*y^j*z^k*exp(-a*r2)| <= |c|*r^l*exp(-a*r2),
+    with l = i+j+k, and solves for r by fixed-point iteration.
+    """
+    from math import log
+    l = sum(bf.powers)
+    rmax = 0
+    for a,c,n in zip(bf.pexps,bf.pcoefs,bf.pnorms):
+        cn = abs(bf.norm*c*n)
+        if cn <= tol: continue
+        lnc = log(cn/tol)
+        r = sqrt(lnc/a)
+        for i in xrange(5):
+            r = sqrt((lnc+l*log(max(r,1.)))/a)
+        rmax = max(rmax,r)
+    return rmax
+
+def bf_shells(bfs):
+    """\
+    Group the basis functions into shells of functions with the same
+    center and exponents, as a list of (origin,exps,[ibf,...]).
+    """
+    shells = []
+    index = {}
+    for ibf in xrange(len(bfs)):
+        bf = bfs[ibf]
+        key = bf.origin,tuple(bf.pexps)
+        if key not in index:
+            index[key] = len(shells)
+            shells.append((bf.origin,bf.pexps,[]))
+        shells[index[key]][2].append(ibf)
+    return shells
+
+def dpow(x,n):
+    "d/dx x^n"
+    if n < 1: return 0
+    return n*pow(x,n-1)
+
+def d2pow(x,n):
+    "d2/dx2 x^n"
+    if n < 2: return 0
+    return n*(n-1)*pow(x,n-2)
@@ -1,7 +1,9 @@
 """\
  CI.py: Configuration Interaction Routines.
 
- Currently, the only one implemented is CI-S.
+ Currently, the only one implemented is CI-S. The lowest few states
+ can be found without building the CI matrix or transforming the
+ integrals, with CISSigma and Solvers.block_davidson.
 
  This program is part of the PyQuante quantum chemistry program suite.
 
@@ -14,8 +16,9 @@
 
 import os,sys
 from PyQuante.cints import ijkl2intindex
-from NumWrap import zeros,dot,matrixmultiply,eigh
-from Ints import getbasis, get2ints
+from NumWrap import zeros,dot,matrixmultiply,eigh,asarray,newaxis,tril,triu
+from Ints import getbasis, get2ints, transform_ints, getJ, getK
+from Solvers import block_davidson
 
 def SingleExcitations(occs,virts):
     singles = []
@@ -33,10 +36,67 @@ def DoubleExcitations(occs,virts):
                     doubles.append((occa,occb,virta,virtb))
     return doubles
 
-def CIS(Ints,orbs,orbe,nocc,nvirt,ehf):
-    CIMatrix = CISMatrix(Ints,orbs,ehf,orbe,nocc,nvirt)
-    Ecis,Vectors = eigh(CIMatrix)
-    return Ecis
+def CIS(Ints,orbs,orbe,nocc,nvirt,ehf,**kwargs):
+    """\
+    Ecis = CIS(Ints,orbs,orbe,nocc,nvirt,ehf,**kwargs)
+
+    The energies of the singlet CIS states, i.e. the Hartree-Fock
+    energy ehf plus the CIS (or TDA) excitation energies.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    nroots        None    Only find the nroots lowest states, with
+                          block_davidson on the products of CISSigma.
+                          None builds and diagonalizes the whole
+                          CISMatrix.
+
+    Other options are passed on to block_davidson.
+    """
+    nroots = kwargs.get('nroots')
+    if nroots is None:
+        CIMatrix = CISMatrix(Ints,orbs,ehf,orbe,nocc,nvirt)
+        Ecis,Vectors = eigh(CIMatrix)
+        return Ecis
+    sigma,diag = CISSigma(Ints,orbs,orbe,nocc,nvirt)
+    Ecis,Vectors = block_davidson(sigma,diag,nroots,**kwargs)
+    return ehf+Ecis
+
+def CISSigma(Ints,orbs,orbe,nocc,nvirt):
+    """\
+    sigma,diag = CISSigma(Ints,orbs,orbe,nocc,nvirt)
+
+    The products sigma(X) = A*X of the singlet CIS matrix A (the
+    CISMatrix less ehf) with an (nocc*nvirt,k) block X of vectors
+    over the SingleExcitations, and the orbital energy differences,
+    which approximate the diagonal of A. Each vector x is contracted
+    with the AO integrals through its transition density
+    P = Cocc x Cvirt^T,
+
+      (A x)[a,r] = (e_r-e_a) x[a,r] + [Cocc^T (2J[P]-K[P]) Cvirt][a,r]
+
+    so there are no MO integrals, and only a few nbf x nbf
+    matrices per vector.
+    """
+    occs = orbs[:,:nocc]
+    virts = orbs[:,nocc:nocc+nvirt]
+    orbe = asarray(orbe)
+    de = (orbe[nocc:nocc+nvirt]-orbe[:nocc,newaxis]).ravel()
+
+    def sigma(X):
+        AX = de[:,newaxis]*X
+        for k in xrange(X.shape[1]):
+            P = dot(occs,dot(X[:,k].reshape((nocc,nvirt)),virts.T))
+            G = 2*getJ(Ints,P)-transition_K(Ints,P)
+            AX[:,k] += dot(occs.T,dot(G,virts)).ravel()
+        return AX
+    return sigma,de
+
+def transition_K(Ints,P):
+    """\
+    The exchange operator of a density P that needn't be symmetric.
+    getK only forms the lower triangle of K[P], and K[P].T = K[P.T].
+    """
+    return tril(getK(Ints,P))+triu(getK(Ints,P.T),1)
 
 def get_occ_unocc(occs):
     ntot = len(occs)
@@ -95,63 +155,10 @@ def CISDMatrix(Ints,orbs,Ehf,orbe,occs):
     return CIMatrix
     
 def TransformInts(Ints,orbs):
-    """O(N^5) 4-index transformation of the two-electron integrals. Not as
-    efficient as it could be, since it inflates to the full rectangular
-    matrices rather than keeping them compressed. But at least it gets the
-    correct result."""
-
-    from time import time
-
-    t0 = time()
-
-    nbf,nmo = orbs.shape
-    totlen = nmo*(nmo+1)*(nmo*nmo+nmo+2)/8
-
-    temp = zeros((nbf,nbf,nbf,nmo),'d')
-    tempvec = zeros(nbf,'d')
-    temp2 = zeros((nbf,nbf,nmo,nmo),'d')
-
-    mos = range(nmo) # preform so we don't form inside loops
-    bfs = range(nbf)
-
-    # Start with (mu,nu|sigma,eta)
-    # Unpack aoints and transform eta -> l
-    for mu in bfs:
-        for nu in bfs:
-            for sigma in bfs:
-                for l in mos:
-                    for eta in bfs:
-                        tempvec[eta] = Ints[ijkl2intindex(mu,nu,sigma,eta)]
-                    temp[mu,nu,sigma,l] = dot(orbs[:,l],tempvec)
-
-    # Transform sigma -> k
-    for mu in bfs:
-        for nu in bfs:
-            for l in mos:
-                for k in mos:
-                    temp2[mu,nu,k,l] = dot(orbs[:,k],temp[mu,nu,:,l])
-
-    # Transform nu -> j
-    for mu in bfs:
-        for k in mos:
-            for l in mos:
-                for j in mos:
-                    temp[mu,j,k,l] = dot(orbs[:,j],temp2[mu,:,k,l])
-
-    # Transform mu -> i and repack integrals:
-    MOInts = zeros(totlen,'d')
-    for i in mos:
-        for j in xrange(i+1):
-            ij = i*(i+1)/2+j
-            for k in mos:
-                for l in xrange(k+1):
-                    kl = k*(k+1)/2+l
-                    if ij >= kl:
-                        ijkl = ijkl2intindex(i,j,k,l)
-                        MOInts[ijkl] = dot(orbs[:,i],temp[:,j,k,l])
-
-    del temp,temp2,tempvec #force garbage collection now
-    return MOInts
+    """O(N^5) 4-index transformation of the two-electron integrals,
+    returned packed in the order of ijkl2intindex. See
+    Ints.transform_ints."""
+    return transform_ints(Ints,orbs,packed=True)
 
 
 def test():
@@ -10,6 +10,7 @@
  distribution. 
 """
 
+import settings
 from PyQuante.NumWrap import dot,ravel,matrixmultiply,zeros
 from PyQuante.NumWrap import solve
 from PyQuante.LA2 import SymOrth,stable_solve
@@ -17,6 +18,72 @@ from math import sqrt
 
 VERBOSE=0
 
+def commutator(F,D,S):
+    """\
+    err = commutator(F,D,S)
+    Form the SCF error matrix FDS-SDF, which vanishes when the density
+    is self-consistent with the Fock matrix.
+    """
+    FDS = matrixmultiply(F,matrixmultiply(D,S))
+    return FDS - FDS.T
+
+def max_error(F,D,S):
+    "Largest element of the commutator FDS-SDF"
+    return abs(commutator(F,D,S)).max()
+
+def is_converged(dE,err,**kwargs):
+    """\
+    Test SCF convergence on both the energy change dE and the largest
+    element err of the commutator FDS-SDF. If err is None (e.g. because
+    there is no commutator available), only the energy is tested.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    etol          1e-5    Energy convergence criteria
+    dtol          1e-4    Density (commutator) convergence criteria
+    """
+    etol = kwargs.get('etol',settings.ConvergenceCriteria)
+    dtol = kwargs.get('dtol',settings.DensityConvergenceCriteria)
+    if abs(dE) > etol: return False
+    return err is None or err < dtol
+
+class ConvergenceSchedule:
+    """\
+    Loose-then-tight SCF tolerances for a series of related calculations,
+    such as the steps of a geometry optimization or a dynamics run. The
+    first nloose calculations use tolerances multiplied by loose_factor;
+    after that, or once the caller asks for it with tighten(), the full
+    tolerances are used.
+
+    schedule = ConvergenceSchedule(nloose=5)
+    for geo in geometries:
+        etol,dtol = schedule.next()
+        ...
+    """
+    def __init__(self,nloose=0,**kwargs):
+        self.etol = kwargs.get('etol',settings.ConvergenceCriteria)
+        self.dtol = kwargs.get('dtol',settings.DensityConvergenceCriteria)
+        self.loose_factor = kwargs.get('loose_factor',
+                                       settings.LooseConvergenceFactor)
+        self.nloose = nloose
+        self.step = 0
+        return
+
+    def is_loose(self): return self.step < self.nloose
+    def tighten(self): self.nloose = 0
+
+    def tolerances(self):
+        "Return the (etol,dtol) pair for the current step"
+        if self.is_loose():
+            return self.loose_factor*self.etol,self.loose_factor*self.dtol
+        return self.etol,self.dtol
+
+    def next(self):
+        "Return the tolerances for the current step, and advance the step"
+        tols = self.tolerances()
+        self.step += 1
+        return tols
+
 # This is simple density matrix averaging.
 class SimpleAverager:
     def __init__(self,alpha=0.5):
@@ -87,9 +154,7 @@ class DIIS:
 
     def getF(self,F,D):
         n,m = F.shape
-        err = matrixmultiply(F,matrixmultiply(D,self.S)) -\
-              matrixmultiply(self.S,matrixmultiply(D,F))
-        err = ravel(err)
+        err = ravel(commutator(F,D,self.S))
         maxerr = max(abs(err))
         self.maxerr = maxerr
 
@@ -11,8 +11,8 @@
 
 """
 import settings
-from math import sqrt,pi,exp,log,atan
-from NumWrap import zeros,arcsinh,where
+from math import pi
+from NumWrap import zeros,ones,arcsinh,where,sqrt,exp,log,arctan,nonzero
 
 def XC(dens,gamma,**kwargs):
     """\
@@ -31,7 +31,6 @@ def XC(dens,gamma,**kwargs):
     AEM June 2006.
     """
     functional = kwargs.get('functional',settings.DFTFunctional)
-    derivative = kwargs.get('derivative',settings.DerivativeType)
     assert functional in xfuncs.keys() and functional in cfuncs.keys()
     #that npts is the same for all 5 vectors should be checked elsewhere    
     npts = len(dens[0]) 
@@ -41,36 +40,17 @@ def XC(dens,gamma,**kwargs):
     dfxcdgaa = zeros(npts,'d')
     dfxcdgab = zeros(npts,'d')
     dfxcdgbb = zeros(npts,'d')
-    if xfuncs[functional]:
-        if derivative == 'analyt' and analyt[functional]:
-            fx,dfxdna,dfxdnb,dfxdgaa,dfxdgab,dfxdgbb = \
-	                      xfuncs[functional](dens,gamma)
-        else:
-	    fx,dfxdna,dfxdnb,dfxdgaa,dfxdgab,dfxdgbb = \
-	                      xfuncs[functional](dens,gamma)	
-	    dfxdna,dfxdnb,dfxdgaa,dfxdgab,dfxdgbb = \
-	                      numder('x',functional,dens,gamma)
-        fxc = fxc + fx
-	dfxcdna = dfxcdna + dfxdna
-        dfxcdnb = dfxcdnb + dfxdnb
-        dfxcdgaa = dfxcdgaa + dfxdgaa
-        dfxcdgab = dfxcdgab + dfxdgab
-        dfxcdgbb = dfxcdgbb + dfxdgbb
-    if cfuncs[functional]:
-        if derivative == 'analyt' and analyt[functional]:
-            fc,dfcdna,dfcdnb,dfcdgaa,dfcdgab,dfcdgbb = \
-	                      cfuncs[functional](dens,gamma)
-        else:
-            fc,dfcdna,dfcdnb,dfcdgaa,dfcdgab,dfcdgbb = \
-	                      cfuncs[functional](dens,gamma)
-	    dfcdna,dfcdnb,dfcdgaa,dfcdgab,dfcdgbb = \
-	                      numder('c',functional,dens,gamma)
-        fxc = fxc + fc
-	dfxcdna = dfxcdna + dfcdna
-        dfxcdnb = dfxcdnb + dfcdnb
-        dfxcdgaa = dfxcdgaa + dfcdgaa
-        dfxcdgab = dfxcdgab + dfcdgab
-        dfxcdgbb = dfxcdgbb + dfcdgbb
+    # Every functional returns its analytic first derivatives. numder
+    # is only kept to check them.
+    for funcs in [xfuncs,cfuncs]:
+        if not funcs[functional]: continue
+        f,dfdna,dfdnb,dfdgaa,dfdgab,dfdgbb = funcs[functional](dens,gamma)
+        fxc = fxc + f
+        dfxcdna = dfxcdna + dfdna
+        dfxcdnb = dfxcdnb + dfdnb
+        dfxcdgaa = dfxcdgaa + dfdgaa
+        dfxcdgab = dfxcdgab + dfdgab
+        dfxcdgbb = dfxcdgbb + dfdgbb
     return fxc,dfxcdna,dfxcdnb,dfxcdgaa,dfxcdgab,dfxcdgbb
 
 def S(dens,gamma=None):
@@ -90,20 +70,12 @@ def S(dens,gamma=None):
     """
     npts = len(dens[0])
     assert len(dens[1]) == npts
-    fx = zeros(npts,'d')
-    dfxdna = zeros(npts,'d')
-    dfxdnb = zeros(npts,'d')
+    fxa,dfxdna = xs_array(dens[0])
+    fxb,dfxdnb = xs_array(dens[1])
+    fx = fxa + fxb
     dfxdgaa = zeros(npts,'d')
     dfxdgab = zeros(npts,'d')
     dfxdgbb = zeros(npts,'d')
-    for i in xrange(npts):
-        na = float(dens[0][i]) # Density of the alpha spin
-	nb = float(dens[1][i]) # Density of the beta spin
-        fxa,vxa = xs(na)
-	fxb,vxb = xs(nb)
-        fx[i] = fxa + fxb
-        dfxdna[i] = vxa
-	dfxdnb[i] = vxb
     return fx,dfxdna,dfxdnb,dfxdgaa,dfxdgab,dfxdgbb
 
 def VWN(dens,gamma=None):
@@ -121,19 +93,10 @@ def VWN(dens,gamma=None):
     """
     npts = len(dens[0])
     assert len(dens[1]) == npts
-    fc = zeros(npts,'d')
-    dfcdna = zeros(npts,'d')
-    dfcdnb = zeros(npts,'d')
+    fc,dfcdna,dfcdnb = cvwn_array(dens[0],dens[1])
     dfcdgaa = zeros(npts,'d')
     dfcdgab = zeros(npts,'d')
     dfcdgbb = zeros(npts,'d')
-    for i in xrange(npts):
-        na = float(dens[0][i]) # Density of the alpha spin
-	nb = float(dens[1][i]) # Density of the beta spin
-        fcab,vca,vcb = cvwn(na,nb)
-        fc[i] = fcab
-	dfcdna[i] = vca
-        dfcdnb[i] = vcb
     return fc,dfcdna,dfcdnb,dfcdgaa,dfcdgab,dfcdgbb
 
 def PW(dens,gamma=None):
@@ -150,19 +113,10 @@ def PW(dens,gamma=None):
     """
     npts = len(dens[0])
     assert len(dens[1]) == npts
-    fc = zeros(npts,'d')
-    dfcdna = zeros(npts,'d')
-    dfcdnb = zeros(npts,'d')
+    fc,dfcdna,dfcdnb = pw_array(dens[0],dens[1])
     dfcdgaa = zeros(npts,'d')
     dfcdgab = zeros(npts,'d')
     dfcdgbb = zeros(npts,'d')
-    for i in xrange(npts):
-        na = float(dens[0][i]) # Density of the alpha spin
-	nb = float(dens[1][i]) # Density of the beta spin
-        fcab,vca,vcb = pw(na,nb)
-        fc[i] = fcab
-	dfcdna[i] = vca
-        dfcdnb[i] = vcb
     return fc,dfcdna,dfcdnb,dfcdgaa,dfcdgab,dfcdgbb
 
 def B(dens,gamma):
@@ -178,24 +132,10 @@ def B(dens,gamma):
     assert len(gamma[0]) == npts
     assert len(gamma[1]) == npts
     assert len(gamma[2]) == npts
-    fx = zeros(npts,'d')
-    dfxdna = zeros(npts,'d')
-    dfxdnb = zeros(npts,'d')
-    dfxdgaa = zeros(npts,'d')
+    fxa,dfxdna,dfxdgaa = xb_array(dens[0],gamma[0])
+    fxb,dfxdnb,dfxdgbb = xb_array(dens[1],gamma[2])
+    fx = fxa + fxb
     dfxdgab = zeros(npts,'d')
-    dfxdgbb = zeros(npts,'d')
-    for i in xrange(npts):
-        na = float(dens[0][i])  # Density of the alpha spin
-	nb = float(dens[1][i])  # Density of the beta spin
-        gamaa = gamma[0][i]
-	gambb = gamma[2][i]
-        fxa,fxna,fxgaa = xb(na,gamaa,return_flag = 1)
-	fxb,fxnb,fxgbb = xb(nb,gambb,return_flag = 1)
-        fx[i] = fxa + fxb
-        dfxdna[i] = fxna
-	dfxdnb[i] = fxnb
-        dfxdgaa[i] = fxgaa
-        dfxdgbb[i] = fxgbb
     return fx,dfxdna,dfxdnb,dfxdgaa,dfxdgab,dfxdgbb
 
 def LYP(dens,gamma):
@@ -209,54 +149,23 @@ def LYP(dens,gamma):
     assert len(gamma[0]) == npts
     assert len(gamma[1]) == npts
     assert len(gamma[2]) == npts
-    fc = zeros(npts,'d')
-    dfcdna = zeros(npts,'d')
-    dfcdnb = zeros(npts,'d')
-    dfcdgaa = zeros(npts,'d')
-    dfcdgab = zeros(npts,'d')
-    dfcdgbb = zeros(npts,'d')
-    for i in xrange(npts):
-        na = float(dens[0][i]) # Density of the alpha spin
-	nb = float(dens[1][i]) # Density of the beta spin
-        gamaa = gamma[0][i]
-	gamab = gamma[1][i]
-        gambb = gamma[2][i]
-        fcab,fcna,fcnb,fcgaa,fcgab,fcgbb = clyp(na,nb,gamaa,gamab,gambb,
-                                                return_flag=1)
-        fc[i] = fcab
-	dfcdna[i] = fcna
-        dfcdnb[i] = fcnb
-        dfcdgaa[i] = fcgaa
-	dfcdgab[i] = fcgab
-        dfcdgbb[i] = fcgbb
-    return fc,dfcdna,dfcdnb,dfcdgaa,dfcdgab,dfcdgbb
+    return clyp_array(dens[0],dens[1],gamma[0],gamma[1],gamma[2])
 
 def XPBE(dens,gamma):
     "PBE Exchange Functional"
     npts = len(dens)
     assert len(gamma) == npts
-    ex = zeros(npts,'d')
-    vx = zeros(npts,'d')
-    for i in xrange(npts):
-        rho = 0.5*float(dens[i])  # Density of the alpha spin
-        gam = 0.25*gamma[i]
-        exa,vxa = xpbe(rho,gam)
-        ex[i] = 2*exa
-        vx[i] = vxa
-    return ex,vx
+    exa,vx,vxgam = xpbe_array(0.5*dens,0.25*gamma)
+    return 2*exa,vx
 
 def CPBE(dens,gamma):
     "PBE Correlation Functional"
     npts = len(dens)
-    ec = zeros(npts,'d')
-    vc = zeros(npts,'d')
-    for i in xrange(npts):
-        rho = 0.5*float(dens[i]) # Density of the alpha spin
-        gam = 0.25*gamma[i]
-        ecab,vca,vcb = cpbe(rho,rho,gam,gam,gam)
-        ec[i] = ecab
-        vc[i] = vca
-    return ec,vc
+    assert len(gamma) == npts
+    rho = 0.5*dens
+    gam = 0.25*gamma
+    ec,vca,vcb = cpbe_array(rho,rho,gam,gam,gam)
+    return ec,vca
 
 def EXXC1(dens,gamma):
     "AEM's EXX compatible correlation #1 (note: no spin). AEM June 2006."
@@ -265,23 +174,10 @@ def EXXC1(dens,gamma):
     assert len(gamma[0]) == npts
     assert len(gamma[1]) == npts
     assert len(gamma[2]) == npts
-    fc = zeros(npts,'d')
-    dfcdna = zeros(npts,'d')
-    dfcdnb = zeros(npts,'d')
-    dfcdgaa = zeros(npts,'d')
-    dfcdgab = zeros(npts,'d')
-    dfcdgbb = zeros(npts,'d')
-    for i in xrange(npts):
-        rho = float(dens[0][i]+dens[1][i]) # Total density 
-        gam = gamma[0][i]+gamma[2][i] + 2.0*gamma[1][i] # Total gamma
-        fcpnt,dfdrho,dfdgamma = c1(rho,gam)
-        fc[i] = fcpnt
-        dfcdna[i] = dfdrho 
-	dfcdnb[i] = dfdrho
-	dfcdgaa[i] = dfdgamma
-	dfcdgab[i] = 2.0*dfdgamma
-        dfcdgbb[i] = dfdgamma
-    return fc,dfcdna,dfcdnb,dfcdgaa,dfcdgab,dfcdgbb
+    rho = dens[0]+dens[1] # Total density
+    gam = gamma[0]+gamma[2]+2.0*gamma[1] # Total gamma
+    fc,dfdrho,dfdgamma = c1_array(rho,gam)
+    return fc,dfdrho,dfdrho.copy(),dfdgamma,2.0*dfdgamma,dfdgamma.copy()
 
 def AM05(dens,gamma):
     """Armiento and Mattsson functional from 2005. (note: no spin)
@@ -293,23 +189,10 @@ def AM05(dens,gamma):
     assert len(gamma[0]) == npts
     assert len(gamma[1]) == npts
     assert len(gamma[2]) == npts
-    fxc = zeros(npts,'d')
-    dfxcdna = zeros(npts,'d')
-    dfxcdnb = zeros(npts,'d')
-    dfxcdgaa = zeros(npts,'d')
-    dfxcdgab = zeros(npts,'d')
-    dfxcdgbb = zeros(npts,'d')
-    for i in xrange(npts):
-        rho = float(dens[0][i]+dens[1][i]) # Total density 
-        gam = gamma[0][i]+gamma[2][i] + 2.0*gamma[1][i] # Total gamma
-        fpnt,dfdrho,dfdgamma = am05xc(rho,gam)
-        fxc[i] = fpnt
-        dfxcdna[i] = dfdrho 
-	dfxcdnb[i] = dfdrho
-	dfxcdgaa[i] = dfdgamma
-	dfxcdgab[i] = 2.0*dfdgamma
-        dfxcdgbb[i] = dfdgamma
-    return fxc,dfxcdna,dfxcdnb,dfxcdgaa,dfxcdgab,dfxcdgbb    
+    rho = dens[0]+dens[1] # Total density
+    gam = gamma[0]+gamma[2]+2.0*gamma[1] # Total gamma
+    fxc,dfdrho,dfdgamma = am05xc_array(rho,gam)
+    return fxc,dfdrho,dfdrho.copy(),dfdgamma,2.0*dfdgamma,dfdgamma.copy()
 
 # Functional terms themselves.
 # Functionals are defined in their spin-polarized versions. However,
@@ -456,68 +339,74 @@ def cpbe(rhoa,rhob,gama,gamb,gamab,**kwargs):
     return_flag = kwargs.get('return_flag')
     rho = rhoa+rhob
     ec = vca = vcb = vcgama = vcgamb = vcgamab = 0
+    if rho > tol:
+        ec,vca,vcb = cpbe_terms(rhoa,rhob,gama,gamb,gamab)
+    # Havent done the dE_dgamma derives yet
+    return ec,vca,vcb
+
+def cpbe_terms(rhoa,rhob,gama,gamb,gamab):
+    "The part of cpbe above the density cutoff, for floats or arrays"
+    rho = rhoa+rhob
     gam = 0.031091
     ohm = 0.046644
     bet = 0.066725
-    if rho > tol:
-        Rs = pow(3./(4.*pi*rho),1./3.)
-        Zeta = (rhoa-rhob)/rho
-        Kf = pow(3*pi*pi*rho,1./3.)
-        Ks = sqrt(4*Kf/pi)
-        Phi = 0.5*(pow(1+Zeta,2./3.) + pow(1-Zeta,2./3.))
-        Phi3 = Phi*Phi*Phi
-        gradrho = sqrt(gama+gamb+2.*gamab)
-        T = gradrho/(2*Phi*Ks*rho)
-        T2 = T*T
-        T4 = T2*T2
-
-        eps,vc0a,vc0b = cpbe_lsd(rhoa,rhob)
-
-        expo = (exp(-eps/(gam*Phi3))-1.)
-        A = bet/gam/expo
-        N = T2+A*T4
-        D = 1.+A*T2+A*A*T4
-        H = gam*Phi3*log(1.+(bet/gam)*N/D)
-        ec = rho*(eps+H)
-
-        # Derivative stuff
-        dZ_drhoa = (1.-Zeta)/rho
-        dZ_drhob = -(1.+Zeta)/rho
-
-        dPhi_dZ = pow(1.+Zeta,-1./3.)/3.-pow(1.-Zeta,-1./3.)/3.
-        dPhi_drhoa = dPhi_dZ*dZ_drhoa
-        dPhi_drhob = dPhi_dZ*dZ_drhob
-        
-        dKs_drho = Ks/(6*rho)
-        
-        dT_dPhi = -T/Phi
-        dT_dKs = -T/Ks
-        dT_drhoa = -T/rho + dT_dPhi*dPhi_drhoa + dT_dKs*dKs_drho
-        dT_drhob = -T/rho + dT_dPhi*dPhi_drhob + dT_dKs*dKs_drho
-
-        dA_dPhi = -A/expo*exp(-eps/(gam*Phi3))*(3*eps/(gam*Phi3*Phi))
-        dA_deps = -A/expo*exp(-eps/(gam*Phi3))*(-1/(gam*Phi3))
-        deps_drhoa = (vc0a-eps)/rho
-        deps_drhob = (vc0b-eps)/rho
-        dA_drhoa = dA_dPhi*dPhi_drhoa + dA_deps*deps_drhoa
-        dA_drhob = dA_dPhi*dPhi_drhob + dA_deps*deps_drhoa
-
-        dN_dT = 2*T+4*A*T2*T
-        dD_dT = 2*A*T + 4*A*A*T*T2
-        dN_dA = T4
-        dD_dA = T2+2*A*T4
-
-        dH_dPhi = 3*H/Phi
-        dH_dT = bet*Phi3/(1.+bet/gam*N/D)*(D*dN_dT-N*dD_dT)/D/D
-            
-        dH_dA = bet*Phi3/(1.+bet/gam*N/D)*(D*dN_dA-N*dD_dA)/D/D
-        
-        dH_drhoa = dH_dPhi*dPhi_drhoa + dH_dT*dT_drhoa + dH_dA*dA_drhoa
-        dH_drhob = dH_dPhi*dPhi_drhob + dH_dT*dT_drhob + dH_dA*dA_drhob
+    Rs = pow(3./(4.*pi*rho),1./3.)
+    Zeta = (rhoa-rhob)/rho
+    Kf = pow(3*pi*pi*rho,1./3.)
+    Ks = sqrt(4*Kf/pi)
+    Phi = 0.5*(pow(1+Zeta,2./3.) + pow(1-Zeta,2./3.))
+    Phi3 = Phi*Phi*Phi
+    gradrho = sqrt(gama+gamb+2.*gamab)
+    T = gradrho/(2*Phi*Ks*rho)
+    T2 = T*T
+    T4 = T2*T2
+
+    eps,vc0a,vc0b = cpbe_lsd(rhoa,rhob)
+
+    expo = (exp(-eps/(gam*Phi3))-1.)
+    A = bet/gam/expo
+    N = T2+A*T4
+    D = 1.+A*T2+A*A*T4
+    H = gam*Phi3*log(1.+(bet/gam)*N/D)
+    ec = rho*(eps+H)
+
+    # Derivative stuff
+    dZ_drhoa = (1.-Zeta)/rho
+    dZ_drhob = -(1.+Zeta)/rho
+
+    dPhi_dZ = pow(1.+Zeta,-1./3.)/3.-pow(1.-Zeta,-1./3.)/3.
+    dPhi_drhoa = dPhi_dZ*dZ_drhoa
+    dPhi_drhob = dPhi_dZ*dZ_drhob
+    
+    dKs_drho = Ks/(6*rho)
+    
+    dT_dPhi = -T/Phi
+    dT_dKs = -T/Ks
+    dT_drhoa = -T/rho + dT_dPhi*dPhi_drhoa + dT_dKs*dKs_drho
+    dT_drhob = -T/rho + dT_dPhi*dPhi_drhob + dT_dKs*dKs_drho
+
+    dA_dPhi = -A/expo*exp(-eps/(gam*Phi3))*(3*eps/(gam*Phi3*Phi))
+    dA_deps = -A/expo*exp(-eps/(gam*Phi3))*(-1/(gam*Phi3))
+    deps_drhoa = (vc0a-eps)/rho
+    deps_drhob = (vc0b-eps)/rho
+    dA_drhoa = dA_dPhi*dPhi_drhoa + dA_deps*deps_drhoa
+    dA_drhob = dA_dPhi*dPhi_drhob + dA_deps*deps_drhoa
+
+    dN_dT = 2*T+4*A*T2*T
+    dD_dT = 2*A*T + 4*A*A*T*T2
+    dN_dA = T4
+    dD_dA = T2+2*A*T4
+
+    dH_dPhi = 3*H/Phi
+    dH_dT = bet*Phi3/(1.+bet/gam*N/D)*(D*dN_dT-N*dD_dT)/D/D
         
-        vca = vc0a + H + rho*dH_drhoa
-        vcb = vc0b + H + rho*dH_drhob
-    # Havent done the dE_dgamma derives yet
+    dH_dA = bet*Phi3/(1.+bet/gam*N/D)*(D*dN_dA-N*dD_dA)/D/D
+    
+    dH_drhoa = dH_dPhi*dPhi_drhoa + dH_dT*dT_drhoa + dH_dA*dA_drhoa
+    dH_drhob = dH_dPhi*dPhi_drhob + dH_dT*dT_drhob + dH_dA*dA_drhob
+    
+    vca = vc0a + H + rho*dH_drhoa
+    vcb = vc0b + H + rho*dH_drhob
     return ec,vca,vcb
 
 def c1(rho,gam,**kwargs):
@@ -607,7 +496,7 @@ def vwn_eps(x,a,x0,b,c):
     q = sqrt(4*c-b*b)
     eps = a*(log(x*x/vwn_xx(x,b,c))
              - b*(x0/vwn_xx(x0,b,c))*log(pow(x-x0,2)/vwn_xx(x,b,c))
-             + (2*b/q)*(1-(x0*(2*x0+b)/vwn_xx(x0,b,c))) * atan(q/(2*x+b)))
+             + (2*b/q)*(1-(x0*(2*x0+b)/vwn_xx(x0,b,c))) * arctan(q/(2*x+b)))
     return eps
 
 def vwn_depsp(x): return vwn_deps(x,0.0310907,-0.10498,3.72744,12.9352)
@@ -717,10 +606,311 @@ def am05_lambertw(z):
           assert i != 10
     return result
     
+# Array versions of the functional terms. These take whole vectors of
+# densities (and gammas), and give the same results as the per-point
+# functions above. The points below the density cutoff are masked out
+# and left at zero.
+def xs_array(rho,**kwargs):
+    "Xalpha X functional over an array of densities"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    Xalpha = kwargs.get('Xalpha',settings.DFTXalphaFactor)
+    fac=-2.25*Xalpha*pow(3./4./pi,1./3.)
+    rho = where(rho < tol,0,rho)
+    rho3 = rho**(1./3.)
+    ex = fac*rho*rho3
+    vx = (4./3.)*fac*rho3
+    return ex,vx
+
+def xb_array(rho,gam,**kwargs):
+    "Becke 88 X functional over arrays of densities and gammas"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    npts = len(rho)
+    fx = zeros(npts,'d')
+    dfxdrho = zeros(npts,'d')
+    dfxdgam = zeros(npts,'d')
+    mask = rho > tol
+    rho = rho[mask]
+    gam = gam[mask]
+    rho13 = rho**(1./3.)
+    x = sqrt(gam)/rho13/rho
+    g = b88_g(x)
+    dg = b88_dg(x)
+    dfxdrho[mask] = (4./3.)*rho13*(g-x*dg)
+    gmask = gam > tol
+    dgam = zeros(len(rho),'d')
+    dgam[gmask] = 0.5*dg[gmask]/sqrt(gam[gmask])
+    dfxdgam[mask] = dgam
+    fx[mask] = rho*rho13*g
+    return fx,dfxdrho,dfxdgam
+
+def xpbe_array(rho,gam,**kwargs):
+    "PBE X functional over arrays of densities and gammas"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    kap = 0.804
+    mu = 0.449276922095889E-2
+    npts = len(rho)
+    ex = zeros(npts,'d')
+    vxrho = zeros(npts,'d')
+    vxgam = zeros(npts,'d')
+    mask = rho > tol
+    rho = rho[mask]
+    gam = gam[mask]
+    ex0,vx0 = xs_array(rho)
+    rho13 = rho**(1.E0/3.E0)
+    rho43 = rho13*rho
+    den = 1.E0+mu*gam/rho43/rho43
+    F = 1+kap-kap/den
+    ex[mask] = ex0*F
+    dFdr = -(8./3.)*kap*mu*gam/den/den*rho**(-11./3.)
+    vxrho[mask] = vx0*F+ex0*dFdr
+    dFdg = -kap*mu/rho43/rho43/den/den
+    vxgam[mask] = ex0*dFdg
+    return ex,vxrho,vxgam
+
+def cvwn_array(rhoa,rhob,**kwargs):
+    "VWN C functional over arrays of spin densities"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    rho = rhoa+rhob
+    npts = len(rho)
+    ec = zeros(npts,'d')
+    vcrhoa = zeros(npts,'d')
+    vcrhob = zeros(npts,'d')
+    mask = rho >= tol
+    rho = rho[mask]
+    zeta = (rhoa[mask]-rhob[mask])/rho
+    x = (3./4./pi/rho)**(1./6.)
+    epsp = vwn_epsp(x)
+    depsp = vwn_depsp(x)
+    g = vwn_g(zeta)
+    epsf = vwn_epsf(x)
+    depsf = vwn_depsf(x)
+    dg = vwn_dg(zeta)
+    eps = epsp + g*(epsf-epsp)
+    deps_dx = depsp + g*(depsf-depsp)
+    deps_dg = (epsf-epsp)*dg
+    va = eps - (x/6.)*deps_dx + deps_dg*(1-zeta)
+    vb = eps - (x/6.)*deps_dx - deps_dg*(1+zeta)
+    # Unpolarized points, as in the shortcut in cvwn
+    unpol = g < tol
+    vp = epsp-(x/6.)*depsp
+    ec[mask] = where(unpol,epsp,eps)*rho
+    vcrhoa[mask] = where(unpol,vp,va)
+    vcrhob[mask] = where(unpol,vp,vb)
+    return ec,vcrhoa,vcrhob
+
+def clyp_array(rhoa,rhob,gamaa,gamab,gambb,**kwargs):
+    "LYP C functional over arrays of spin densities and gammas"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    a = 0.04918  # Parameters from the LYP papers
+    b = 0.132
+    c = 0.2533
+    d = 0.349
+    assert (rhoa >= 0.0).all()
+    assert (rhob >= 0.0).all()
+    rho = rhoa+rhob
+    npts = len(rho)
+    fc = zeros(npts,'d')
+    fcrhoa = zeros(npts,'d')
+    fcrhob = zeros(npts,'d')
+    fcgamaa = zeros(npts,'d')
+    fcgamab = zeros(npts,'d')
+    fcgambb = zeros(npts,'d')
+    mask = rho > tol
+    rho = rho[mask]
+    rhoa = rhoa[mask]
+    rhob = rhob[mask]
+    gamaa = gamaa[mask]
+    gamab = gamab[mask]
+    gambb = gambb[mask]
+
+    rhom3 = rho**(-1./3.)
+    w = exp(-c*rhom3)/(1+d*rhom3)*rho**(-11./3.)
+    dl = c*rhom3+d*rhom3/(1+d*rhom3)
+
+    fgaa = -a*b*w*((1./9.)*rhoa*rhob*(1-3*dl-(dl-11)*rhoa/rho)-rhob*rhob)
+    fgab = -a*b*w*((1./9.)*rhoa*rhob*(47-7*dl)-(4./3.)*rho*rho)
+    fgbb = -a*b*w*((1./9.)*rhoa*rhob*(1-3*dl-(dl-11)*rhob/rho)-rhoa*rhoa)
+
+    rhoa83 = rhoa**(8./3.)
+    rhob83 = rhob**(8./3.)
+    cf = pow(2,11./3.)*0.3*pow(3*pi*pi,2./3.)*a*b
+    fc[mask] = -4*a/(1+d*rhom3)*rhoa*rhob/rho \
+               -cf*w*rhoa*rhob*(rhoa83+rhob83) \
+               + fgaa*gamaa + fgab*gamab + fgbb*gambb
+
+    dw = -(1./3.)*rho**(-4./3.)*w*(11*rho**(1./3.)-c-d/(1+d*rhom3))
+    ddl = (1./3.)*(d*d*rho**(-5./3.)/(1+d*rhom3)**2-dl/rho)
+
+    d2f_dradgaa = dw/w*fgaa - a*b*w*(
+        (1./9.)*rhob*(1-3*dl-(dl-11)*rhoa/rho)
+        -(1./9.)*rhoa*rhob*((3+rhoa/rho)*ddl+(dl-11)*rhob/rho/rho))
+    d2f_dradgbb = dw/w*fgbb - a*b*w*(
+        (1./9.)*rhob*(1-3*dl-(dl-11)*rhob/rho)
+        -(1./9.)*rhoa*rhob*((3+rhob/rho)*ddl-(dl-11)*rhob/rho/rho)
+        -2*rhoa)
+    d2f_dradgab = dw/w*fgab-a*b*w*(
+        (1./9)*rhob*(47-7*dl)-(7./9.)*rhoa*rhob*ddl-(8./3.)*rho)
+
+    d2f_drbdgaa = dw/w*fgaa - a*b*w*(
+        (1./9.)*rhoa*(1-3*dl-(dl-11)*rhoa/rho)
+        -(1./9.)*rhoa*rhob*((3+rhoa/rho)*ddl-(dl-11)*rhoa/rho/rho)
+        -2*rhob)
+    d2f_drbdgbb = dw/w*fgbb - a*b*w*(
+        (1./9.)*rhoa*(1-3*dl-(dl-11)*rhob/rho)
+        -(1./9.)*rhoa*rhob*((3+rhob/rho)*ddl+(dl-11)*rhoa/rho/rho))
+    d2f_drbdgab = dw/w*fgab-a*b*w*(
+        (1./9)*rhoa*(47-7*dl)-(7./9.)*rhoa*rhob*ddl-(8./3.)*rho)
+
+    # The rhoa*rhob*(1/rhoa) terms of clyp are written as rhob, so that
+    # fully spin-polarized points don't divide by zero
+    dlda = (1./3.)*d*rho**(-4./3.)/(1+d*rhom3)-1/rho
+    fcrhoa[mask] = -4*a/(1+d*rhom3)/rho*(rhoa*rhob*dlda+rhob)\
+        -cf*(dw*rhoa*rhob*(rhoa83+rhob83)
+             +w*rhob*((11./3.)*rhoa83+rhob83)) \
+        +d2f_dradgaa*gamaa + d2f_dradgbb*gambb + d2f_dradgab*gamab
+    fcrhob[mask] = -4*a/(1+d*rhom3)/rho*(rhoa*rhob*dlda+rhoa)\
+        -cf*(dw*rhoa*rhob*(rhob83+rhoa83)
+             +w*rhoa*((11./3.)*rhob83+rhoa83)) \
+        +d2f_drbdgaa*gamaa + d2f_drbdgbb*gambb + d2f_drbdgab*gamab
+    fcgamaa[mask] = fgaa
+    fcgamab[mask] = fgab
+    fcgambb[mask] = fgbb
+    return fc,fcrhoa,fcrhob,fcgamaa,fcgamab,fcgambb
+
+def cpbe_array(rhoa,rhob,gama,gamb,gamab,**kwargs):
+    "PBE C functional over arrays; as unfinished as cpbe itself"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    rho = rhoa+rhob
+    npts = len(rho)
+    ec = zeros(npts,'d')
+    vca = zeros(npts,'d')
+    vcb = zeros(npts,'d')
+    mask = rho > tol
+    ec[mask],vca[mask],vcb[mask] = cpbe_terms(rhoa[mask],rhob[mask],
+                                              gama[mask],gamb[mask],
+                                              gamab[mask])
+    return ec,vca,vcb
+
+def pw_array(rhoa,rhob,**kwargs):
+    "PW92 C functional over arrays of spin densities"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    rho = rhoa+rhob
+    npts = len(rho)
+    ec = zeros(npts,'d')
+    vca = zeros(npts,'d')
+    vcb = zeros(npts,'d')
+    mask = rho >= tol
+    # cpbe_lsd is written with numpy functions, so works on arrays
+    eps,vca[mask],vcb[mask] = cpbe_lsd(rhoa[mask],rhob[mask])
+    ec[mask] = rho[mask]*eps
+    return ec,vca,vcb
+
+def c1_array(rho,gam,**kwargs):
+    "EXX compatible C functional #1 over arrays of densities and gammas"
+    tol = kwargs.get('tol',settings.DFTDensityCutoff)
+    g1 = 0.3060
+    g2 = 0.04108
+    t = 0.3123
+    npts = len(rho)
+    fc = zeros(npts,'d')
+    dfcdrho = zeros(npts,'d')
+    dfcdgamma = zeros(npts,'d')
+    mask = rho > tol
+    rho = rho[mask]
+    gam = gam[mask]
+    rs = (3./(4.*pi*rho))**(1./3.)
+    snorm2 = (4.*pow(3.*pi**2,2./3.)*rho**(8./3.))
+    s2 = gam / snorm2
+    X = 2.*exp(-s2/t)/(1.+exp(-s2/t))
+    eps,vc0a,vc0b = cpbe_lsd(0.5*rho,0.5*rho)
+    fc[mask] = rho*eps*(X + (1. - X)*(g1 + g2*rs))
+    dXds2 = -X/t/(1.+exp(-s2/t))
+    dfcdrho[mask] = vc0a*(X + (1. - X)*(g1 + g2*rs)) - \
+                    eps/3.*(g2*(1. - X)*rs + 8*(1.-g1-g2*rs)*s2*dXds2)
+    dfcdgamma[mask] = eps*(1.-g1-g2*rs)*rho/snorm2*dXds2
+    return fc,dfcdrho,dfcdgamma
+
+def am05xc_array(rho,gam,**kwargs):
+    "AM05 XC functional over arrays of densities and gammas"
+    tol = kwargs.get('tol',settings.AM05DensityCutoff)
+    g = 0.8098
+    a = 2.804
+    c = 0.7168
+    npts = len(rho)
+    fxc = zeros(npts,'d')
+    dfxcdrho = zeros(npts,'d')
+    dfxcdgamma = zeros(npts,'d')
+    mask = rho > tol
+    rho = rho[mask]
+    gam = gam[mask]
+    snorm2 = (4.*pow(3.*pi**2,2./3.)*rho**(8./3.))
+    s2 = abs(gam) / snorm2
+    s = sqrt(s2)
+    # LDAPW exchange and correlation
+    fx0,vxlda = xs_array(0.5*rho) # xs(na) = fx(na) = na*ex(2*na)
+    fxlda = 2.0*fx0
+    fclda,vclda,vc0b = pw_array(0.5*rho,0.5*rho)
+    # Interpolation index
+    X = 1.0/(1.0 + a*s2)
+    w = am05_lambertw_array(s**(3./2.)/sqrt(24.0))
+    # low s limit for z/s; see am05xc
+    zosn = ones(len(rho),'d')
+    big = s >= 1.e-14
+    zosn[big] = 24.**(1./3.)*w[big]**(2./3.)/s[big]
+    zfac = s2*(zosn*27./32./pi**2)**2
+    denom = 1.0 + c*s2*zosn*(1.0 + zfac)**(1./4.)
+    F = (c*s2 + 1.0)/denom
+    # Refinement functions
+    Hx = X + (1.0 - X)*F
+    Hc = X + g*(1.0 - X)
+    fxc[mask] = fxlda*Hx + fclda*Hc
+    # Derivatives
+    Xsos = -2.0*a*X**2
+    szsoz = 1.0/(1.0 + w)
+    Fsos = c/denom**2*(2.0 - zosn*
+                       ((1.0 - c*s2)*(1.0 + zfac)**(1./4.) +
+                        (1.0 + c*s2)*(1.0 + 3./2.*zfac)/
+                        (1.0 + zfac)**(3./4.)*szsoz))
+    Hxsos = (1.0 - X)*Fsos - (F - 1.0)*Xsos
+    Hcsos = Xsos*(1.0 - g)
+    dfxcdrho[mask] = vxlda*Hx + vclda*Hc - 4./3.*s2/rho*(Hcsos*fclda +
+                                                         Hxsos*fxlda)
+    dfxcdgamma[mask] = 1./2./snorm2*(Hcsos*fclda + Hxsos*fxlda)
+    return fxc,dfxcdrho,dfxcdgamma
+
+def am05_lambertw_array(z):
+    "am05_lambertw over an array, iterating only the unconverged points"
+    assert (z >= 0.0).all()
+    result = z.copy()
+    big = nonzero(z >= 1.e-20)[0]
+    z = z[big]
+    e = exp(1.0)
+    # Series expansion about -1/e to first order, or the asymptotic
+    # expansion at 0 and Inf
+    w = sqrt(2.0*e*z + 2.0) - 1.0
+    asym = abs(z + 1.0/e) > 1.45
+    lz = log(z[asym])
+    w[asym] = lz - log(lz)
+    active = ones(len(z),bool)
+    for i in xrange(1,11):
+        idx = nonzero(active)[0]
+        if not len(idx): break
+        wi = w[idx]
+        p = exp(wi)
+        t = wi*p - z[idx]
+        t = t/(p*(wi + 1.0) - 0.5*(wi + 2.0)*t/(wi + 1.0))
+        w[idx] = wi - t
+        active[idx[abs(t) < (2.48*1.e-14)*(1.0 + abs(w[idx]))]] = False
+    assert not active.any()
+    result[big] = w
+    return result
+
 def numder(xc,functional,dens,gamma):
         """\
         Since numerical derivatives will not be used for production
 	I do not care if this routine is fast or not. AEM June 2006.
+        XC always uses the analytic derivatives now; this is only
+        used to test them.
         """
 	maxdelta = 1.e-5
 	mindelta = 1.e-14
@@ -797,19 +987,15 @@ def getf(xc,functional,dens,gamma):
 	
 # Table mapping functional names into functions etc.
 # LDA -> SVWN, GGA -> PBE
-# xfuncs, cfuncs, and analyt added by AEM in June 2006.
+# xfuncs and cfuncs added by AEM in June 2006.
 # PW, AM05 and EXXC1 added by AEM in June 2006.
 
 xfuncs = dict(LDA=S,S0=S,SVWN=S,SVWN5=S,BLYP=B,LYP=None,VWN=None,
               PW=None,LDAPW=S,AM05=AM05,
-              B0=B)
+              B0=B,EXXC1=None)
 
 cfuncs = dict(LDA=VWN,S0=None,SVWN=VWN,SVWN5=VWN,BLYP=LYP,LYP=LYP,VWN=VWN,
-               PW=PW,LDAPW=PW,AM05=None,B0=None)
-
-analyt = dict(LDA=True,S0=True,SVWN=True,SVWN5=True,BLYP=True,PBE=False,
-              LYP=True,CPBE=False,EXXC1=False,VWN=True,PW=True,LDAPW=True,
-              AM05=True,B0=True)
+               PW=PW,LDAPW=PW,AM05=None,B0=None,EXXC1=EXXC1)
 
 need_gradients = dict(LDA=False,S0=False,SVWN=False,SVWN5=False,
                       BLYP=True,PBE=True,
@@ -0,0 +1,150 @@
+"""\
+ DensityFitting.py Fit products of basis functions to an auxiliary
+  basis set using the Coulomb metric, so that the Coulomb matrix
+  (and later anything else built from (ij|kl)) only needs the
+  three-centre integrals (ij|P) and the two-centre metric (P|Q):
+
+    (ij|kl) ~= sum_PQ (ij|P) [(P|Q)^-1]_PQ (Q|kl)
+
+ References:
+  Whitten, J. Chem. Phys. 58, 4496 (1973).
+  Vahtras, Almlof, Feyereisen, Chem. Phys. Lett. 213, 514 (1993).
+
+ This program is part of the PyQuante quantum chemistry program suite
+
+ PyQuante version 1.2 and later is covered by the modified BSD
+ license. Please see the file LICENSE that is part of this
+ distribution.
+"""
+import settings
+from math import log,ceil
+from PyQuante.NumWrap import zeros,dot,solve,cholesky
+from PyQuante.CGBF import CGBF
+from PyQuante.Ints import getbasis,sym2powerlist,pair_density,unpack_pairs,\
+     finish_transform_ints
+import logging
+logger = logging.getLogger("pyquante")
+
+def aux_basis(atoms,bfs,**kwargs):
+    """\
+    abfs = aux_basis(atoms,bfs,**kwargs)
+
+    The auxiliary basis set used to fit the products of the basis
+    functions bfs.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    aux_basis     None    Name or data of an auxiliary basis set, as
+                          used by getbasis. If None, an even-tempered
+                          set is made for each atom, spanning the
+                          exponents of the products of its bfs, with
+                          angular momentum up to twice that of the bfs
+                          (at most d)
+    aux_ratio     2.5     Ratio between the even-tempered exponents
+    """
+    basis = kwargs.get('aux_basis',settings.DFAuxBasis)
+    if basis: return getbasis(atoms,basis)
+    beta = kwargs.get('aux_ratio',settings.DFAuxRatio)
+    abfs = []
+    for atom in atoms:
+        exps = []
+        lmax = 0
+        for bf in bfs:
+            if bf.atid != atom.atid: continue
+            exps.extend(bf.pexps)
+            lmax = max(lmax,sum(bf.powers))
+        if not exps: continue
+        amin,amax = 2*min(exps),2*max(exps)
+        nexp = int(ceil(log(amax/amin)/log(beta)))+1
+        for sym in 'SPD'[:min(2*lmax,2)+1]:
+            for power in sym2powerlist[sym]:
+                for i in xrange(nexp):
+                    abf = CGBF(atom.pos(),power,atom.atid)
+                    abf.add_primitive(amin*pow(beta,i),1.0)
+                    abf.normalize()
+                    abfs.append(abf)
+    return abfs
+
+# An s function of zero exponent is 1, so pairing a function with one
+# turns the four-centre Coulomb integrals into two- and three-centre ones
+def three_center(a,b,c):
+    "Coulomb interaction (ab|c) of the product a*b and the function c"
+    from settings import contr_coulomb
+    Jij = contr_coulomb(a.pexps,a.pcoefs,a.pnorms,a.origin,a.powers,
+                        b.pexps,b.pcoefs,b.pnorms,b.origin,b.powers,
+                        c.pexps,c.pcoefs,c.pnorms,c.origin,c.powers,
+                        [0.],[1.],[1.],c.origin,(0,0,0))
+    return a.norm*b.norm*c.norm*Jij
+
+def two_center(a,b):
+    "Coulomb interaction (a|b) of the functions a and b"
+    from settings import contr_coulomb
+    Jij = contr_coulomb(a.pexps,a.pcoefs,a.pnorms,a.origin,a.powers,
+                        [0.],[1.],[1.],a.origin,(0,0,0),
+                        b.pexps,b.pcoefs,b.pnorms,b.origin,b.powers,
+                        [0.],[1.],[1.],b.origin,(0,0,0))
+    return a.norm*b.norm*Jij
+
+def get3ints(bfs,abfs):
+    "The (npair,naux) three-centre integrals (ij|P), over the i>=j pairs"
+    nbf = len(bfs)
+    ints = zeros((nbf*(nbf+1)/2,len(abfs)),'d')
+    ij = 0
+    for i in xrange(nbf):
+        for j in xrange(i+1):
+            for p in xrange(len(abfs)):
+                ints[ij,p] = three_center(bfs[i],bfs[j],abfs[p])
+            ij += 1
+    return ints
+
+def get2cints(abfs):
+    "The (naux,naux) Coulomb metric (P|Q) of the auxiliary basis"
+    naux = len(abfs)
+    metric = zeros((naux,naux),'d')
+    for p in xrange(naux):
+        for q in xrange(p+1):
+            metric[p,q] = metric[q,p] = two_center(abfs[p],abfs[q])
+    return metric
+
+def fitted_mo_ints(ints3,metric,C1,C2,**kwargs):
+    """\
+    B = fitted_mo_ints(ints3,metric,C1,C2,**kwargs)
+
+    The (n1,n2,naux) fitted MO integrals B, such that
+
+      (ij|kl) ~= sum_P B[i,j,P] B[k,l,P]
+
+    for i,k in the orbitals C1 and j,l in C2, from the integrals
+    ints3 of get3ints and the metric of get2cints: (ij|P) is
+    transformed as the second half of transform_ints, and then
+    multiplied by the inverse of the Cholesky factor of the metric.
+    Takes the block_size option of finish_transform_ints.
+    """
+    npair,naux = ints3.shape
+    ijP = finish_transform_ints(ints3.reshape((npair,naux,1)),C1,C2,**kwargs)
+    n1,n2 = ijP.shape[:2]
+    B = solve(cholesky(metric),ijP.reshape((n1*n2,naux)).T)
+    return B.T.reshape((n1,n2,naux))
+
+class CoulombFit:
+    """\
+    Density fitted Coulomb integrals. getints returns one of these,
+    rather than the packed ERIs, when called with exchange=False and
+    density_fit=True, and getJ then calls its getJ method. Options
+    are the same as for aux_basis.
+    """
+    def __init__(self,bfs,atoms,**kwargs):
+        self.nbf = len(bfs)
+        self.abfs = aux_basis(atoms,bfs,**kwargs)
+        logger.info("Fitting to %d auxiliary functions" % len(self.abfs))
+        self.ints3 = get3ints(bfs,self.abfs)
+        self.metric = get2cints(self.abfs)
+        return
+
+    def coefficients(self,D):
+        "The fitting coefficients of the density D"
+        return solve(self.metric,dot(pair_density(D),self.ints3))
+
+    def getJ(self,D):
+        "The fitted Coulomb operator corresponding to a density matrix D"
+        return unpack_pairs(dot(self.ints3,self.coefficients(D)),self.nbf)
@@ -20,60 +20,22 @@
 
 from PyQuante.cints import ijkl2intindex
 from PyQuante.LA2 import mkdens
-from PyQuante.Ints import getbasis,getints, getJ, getK, getT
+from PyQuante.Ints import getbasis,getints, getJ, getK, getT, transform_ints
 from PyQuante.hartree_fock import get_energy,uhf
 from PyQuante.IO import mtx2file
-from NumWrap import zeros,dot,sqrt,choose
+from NumWrap import zeros,dot,sqrt,choose,transpose
 
 from time import time
 
 def TransformInts(Ints,orbs1,orbs2, nocc):
-
+    """\
+    The packed (ai|bj) integrals, with a and i transformed by orbs2 and
+    b and j by orbs1. As it always has, this contracts the AOs with the
+    rows of the orbital matrices. See Ints.transform_ints.
+    """
     nbf,nmo = orbs1.shape
-    totlen = nmo*nmo*nmo*nmo
-
-    occs = range(nocc)
-    mos = range(nmo)
-    bfs = range(nbf)
-
-    # Start with (mu,nu|sigma,eta)
-    # Unpack aoints and transform sigma -> b
-    # Here sigma, b, nu, j are of first same spin group,
-    #  others of second same spin group
-    temp = zeros((nbf,nbf,nbf,nbf),'d')
-    tempvec = zeros(nbf,'d')
-    for mu in bfs:
-        for nu in bfs:
-            for eta in bfs:
-                for b in bfs:
-                    for sigma in bfs:
-                        tempvec[sigma] = Ints[ijkl2intindex(mu,nu,sigma,eta)]
-                    temp[mu,nu,b,eta] = dot(orbs1[b,:],tempvec)
-
-    temp2 = zeros((nbf,nbf,nbf,nbf),'d')
-    for nu in bfs:
-        for eta in bfs:
-            for b in bfs:
-                for a in bfs:
-                    temp2[a,nu,b,eta] = dot(orbs2[a,:],temp[:,nu,b,eta])
-
-    temp = zeros((nbf,nbf,nbf,nbf),'d')
-    for a in bfs:
-        for nu in bfs:
-            for b in bfs:
-                for j in bfs:
-                    temp[a,nu,b,j] = dot(orbs1[j,:],temp2[a,nu,b,:])
-
-    # Transform mu -> i and repack integrals:
-    MOInts = zeros(totlen,'d')
-    for a in bfs:
-        for j in bfs:
-            for b in bfs:
-                for i in bfs:
-                    aibj = ijkl2intindex(a,i,b,j)
-                    MOInts[aibj] = dot(orbs2[i,:],temp[a,:,b,j])
-
-    del temp,temp2,tempvec #force garbage collection now
+    C1,C2 = transpose(orbs1),transpose(orbs2)
+    MOInts = transform_ints(Ints,(C2,C2,C1,C1),packed=True)
     return MOInts, nbf
 
 def EN2(molecule,**kwargs):#
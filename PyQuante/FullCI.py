@@ -28,6 +28,7 @@ except:
     from PyQuante.pyints import ijkl2intindex
 
 from PyQuante.CI import TransformInts
+from PyQuante.Solvers import davidson
 
 
 def single_excitations(n):
@@ -94,9 +95,10 @@ def e_pq_on_string(p,q,string):
 
 
 class FCISolver(object):
-    """ Interface to the scipy.sparse.linalg.eigs eigenvalue solver"""
+    """ Interface to the scipy.sparse.linalg.eigs eigenvalue solver,
+    or to the block Davidson solver of Solvers"""
 
-    def __init__(self, h, ERI, enuke, orbs, n_elec, multiplicity, m_s, k=4, sigma_eigs=None, which='SA', v0=None, maxiter=None, tol=0, return_eigenvectors=True ):
+    def __init__(self, h, ERI, enuke, orbs, n_elec, multiplicity, m_s, k=4, sigma_eigs=None, which='SA', v0=None, maxiter=None, tol=0, return_eigenvectors=True, eigensolver='eigsh' ):
         """
         Parameters: 
         
@@ -135,6 +137,10 @@ class FCISolver(object):
                             
         return_eigenvectors: return eigenvector in addition to eigenvalues
                              if set to True
+
+        eigensolver :       'eigsh', or 'davidson' for Solvers.davidson,
+                            which uses k, maxiter and tol (as the
+                            residual tolerance, if not 0) only
         
         """
 
@@ -146,6 +152,7 @@ class FCISolver(object):
         self.maxiter=maxiter
         self.tol=tol
         self.return_eigenvectors = return_eigenvectors
+        self.eigensolver = eigensolver
 
         # number of alpha electrons
         self.n_alpha = 0.5*n_elec + m_s
@@ -190,8 +197,23 @@ class FCISolver(object):
         return new_vec_mat.reshape(self.c_vec_shape)
         
         
+    def block_matvec(self, vecs):
+        """ matvec for each column of vecs, as needed by the Davidson
+        solver """
+        return np.array([self.matvec(vec) for vec in vecs.T]).T
+
+    def get_diagonal(self):
+        """ diagonal of the Hamiltonian, as a vector like vec """
+        return self.SigmaInst.get_diagonal().reshape(self.c_vec_shape)
+        
     def iterate(self):
-        eva, eve = spspalin.eigsh(self.LinOp,k=self.k, sigma = self.sigma_eigs, which = self.which, v0 = self.v0, maxiter= self.maxiter, tol=self.tol, return_eigenvectors = self.return_eigenvectors)
+        if self.eigensolver == 'davidson':
+            options = {'diag':self.get_diagonal()}
+            if self.tol: options['rtol'] = self.tol
+            if self.maxiter: options['maxiter'] = self.maxiter
+            eva, eve = davidson(self.block_matvec, self.k, **options)
+        else:
+            eva, eve = spspalin.eigsh(self.LinOp,k=self.k, sigma = self.sigma_eigs, which = self.which, v0 = self.v0, maxiter= self.maxiter, tol=self.tol, return_eigenvectors = self.return_eigenvectors)
         print "diagonalization sucessful"
 
         self.eva, self.eve = self.sort_and_add_enuke(eva,eve)
@@ -484,6 +506,39 @@ class Sigma(object):
             return self.get_sigma_alpha() + self.get_sigma_beta() + self.get_sigma_alpha_alpha() + self.get_sigma_beta_beta() + self.get_sigma_alpha_beta()
 
 
+    def get_diagonal(self):
+        """ diagonal of the Hamiltonian in the space of alpha and beta
+        strings, indexed like c_mat, from the Slater-Condon rules:
+
+        E = sum_i h_ii + 1/2 sum_ij (J_ij - K_ij) [i,j of the same spin]
+            + sum_ij J_ij [i alpha, j beta]
+        """
+        try: self.h_mat
+        except: self.h_mat = transform_one_ints(self.h,self.orbs)
+        try: self.MOInts
+        except: self.MOInts = TransformInts(self.ERI,self.orbs)
+
+        J = np.zeros((self.n_orbs,self.n_orbs))
+        K = np.zeros((self.n_orbs,self.n_orbs))
+        for p in xrange(self.n_orbs):
+            for q in xrange(self.n_orbs):
+                J[p,q] = self.MOInts[ijkl2intindex(p,p,q,q)]
+                K[p,q] = self.MOInts[ijkl2intindex(p,q,q,p)]
+
+        n_alpha = self.occupation_matrix(self.AlphaStrings)
+        n_beta = self.occupation_matrix(self.BetaStrings)
+        e_alpha = np.dot(n_alpha,self.h_mat.diagonal()) + 0.5*(np.dot(n_alpha,J-K)*n_alpha).sum(1)
+        e_beta = np.dot(n_beta,self.h_mat.diagonal()) + 0.5*(np.dot(n_beta,J-K)*n_beta).sum(1)
+        return e_alpha[:,np.newaxis] + e_beta + np.dot(np.dot(n_alpha,J),n_beta.T)
+
+    def occupation_matrix(self, Strings):
+        """ occupation numbers (0 or 1) of the orbitals (columns) in
+        each string (rows, by address) """
+        occ = np.zeros((len(Strings.occupations),self.n_orbs))
+        for address, occupation in enumerate(Strings.occupations):
+            occ[address,list(occupation)] = 1.
+        return occ
+
     # one electron part
 
 
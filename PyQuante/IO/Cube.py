@@ -56,17 +56,20 @@ def mesh_orb(atoms,bfs,orbs,index):
         atno = atom.atno
         x,y,z = atom.pos()
         print "%5i %11.6f %11.6f %11.6f %11.6f" %  (atno,atno,x,y,z)
-    nbf = len(bfs)
+    # Evaluate the orbital one x plane at a time
+    from PyQuante.CGBF import eval_bfs
+    from PyQuante.NumWrap import zeros,dot,arange
+    plane = zeros((ny*nz,3),'d')
+    for j in xrange(ny):
+        plane[j*nz:(j+1)*nz,1] = ymin + j*spacing
+        plane[j*nz:(j+1)*nz,2] = zmin + spacing*arange(nz)
     print " ",
     for i in xrange(nx):
-        xg = xmin + i*spacing
+        plane[:,0] = xmin + i*spacing
+        amps = dot(eval_bfs(bfs,plane),orbs[:,index])
         for j in xrange(ny):
-            yg = ymin + j*spacing
             for k in xrange(nz):
-                zg = zmin + k*spacing
-                amp = 0
-                for ibf in xrange(nbf):
-                    amp += bfs[ibf].amp(xg,yg,zg)*orbs[ibf,index]
+                amp = amps[j*nz+k]
                 if abs(amp) < 1e-12: amp = 0
                 print " %11.5e" % amp,
                 if k % 6 == 5: print "\n ",
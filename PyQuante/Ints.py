@@ -10,7 +10,8 @@
  distribution. 
 """
 import settings
-from PyQuante.NumWrap import zeros,dot,reshape
+from PyQuante.NumWrap import zeros,dot,reshape,frombuffer,tril_indices,\
+     arange,indices,maximum,minimum,newaxis
 from PyQuante.cints import ijkl2intindex as intindex
 from PyQuante.Basis.Tools import get_basis_data
 import logging
@@ -25,10 +26,6 @@ sym2powerlist = {
            (0,3,0),(0,2,1),(0,1,2), (0,0,3)]
     }
 
-sorted = True
-jints = {}
-kints = {}
-
 def getbasis(atoms,basis_data=None,**kwargs):
     """\
     bfs = getbasis(atoms,basis_data=None)
@@ -48,11 +45,29 @@ def getbasis(atoms,basis_data=None,**kwargs):
     return BasisSet(atoms, basis_data, **kwargs)
 
 def getints(bfs,atoms,**kwargs):
+    """\
+    S,h,Ints = getints(bfs,atoms,**kwargs)
+
+    Options:      Value   Description
+    --------      -----   -----------
+    integrals     None    If not None, the S,h,Ints to return
+    sortints      True    Keep the integrals in the layouts used by
+                          getJ and getK (see sortints)
+    exchange      True    False if only getJ will be called, as in pure
+                          DFT. The exchange layout isn't made then.
+    density_fit   False   If exchange is False, return a CoulombFit
+                          (see DensityFitting) rather than the ERIs
+    """
     if kwargs.get('integrals'):
         return kwargs.get('integrals')
     logger.info("Calculating Integrals...")
     S,h = get1ints(bfs,atoms)
-    Ints = get2ints(bfs)
+    if not kwargs.get('exchange',True) and \
+           kwargs.get('density_fit',settings.DFTDensityFit):
+        from PyQuante.DensityFitting import CoulombFit
+        Ints = CoulombFit(bfs,atoms,**kwargs)
+    else:
+        Ints = get2ints(bfs,**kwargs)
     logger.info("Integrals Calculated.")
     return S,h,Ints
 
@@ -113,10 +128,13 @@ if settings.libint_enabled == True:
     import numpy as np
     import clibint
     
-    def get2ints(basis):
+    class ERIArray(np.ndarray):
+        "Packed two-electron integrals, which can carry their sorted J/K rows"
+
+    def get2ints(basis,**kwargs):
         lenbasis = len(basis.bfs)
         
-        Ints = np.zeros((lenbasis**4),dtype=np.float64)
+        Ints = np.zeros((lenbasis**4),dtype=np.float64).view(ERIArray)
 
         for i,a in enumerate(basis.shells):
             for j,b in enumerate(basis.shells[:i+1]):
@@ -124,19 +142,23 @@ if settings.libint_enabled == True:
                     for l,d in enumerate(basis.shells[:k+1]):
                         if (i+j)>=(k+l):
                             clibint.shell_compute_eri(a,b,c,d,Ints)
-        if sorted:
-            sortints(lenbasis,Ints)
+        if kwargs.get('sortints',settings.SortInts):
+            Ints.jpairs,Ints.kints = sortints(lenbasis,Ints,**kwargs)
         return Ints
 else:
     # PyQuante Integrals
-    def get2ints(bfs):
+    from array import array
+
+    class ERIArray(array):
+        "Packed two-electron integrals, which can carry their sorted J/K rows"
+
+    def get2ints(bfs,**kwargs):
         """Store integrals in a long array in the form (ij|kl) (chemists
         notation. We only need i>=j, k>=l, and ij <= kl"""
 
-        from array import array
         nbf = len(bfs)
         totlen = nbf*(nbf+1)*(nbf*nbf+nbf+2)/8
-        Ints = array('d',[0]*totlen)
+        Ints = ERIArray('d',[0]*totlen)
 
         for i in xrange(nbf):
             for j in xrange(i+1):
@@ -148,16 +170,160 @@ else:
                             Ints[intindex(i,j,k,l)] = coulomb(bfs[i],bfs[j],
                                                               bfs[k],bfs[l])
 
-        if sorted:
-            sortints(nbf,Ints)
+        if kwargs.get('sortints',settings.SortInts):
+            Ints.jpairs,Ints.kints = sortints(nbf,Ints,**kwargs)
         return Ints
 
-def sortints(nbf,Ints):
+def sortints(nbf,Ints,**kwargs):
+    """\
+    jpairs,kints = sortints(nbf,Ints,exchange=True)
+    Unpack Ints into the (npair,npair) matrix of (ij|kl) used by getJ,
+    and gather the rows of Ints needed for each element of K. get2ints
+    stores these on the integrals it returns, so that getJ, getK and
+    get2JmK don't have to fetch them from the packed array every time.
+    kints is None if exchange is False.
+    """
+    jpairs = pair_matrix(nbf,Ints)
+    if not kwargs.get('exchange',True): return jpairs,None
+    kints = {}
     for i in xrange(nbf):
         for j in xrange(i+1):
-            jints[i,j] = fetch_jints(Ints,i,j,nbf)
             kints[i,j] = fetch_kints(Ints,i,j,nbf)
-    return
+    return jpairs,kints
+
+# The packed integrals are the lower triangle, by rows, of the symmetric
+# matrix of (ij|kl) over the i>=j pairs ij=i*(i+1)/2+j. J only needs
+# that matrix times the density over the same pairs.
+def packed_ints(Ints,nbf):
+    "The packed (ij|kl) of Ints as a numpy array, without copying"
+    npair = nbf*(nbf+1)/2
+    return frombuffer(Ints,'d')[:npair*(npair+1)/2]
+
+def pair_matrix(nbf,Ints):
+    "The (npair,npair) matrix of (ij|kl) over the i>=j, k>=l pairs"
+    npair = nbf*(nbf+1)/2
+    M = zeros((npair,npair),'d')
+    M[tril_indices(npair)] = packed_ints(Ints,nbf)
+    M += M.T
+    M.flat[::npair+1] *= 0.5
+    return M
+
+def pair_density(D):
+    "D summed over the i>=j pairs: D[i,j]+D[j,i], or D[i,i] if i==j"
+    i,j = tril_indices(D.shape[0])
+    Dp = D[i,j]+D[j,i]
+    Dp[i==j] *= 0.5
+    return Dp
+
+def unpack_pairs(Jp,nbf):
+    "The symmetric nbf x nbf matrix of a vector over the i>=j pairs"
+    i,j = tril_indices(nbf)
+    J = zeros((nbf,nbf),'d')
+    J[i,j] = Jp
+    J[j,i] = Jp
+    return J
+
+def pair_index(p,q):
+    "Index of the pair (p,q) among the p>=q pairs, for either order"
+    hi,lo = maximum(p,q),minimum(p,q)
+    return hi*(hi+1)/2+lo
+
+def transform_ints(Ints,orbs,**kwargs):
+    """\
+    moints = transform_ints(Ints,orbs,**kwargs)
+
+    Transform the packed AO integrals Ints to the MO integrals
+
+      (ij|kl) = sum C1[mu,i] C2[nu,j] C3[sig,k] C4[eta,l] (mu nu|sig eta)
+
+    as four quarter transformations, each a matrix multiply. The AO
+    pairs (and then the MO pairs) are unpacked block_size at a time,
+    so no more than block_size*nbf**2 of them are held at once,
+    besides the (npair,n3,n4) half-transformed integrals. The two
+    halves are also available as half_transform_ints and
+    finish_transform_ints.
+
+    orbs is either one (nbf,nmo) matrix of orbitals, used for all
+    four indices, or a tuple (C1,C2,C3,C4) with one for each index,
+    e.g. the (occ,virt,occ,virt) blocks of the orbitals. The result
+    is the dense (n1,n2,n3,n4) array.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    packed        False   Return the i>=j, k>=l, ij>=kl elements in
+                          the packed order of ijkl2intindex instead.
+                          Needs the same orbitals for all four indices.
+    block_size    256     Pairs unpacked at a time
+                          (settings.TransformBlockSize)
+    """
+    if type(orbs) in [type(()),type([])]:
+        C1,C2,C3,C4 = orbs
+    else:
+        C1 = C2 = C3 = C4 = orbs
+    half = half_transform_ints(Ints,C3,C4,**kwargs)
+    moints = finish_transform_ints(half,C1,C2,**kwargs)
+    if not kwargs.get('packed'): return moints
+    i,j = tril_indices(C1.shape[1])
+    return moints[i,j][:,i,j][tril_indices(len(i))]
+
+def half_transform_ints(Ints,C3,C4,**kwargs):
+    """\
+    half = half_transform_ints(Ints,C3,C4,**kwargs)
+
+    The first two quarter transformations of transform_ints: the
+    (npair,n3,n4) integrals (mu nu|k l) over the mu>=nu AO pairs.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    block_size    256     AO pairs unpacked at a time
+                          (settings.TransformBlockSize)
+    out           None    (npair,n3,n4) array, e.g. a numpy.memmap,
+                          to hold the result
+    """
+    nblock = kwargs.get('block_size',settings.TransformBlockSize)
+    nbf,n3 = C3.shape
+    n4 = C4.shape[1]
+    npair = nbf*(nbf+1)/2
+    ints = packed_ints(Ints,nbf)
+    pairs = pair_index(*indices((nbf,nbf)))
+    half = kwargs.get('out')
+    if half is None: half = zeros((npair,n3,n4),'d')
+
+    # (mu nu|sig eta) -> (mu nu|k l), for a block of mu>=nu pairs at a time
+    for start in xrange(0,npair,nblock):
+        rows = arange(start,min(start+nblock,npair))
+        nrow = len(rows)
+        X = ints[pair_index(rows[:,newaxis,newaxis],pairs)]
+        X = dot(X.reshape((nrow*nbf,nbf)),C4).reshape((nrow,nbf,n4))
+        X = dot(X.transpose((0,2,1)).reshape((nrow*n4,nbf)),C3)
+        half[rows] = X.reshape((nrow,n4,n3)).transpose((0,2,1))
+    return half
+
+def finish_transform_ints(half,C1,C2,**kwargs):
+    """\
+    moints = finish_transform_ints(half,C1,C2,**kwargs)
+
+    The last two quarter transformations of transform_ints, taking
+    the (npair,n3,n4) output of half_transform_ints to the dense
+    (n1,n2,n3,n4) MO integrals. Takes the block_size option.
+    """
+    nblock = kwargs.get('block_size',settings.TransformBlockSize)
+    nbf,n1 = C1.shape
+    n2 = C2.shape[1]
+    npair,n3,n4 = half.shape
+    pairs = pair_index(*indices((nbf,nbf)))
+
+    # (mu nu|k l) -> (i j|k l), for a block of kl at a time
+    half = half.reshape((npair,n3*n4))
+    moints = zeros((n1,n2,n3*n4),'d')
+    for start in xrange(0,n3*n4,nblock):
+        cols = slice(start,min(start+nblock,n3*n4))
+        Y = half[:,cols][pairs]
+        ncol = Y.shape[2]
+        Y = dot(C1.T,Y.reshape((nbf,nbf*ncol))).reshape((n1,nbf,ncol))
+        Y = dot(C2.T,Y.transpose((1,0,2)).reshape((nbf,n1*ncol)))
+        moints[:,:,cols] = Y.reshape((n2,n1,ncol)).transpose((1,0,2))
+    return moints.reshape((n1,n2,n3,n4))
 
 def fetch_jints(Ints,i,j,nbf):
     temp = zeros(nbf*nbf,'d')
@@ -181,26 +347,30 @@ def fetch_kints(Ints,i,j,nbf):
 def getJ(Ints,D):
     "Form the Coulomb operator corresponding to a density matrix D"
     nbf = D.shape[0]
-    D1d = reshape(D,(nbf*nbf,)) #1D version of Dens
-    J = zeros((nbf,nbf),'d')
-    for i in xrange(nbf):
-        for j in xrange(i+1):
-            if sorted:
-                temp = jints[i,j]
-            else:
-                temp = fetch_jints(Ints,i,j,nbf)
-            J[i,j] = dot(temp,D1d)
-            J[j,i] = J[i,j]
-    return J
+    if hasattr(Ints,'getJ'): return Ints.getJ(D) # e.g. a CoulombFit
+    Dp = pair_density(D)
+    jpairs = getattr(Ints,'jpairs',None)
+    if jpairs is not None: return unpack_pairs(dot(jpairs,Dp),nbf)
+    # One pass over the rows of the packed lower triangle
+    ints = packed_ints(Ints,nbf)
+    Jp = zeros(len(Dp),'d')
+    start = 0
+    for ij in xrange(len(Dp)):
+        row = ints[start:start+ij+1]
+        Jp[ij] += dot(row,Dp[:ij+1])
+        Jp[:ij] += Dp[ij]*row[:ij]
+        start += ij+1
+    return unpack_pairs(Jp,nbf)
 
 def getK(Ints,D):
     "Form the exchange operator corresponding to a density matrix D"
     nbf = D.shape[0]
     D1d = reshape(D,(nbf*nbf,)) #1D version of Dens
+    kints = getattr(Ints,'kints',None)
     K = zeros((nbf,nbf),'d')
     for i in xrange(nbf):
         for j in xrange(i+1):
-            if sorted:
+            if kints is not None:
                 temp = kints[i,j]
             else:
                 temp = fetch_kints(Ints,i,j,nbf)
@@ -210,18 +380,7 @@ def getK(Ints,D):
 
 def get2JmK(Ints,D):
     "Form the 2J-K integrals corresponding to a density matrix D"
-    nbf = D.shape[0]
-    D1d = reshape(D,(nbf*nbf,)) #1D version of Dens
-    G = zeros((nbf,nbf),'d')
-    for i in xrange(nbf):
-        for j in xrange(i+1):
-            if sorted:
-                temp = 2*jints[i,j]-kints[i,j]
-            else:
-                temp = 2*fetch_jints(Ints,i,j,nbf)-fetch_kints(Ints,i,j,nbf)
-            G[i,j] = dot(temp,D1d)
-            G[j,i] = G[i,j]
-    return G
+    return 2*getJ(Ints,D)-getK(Ints,D)
 
 def coulomb(a,b,c,d):
     "Coulomb interaction between 4 contracted Gaussians"
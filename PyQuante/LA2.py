@@ -18,13 +18,6 @@ import logging
 from math import sqrt
 from NumWrap import matrixmultiply,identity,zeros,eigh,cholesky,inv,dot,pinv
 
-# Note: to be really smart in a quantum chemistry program, we would
-#  want to only symmetrically orthogonalize the S matrix once, since
-#  the matrix doesn't change during the SCF procedure. Thus, we would
-#  want to call X = SymOrth(S), and then geighD(H,X), rather
-#  than calling geigh(H,S) every time, since the latter
-#  recomputes the symmetric orthogonalization every SCF cycle.
-
 def norm(vec):
     "val = norm(vec) : Return the 2-norm of a vector"
     return sqrt(dot(vec,vec))
@@ -57,24 +50,61 @@ def geigh(H,A,**kwargs):
                'Chol'  Use a Cholesky decomposition
                'Cut'   Use a symmetric orthogonalization with a cutoff
                 
+    Since S doesn't change during an SCF calculation, it is much
+    cheaper to form the transformation once, using a
+    GeneralizedEigensolver, than to call geigh(H,S) every cycle.
     """
     have_xfrm = kwargs.get('have_xfrm')
-    orthog = kwargs.get('orthog',settings.OrthogMethod)
     if not have_xfrm:
-        if orthog == 'Can':
-            X = CanOrth(A)
-        elif orthog == 'Chol':
-            X = CholOrth(A)
-        elif orthog == 'Cut':
-            X = SymOrthCutoff(A)
-        else:
-            X = SymOrth(A)
+        X = orthog_xfrm(A,**kwargs)
         kwargs['have_xfrm'] = True
         return geigh(H,X,**kwargs)
     val,vec = eigh(simx(H,A))
     vec = matrixmultiply(A,vec)
     return val,vec
 
+def orthog_xfrm(S,**kwargs):
+    """\
+    X = orthog_xfrm(S,**kwargs)
+    Form the orthogonalizing transformation X of the overlap matrix S,
+    such that X'SX = 1. The 'orthog' and 'scut' options are the same
+    as in geigh. With orthog='Cut', the linearly dependent combinations
+    are removed, and X is nbf x nindep rather than square.
+    """
+    method = kwargs.get('orthog',settings.OrthogMethod)
+    if method == 'Can':
+        X = CanOrth(S)
+    elif method == 'Chol':
+        X = CholOrth(S)
+    elif method == 'Cut':
+        X = SymOrthCutoff(S,kwargs.get('scut',1e-5),drop_lindep=True)
+    else:
+        X = SymOrth(S)
+    return X
+
+class GeneralizedEigensolver:
+    """\
+    solver = GeneralizedEigensolver(S,**kwargs)
+    orbe,orbs = solver.solve(H)
+
+    Solve the generalized eigenproblem HC = SCE for a fixed overlap
+    matrix S. The orthogonalizing transformation X is formed once,
+    when the solver is constructed, and reused for every H. Takes the
+    same 'orthog' and 'scut' options as geigh.
+    """
+    def __init__(self,S,**kwargs):
+        self.S = S
+        self.X = orthog_xfrm(S,**kwargs)
+        self.nbf,self.nindep = self.X.shape
+        if self.nindep < self.nbf:
+            logging.info("Removed %d linear dependencies from the basis"
+                         % (self.nbf-self.nindep))
+        return
+
+    def solve(self,H):
+        "orbe,orbs = solve(H): eigenvalues/vectors of H in the metric S"
+        return geigh(H,self.X,have_xfrm=True)
+
 def SymOrth(S):
     """Symmetric orthogonalization of the real symmetric matrix S.
     This is given by Ut(1/sqrt(lambda))U, where lambda,U are the
@@ -87,7 +117,7 @@ def SymOrth(S):
     X = simx(shalf,vec,'T')
     return X
 
-def SymOrthCutoff(S,scut=1e-5):
+def SymOrthCutoff(S,scut=1e-5,drop_lindep=False):
     """Symmetric orthogonalization of the real symmetric matrix S.
     This is given by Ut(1/sqrt(lambda))U, where lambda,U are the
     eigenvalues/vectors.
@@ -95,16 +125,25 @@ def SymOrthCutoff(S,scut=1e-5):
     Only eigenvectors with eigenvalues greater that a cutoff are kept.
     This approximation is useful in cases where the basis set has
     linear dependencies.
+
+    If drop_lindep is True, X is projected onto the eigenvectors that
+    are kept, giving a rectangular nbf x nindep transformation. The
+    eigenproblem in that space then doesn't contain the spurious zero
+    eigenvalues of the square version.
     """
     val,vec = eigh(S)
     n = vec.shape[0]
     shalf = identity(n,'d')
+    keep = []
     for i in xrange(n):
         if val[i] > scut:
             shalf[i,i] /= sqrt(val[i])
+            keep.append(i)
         else:
             shalf[i,i] = 0.
     X = simx(shalf,vec,'T')
+    if drop_lindep:
+        X = matrixmultiply(X,vec[:,keep])
     return X
 
 def CanOrth(S): 
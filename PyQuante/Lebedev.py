@@ -1,5 +1,9 @@
 """\
  Lebedev roots and weights generated by data/lebedev_write.py
+
+ The grids are kept in GridData as little-endian float64 files, one
+ per order, and Lebedev[n] loads the (n,4) array of x,y,z,weight of
+ order n the first time it is used.
  
  This program is part of the PyQuante quantum chemistry program suite.
 
@@ -9,942 +13,39 @@
  license. Please see the file LICENSE that is part of this
  distribution. 
 """
+import os
+from NumWrap import fromfile
+
+GridData = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'GridData')
+
+class QuadratureTable:
+    """\
+    Read-only dict of the quadrature grids in GridData, keyed by order.
+    Each grid is loaded from name_order.dat as an (order,ncols) array
+    when it is first used, and kept.
+    """
+    def __init__(self,name,ncols,orders):
+        self.name = name
+        self.ncols = ncols
+        self.orders = orders
+        self.grids = {}
+        return
+
+    def __getitem__(self,order):
+        if order not in self.grids:
+            if order not in self.orders:
+                raise KeyError("No %s grid of order %s" % (self.name,order))
+            fname = os.path.join(GridData,"%s_%d.dat" % (self.name,order))
+            grid = fromfile(fname,'<f8').reshape((order,self.ncols))
+            grid.flags.writeable = False
+            self.grids[order] = grid
+        return self.grids[order]
+
+    def __contains__(self,order): return order in self.orders
+    def __iter__(self): return iter(self.orders)
+    def __len__(self): return len(self.orders)
+    def keys(self): return list(self.orders)
 
-Lebedev = {
-    6 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.166666666667),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.166666666667),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.166666666667),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.166666666667),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.166666666667),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.166666666667),
-    ],
-    14 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.066666666667),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.066666666667),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.066666666667),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.066666666667),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.066666666667),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.066666666667),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.075000000000),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.075000000000),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.075000000000),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.075000000000),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.075000000000),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.075000000000),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.075000000000),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.075000000000),
-    ],
-    26 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.047619047619),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.047619047619),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.047619047619),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.047619047619),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.047619047619),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.047619047619),
-        (  0.000000000000,  0.707106781187,  0.707106781187,  0.038095238095),
-        (  0.000000000000, -0.707106781187,  0.707106781187,  0.038095238095),
-        (  0.000000000000,  0.707106781187, -0.707106781187,  0.038095238095),
-        (  0.000000000000, -0.707106781187, -0.707106781187,  0.038095238095),
-        (  0.707106781187,  0.000000000000,  0.707106781187,  0.038095238095),
-        ( -0.707106781187,  0.000000000000,  0.707106781187,  0.038095238095),
-        (  0.707106781187,  0.000000000000, -0.707106781187,  0.038095238095),
-        ( -0.707106781187,  0.000000000000, -0.707106781187,  0.038095238095),
-        (  0.707106781187,  0.707106781187,  0.000000000000,  0.038095238095),
-        ( -0.707106781187,  0.707106781187,  0.000000000000,  0.038095238095),
-        (  0.707106781187, -0.707106781187,  0.000000000000,  0.038095238095),
-        ( -0.707106781187, -0.707106781187,  0.000000000000,  0.038095238095),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.032142857143),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.032142857143),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.032142857143),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.032142857143),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.032142857143),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.032142857143),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.032142857143),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.032142857143),
-    ],
-    38 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.009523809524),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.009523809524),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.009523809524),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.009523809524),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.009523809524),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.009523809524),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.032142857143),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.032142857143),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.032142857143),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.032142857143),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.032142857143),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.032142857143),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.032142857143),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.032142857143),
-        (  0.459700843381,  0.888073833977,  0.000000000000,  0.028571428571),
-        ( -0.459700843381,  0.888073833977,  0.000000000000,  0.028571428571),
-        (  0.459700843381, -0.888073833977,  0.000000000000,  0.028571428571),
-        ( -0.459700843381, -0.888073833977,  0.000000000000,  0.028571428571),
-        (  0.888073833977,  0.459700843381,  0.000000000000,  0.028571428571),
-        ( -0.888073833977,  0.459700843381,  0.000000000000,  0.028571428571),
-        (  0.888073833977, -0.459700843381,  0.000000000000,  0.028571428571),
-        ( -0.888073833977, -0.459700843381,  0.000000000000,  0.028571428571),
-        (  0.459700843381,  0.000000000000,  0.888073833977,  0.028571428571),
-        ( -0.459700843381,  0.000000000000,  0.888073833977,  0.028571428571),
-        (  0.459700843381,  0.000000000000, -0.888073833977,  0.028571428571),
-        ( -0.459700843381,  0.000000000000, -0.888073833977,  0.028571428571),
-        (  0.888073833977,  0.000000000000,  0.459700843381,  0.028571428571),
-        ( -0.888073833977,  0.000000000000,  0.459700843381,  0.028571428571),
-        (  0.888073833977,  0.000000000000, -0.459700843381,  0.028571428571),
-        ( -0.888073833977,  0.000000000000, -0.459700843381,  0.028571428571),
-        (  0.000000000000,  0.459700843381,  0.888073833977,  0.028571428571),
-        (  0.000000000000, -0.459700843381,  0.888073833977,  0.028571428571),
-        (  0.000000000000,  0.459700843381, -0.888073833977,  0.028571428571),
-        (  0.000000000000, -0.459700843381, -0.888073833977,  0.028571428571),
-        (  0.000000000000,  0.888073833977,  0.459700843381,  0.028571428571),
-        (  0.000000000000, -0.888073833977,  0.459700843381,  0.028571428571),
-        (  0.000000000000,  0.888073833977, -0.459700843381,  0.028571428571),
-        (  0.000000000000, -0.888073833977, -0.459700843381,  0.028571428571),
-    ],
-    50 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.012698412698),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.012698412698),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.012698412698),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.012698412698),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.012698412698),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.012698412698),
-        (  0.000000000000,  0.707106781187,  0.707106781187,  0.022574955908),
-        (  0.000000000000, -0.707106781187,  0.707106781187,  0.022574955908),
-        (  0.000000000000,  0.707106781187, -0.707106781187,  0.022574955908),
-        (  0.000000000000, -0.707106781187, -0.707106781187,  0.022574955908),
-        (  0.707106781187,  0.000000000000,  0.707106781187,  0.022574955908),
-        ( -0.707106781187,  0.000000000000,  0.707106781187,  0.022574955908),
-        (  0.707106781187,  0.000000000000, -0.707106781187,  0.022574955908),
-        ( -0.707106781187,  0.000000000000, -0.707106781187,  0.022574955908),
-        (  0.707106781187,  0.707106781187,  0.000000000000,  0.022574955908),
-        ( -0.707106781187,  0.707106781187,  0.000000000000,  0.022574955908),
-        (  0.707106781187, -0.707106781187,  0.000000000000,  0.022574955908),
-        ( -0.707106781187, -0.707106781187,  0.000000000000,  0.022574955908),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.021093750000),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.021093750000),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.021093750000),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.021093750000),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.021093750000),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.021093750000),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.021093750000),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.021093750000),
-        (  0.301511344578,  0.301511344578,  0.904534033733,  0.020173335538),
-        ( -0.301511344578,  0.301511344578,  0.904534033733,  0.020173335538),
-        (  0.301511344578, -0.301511344578,  0.904534033733,  0.020173335538),
-        ( -0.301511344578, -0.301511344578,  0.904534033733,  0.020173335538),
-        (  0.301511344578,  0.301511344578, -0.904534033733,  0.020173335538),
-        ( -0.301511344578,  0.301511344578, -0.904534033733,  0.020173335538),
-        (  0.301511344578, -0.301511344578, -0.904534033733,  0.020173335538),
-        ( -0.301511344578, -0.301511344578, -0.904534033733,  0.020173335538),
-        (  0.301511344578,  0.904534033733,  0.301511344578,  0.020173335538),
-        ( -0.301511344578,  0.904534033733,  0.301511344578,  0.020173335538),
-        (  0.301511344578, -0.904534033733,  0.301511344578,  0.020173335538),
-        ( -0.301511344578, -0.904534033733,  0.301511344578,  0.020173335538),
-        (  0.301511344578,  0.904534033733, -0.301511344578,  0.020173335538),
-        ( -0.301511344578,  0.904534033733, -0.301511344578,  0.020173335538),
-        (  0.301511344578, -0.904534033733, -0.301511344578,  0.020173335538),
-        ( -0.301511344578, -0.904534033733, -0.301511344578,  0.020173335538),
-        (  0.904534033733,  0.301511344578,  0.301511344578,  0.020173335538),
-        ( -0.904534033733,  0.301511344578,  0.301511344578,  0.020173335538),
-        (  0.904534033733, -0.301511344578,  0.301511344578,  0.020173335538),
-        ( -0.904534033733, -0.301511344578,  0.301511344578,  0.020173335538),
-        (  0.904534033733,  0.301511344578, -0.301511344578,  0.020173335538),
-        ( -0.904534033733,  0.301511344578, -0.301511344578,  0.020173335538),
-        (  0.904534033733, -0.301511344578, -0.301511344578,  0.020173335538),
-        ( -0.904534033733, -0.301511344578, -0.301511344578,  0.020173335538),
-    ],
-    74 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.000513067180),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.000513067180),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.000513067180),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.000513067180),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.000513067180),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.000513067180),
-        (  0.000000000000,  0.707106781187,  0.707106781187,  0.016604069566),
-        (  0.000000000000, -0.707106781187,  0.707106781187,  0.016604069566),
-        (  0.000000000000,  0.707106781187, -0.707106781187,  0.016604069566),
-        (  0.000000000000, -0.707106781187, -0.707106781187,  0.016604069566),
-        (  0.707106781187,  0.000000000000,  0.707106781187,  0.016604069566),
-        ( -0.707106781187,  0.000000000000,  0.707106781187,  0.016604069566),
-        (  0.707106781187,  0.000000000000, -0.707106781187,  0.016604069566),
-        ( -0.707106781187,  0.000000000000, -0.707106781187,  0.016604069566),
-        (  0.707106781187,  0.707106781187,  0.000000000000,  0.016604069566),
-        ( -0.707106781187,  0.707106781187,  0.000000000000,  0.016604069566),
-        (  0.707106781187, -0.707106781187,  0.000000000000,  0.016604069566),
-        ( -0.707106781187, -0.707106781187,  0.000000000000,  0.016604069566),
-        (  0.577350269190,  0.577350269190,  0.577350269190, -0.029586038961),
-        ( -0.577350269190,  0.577350269190,  0.577350269190, -0.029586038961),
-        (  0.577350269190, -0.577350269190,  0.577350269190, -0.029586038961),
-        ( -0.577350269190, -0.577350269190,  0.577350269190, -0.029586038961),
-        (  0.577350269190,  0.577350269190, -0.577350269190, -0.029586038961),
-        ( -0.577350269190,  0.577350269190, -0.577350269190, -0.029586038961),
-        (  0.577350269190, -0.577350269190, -0.577350269190, -0.029586038961),
-        ( -0.577350269190, -0.577350269190, -0.577350269190, -0.029586038961),
-        (  0.480384461415,  0.480384461415,  0.733799385705,  0.026576207082),
-        ( -0.480384461415,  0.480384461415,  0.733799385705,  0.026576207082),
-        (  0.480384461415, -0.480384461415,  0.733799385705,  0.026576207082),
-        ( -0.480384461415, -0.480384461415,  0.733799385705,  0.026576207082),
-        (  0.480384461415,  0.480384461415, -0.733799385705,  0.026576207082),
-        ( -0.480384461415,  0.480384461415, -0.733799385705,  0.026576207082),
-        (  0.480384461415, -0.480384461415, -0.733799385705,  0.026576207082),
-        ( -0.480384461415, -0.480384461415, -0.733799385705,  0.026576207082),
-        (  0.480384461415,  0.733799385705,  0.480384461415,  0.026576207082),
-        ( -0.480384461415,  0.733799385705,  0.480384461415,  0.026576207082),
-        (  0.480384461415, -0.733799385705,  0.480384461415,  0.026576207082),
-        ( -0.480384461415, -0.733799385705,  0.480384461415,  0.026576207082),
-        (  0.480384461415,  0.733799385705, -0.480384461415,  0.026576207082),
-        ( -0.480384461415,  0.733799385705, -0.480384461415,  0.026576207082),
-        (  0.480384461415, -0.733799385705, -0.480384461415,  0.026576207082),
-        ( -0.480384461415, -0.733799385705, -0.480384461415,  0.026576207082),
-        (  0.733799385705,  0.480384461415,  0.480384461415,  0.026576207082),
-        ( -0.733799385705,  0.480384461415,  0.480384461415,  0.026576207082),
-        (  0.733799385705, -0.480384461415,  0.480384461415,  0.026576207082),
-        ( -0.733799385705, -0.480384461415,  0.480384461415,  0.026576207082),
-        (  0.733799385705,  0.480384461415, -0.480384461415,  0.026576207082),
-        ( -0.733799385705,  0.480384461415, -0.480384461415,  0.026576207082),
-        (  0.733799385705, -0.480384461415, -0.480384461415,  0.026576207082),
-        ( -0.733799385705, -0.480384461415, -0.480384461415,  0.026576207082),
-        (  0.320772648981,  0.947156221363,  0.000000000000,  0.016522170994),
-        ( -0.320772648981,  0.947156221363,  0.000000000000,  0.016522170994),
-        (  0.320772648981, -0.947156221363,  0.000000000000,  0.016522170994),
-        ( -0.320772648981, -0.947156221363,  0.000000000000,  0.016522170994),
-        (  0.947156221363,  0.320772648981,  0.000000000000,  0.016522170994),
-        ( -0.947156221363,  0.320772648981,  0.000000000000,  0.016522170994),
-        (  0.947156221363, -0.320772648981,  0.000000000000,  0.016522170994),
-        ( -0.947156221363, -0.320772648981,  0.000000000000,  0.016522170994),
-        (  0.320772648981,  0.000000000000,  0.947156221363,  0.016522170994),
-        ( -0.320772648981,  0.000000000000,  0.947156221363,  0.016522170994),
-        (  0.320772648981,  0.000000000000, -0.947156221363,  0.016522170994),
-        ( -0.320772648981,  0.000000000000, -0.947156221363,  0.016522170994),
-        (  0.947156221363,  0.000000000000,  0.320772648981,  0.016522170994),
-        ( -0.947156221363,  0.000000000000,  0.320772648981,  0.016522170994),
-        (  0.947156221363,  0.000000000000, -0.320772648981,  0.016522170994),
-        ( -0.947156221363,  0.000000000000, -0.320772648981,  0.016522170994),
-        (  0.000000000000,  0.320772648981,  0.947156221363,  0.016522170994),
-        (  0.000000000000, -0.320772648981,  0.947156221363,  0.016522170994),
-        (  0.000000000000,  0.320772648981, -0.947156221363,  0.016522170994),
-        (  0.000000000000, -0.320772648981, -0.947156221363,  0.016522170994),
-        (  0.000000000000,  0.947156221363,  0.320772648981,  0.016522170994),
-        (  0.000000000000, -0.947156221363,  0.320772648981,  0.016522170994),
-        (  0.000000000000,  0.947156221363, -0.320772648981,  0.016522170994),
-        (  0.000000000000, -0.947156221363, -0.320772648981,  0.016522170994),
-    ],
-    86 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.011544011544),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.011544011544),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.011544011544),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.011544011544),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.011544011544),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.011544011544),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.011943909086),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.011943909086),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.011943909086),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.011943909086),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.011943909086),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.011943909086),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.011943909086),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.011943909086),
-        (  0.369602846454,  0.369602846454,  0.852518311701,  0.011110555711),
-        ( -0.369602846454,  0.369602846454,  0.852518311701,  0.011110555711),
-        (  0.369602846454, -0.369602846454,  0.852518311701,  0.011110555711),
-        ( -0.369602846454, -0.369602846454,  0.852518311701,  0.011110555711),
-        (  0.369602846454,  0.369602846454, -0.852518311701,  0.011110555711),
-        ( -0.369602846454,  0.369602846454, -0.852518311701,  0.011110555711),
-        (  0.369602846454, -0.369602846454, -0.852518311701,  0.011110555711),
-        ( -0.369602846454, -0.369602846454, -0.852518311701,  0.011110555711),
-        (  0.369602846454,  0.852518311701,  0.369602846454,  0.011110555711),
-        ( -0.369602846454,  0.852518311701,  0.369602846454,  0.011110555711),
-        (  0.369602846454, -0.852518311701,  0.369602846454,  0.011110555711),
-        ( -0.369602846454, -0.852518311701,  0.369602846454,  0.011110555711),
-        (  0.369602846454,  0.852518311701, -0.369602846454,  0.011110555711),
-        ( -0.369602846454,  0.852518311701, -0.369602846454,  0.011110555711),
-        (  0.369602846454, -0.852518311701, -0.369602846454,  0.011110555711),
-        ( -0.369602846454, -0.852518311701, -0.369602846454,  0.011110555711),
-        (  0.852518311701,  0.369602846454,  0.369602846454,  0.011110555711),
-        ( -0.852518311701,  0.369602846454,  0.369602846454,  0.011110555711),
-        (  0.852518311701, -0.369602846454,  0.369602846454,  0.011110555711),
-        ( -0.852518311701, -0.369602846454,  0.369602846454,  0.011110555711),
-        (  0.852518311701,  0.369602846454, -0.369602846454,  0.011110555711),
-        ( -0.852518311701,  0.369602846454, -0.369602846454,  0.011110555711),
-        (  0.852518311701, -0.369602846454, -0.369602846454,  0.011110555711),
-        ( -0.852518311701, -0.369602846454, -0.369602846454,  0.011110555711),
-        (  0.694354006603,  0.694354006603,  0.189063552885,  0.011876501295),
-        ( -0.694354006603,  0.694354006603,  0.189063552885,  0.011876501295),
-        (  0.694354006603, -0.694354006603,  0.189063552885,  0.011876501295),
-        ( -0.694354006603, -0.694354006603,  0.189063552885,  0.011876501295),
-        (  0.694354006603,  0.694354006603, -0.189063552885,  0.011876501295),
-        ( -0.694354006603,  0.694354006603, -0.189063552885,  0.011876501295),
-        (  0.694354006603, -0.694354006603, -0.189063552885,  0.011876501295),
-        ( -0.694354006603, -0.694354006603, -0.189063552885,  0.011876501295),
-        (  0.694354006603,  0.189063552885,  0.694354006603,  0.011876501295),
-        ( -0.694354006603,  0.189063552885,  0.694354006603,  0.011876501295),
-        (  0.694354006603, -0.189063552885,  0.694354006603,  0.011876501295),
-        ( -0.694354006603, -0.189063552885,  0.694354006603,  0.011876501295),
-        (  0.694354006603,  0.189063552885, -0.694354006603,  0.011876501295),
-        ( -0.694354006603,  0.189063552885, -0.694354006603,  0.011876501295),
-        (  0.694354006603, -0.189063552885, -0.694354006603,  0.011876501295),
-        ( -0.694354006603, -0.189063552885, -0.694354006603,  0.011876501295),
-        (  0.189063552885,  0.694354006603,  0.694354006603,  0.011876501295),
-        ( -0.189063552885,  0.694354006603,  0.694354006603,  0.011876501295),
-        (  0.189063552885, -0.694354006603,  0.694354006603,  0.011876501295),
-        ( -0.189063552885, -0.694354006603,  0.694354006603,  0.011876501295),
-        (  0.189063552885,  0.694354006603, -0.694354006603,  0.011876501295),
-        ( -0.189063552885,  0.694354006603, -0.694354006603,  0.011876501295),
-        (  0.189063552885, -0.694354006603, -0.694354006603,  0.011876501295),
-        ( -0.189063552885, -0.694354006603, -0.694354006603,  0.011876501295),
-        (  0.374243039090,  0.927330657151,  0.000000000000,  0.011812303747),
-        ( -0.374243039090,  0.927330657151,  0.000000000000,  0.011812303747),
-        (  0.374243039090, -0.927330657151,  0.000000000000,  0.011812303747),
-        ( -0.374243039090, -0.927330657151,  0.000000000000,  0.011812303747),
-        (  0.927330657151,  0.374243039090,  0.000000000000,  0.011812303747),
-        ( -0.927330657151,  0.374243039090,  0.000000000000,  0.011812303747),
-        (  0.927330657151, -0.374243039090,  0.000000000000,  0.011812303747),
-        ( -0.927330657151, -0.374243039090,  0.000000000000,  0.011812303747),
-        (  0.374243039090,  0.000000000000,  0.927330657151,  0.011812303747),
-        ( -0.374243039090,  0.000000000000,  0.927330657151,  0.011812303747),
-        (  0.374243039090,  0.000000000000, -0.927330657151,  0.011812303747),
-        ( -0.374243039090,  0.000000000000, -0.927330657151,  0.011812303747),
-        (  0.927330657151,  0.000000000000,  0.374243039090,  0.011812303747),
-        ( -0.927330657151,  0.000000000000,  0.374243039090,  0.011812303747),
-        (  0.927330657151,  0.000000000000, -0.374243039090,  0.011812303747),
-        ( -0.927330657151,  0.000000000000, -0.374243039090,  0.011812303747),
-        (  0.000000000000,  0.374243039090,  0.927330657151,  0.011812303747),
-        (  0.000000000000, -0.374243039090,  0.927330657151,  0.011812303747),
-        (  0.000000000000,  0.374243039090, -0.927330657151,  0.011812303747),
-        (  0.000000000000, -0.374243039090, -0.927330657151,  0.011812303747),
-        (  0.000000000000,  0.927330657151,  0.374243039090,  0.011812303747),
-        (  0.000000000000, -0.927330657151,  0.374243039090,  0.011812303747),
-        (  0.000000000000,  0.927330657151, -0.374243039090,  0.011812303747),
-        (  0.000000000000, -0.927330657151, -0.374243039090,  0.011812303747),
-    ],
-    110 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.003828270495),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.003828270495),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.003828270495),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.003828270495),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.003828270495),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.003828270495),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.009793737512),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.009793737512),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.009793737512),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.009793737512),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.009793737512),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.009793737512),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.009793737512),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.009793737512),
-        (  0.185115635345,  0.185115635345,  0.965124035087,  0.008211737283),
-        ( -0.185115635345,  0.185115635345,  0.965124035087,  0.008211737283),
-        (  0.185115635345, -0.185115635345,  0.965124035087,  0.008211737283),
-        ( -0.185115635345, -0.185115635345,  0.965124035087,  0.008211737283),
-        (  0.185115635345,  0.185115635345, -0.965124035087,  0.008211737283),
-        ( -0.185115635345,  0.185115635345, -0.965124035087,  0.008211737283),
-        (  0.185115635345, -0.185115635345, -0.965124035087,  0.008211737283),
-        ( -0.185115635345, -0.185115635345, -0.965124035087,  0.008211737283),
-        (  0.185115635345,  0.965124035087,  0.185115635345,  0.008211737283),
-        ( -0.185115635345,  0.965124035087,  0.185115635345,  0.008211737283),
-        (  0.185115635345, -0.965124035087,  0.185115635345,  0.008211737283),
-        ( -0.185115635345, -0.965124035087,  0.185115635345,  0.008211737283),
-        (  0.185115635345,  0.965124035087, -0.185115635345,  0.008211737283),
-        ( -0.185115635345,  0.965124035087, -0.185115635345,  0.008211737283),
-        (  0.185115635345, -0.965124035087, -0.185115635345,  0.008211737283),
-        ( -0.185115635345, -0.965124035087, -0.185115635345,  0.008211737283),
-        (  0.965124035087,  0.185115635345,  0.185115635345,  0.008211737283),
-        ( -0.965124035087,  0.185115635345,  0.185115635345,  0.008211737283),
-        (  0.965124035087, -0.185115635345,  0.185115635345,  0.008211737283),
-        ( -0.965124035087, -0.185115635345,  0.185115635345,  0.008211737283),
-        (  0.965124035087,  0.185115635345, -0.185115635345,  0.008211737283),
-        ( -0.965124035087,  0.185115635345, -0.185115635345,  0.008211737283),
-        (  0.965124035087, -0.185115635345, -0.185115635345,  0.008211737283),
-        ( -0.965124035087, -0.185115635345, -0.185115635345,  0.008211737283),
-        (  0.690421048382,  0.690421048382,  0.215957291846,  0.009942814891),
-        ( -0.690421048382,  0.690421048382,  0.215957291846,  0.009942814891),
-        (  0.690421048382, -0.690421048382,  0.215957291846,  0.009942814891),
-        ( -0.690421048382, -0.690421048382,  0.215957291846,  0.009942814891),
-        (  0.690421048382,  0.690421048382, -0.215957291846,  0.009942814891),
-        ( -0.690421048382,  0.690421048382, -0.215957291846,  0.009942814891),
-        (  0.690421048382, -0.690421048382, -0.215957291846,  0.009942814891),
-        ( -0.690421048382, -0.690421048382, -0.215957291846,  0.009942814891),
-        (  0.690421048382,  0.215957291846,  0.690421048382,  0.009942814891),
-        ( -0.690421048382,  0.215957291846,  0.690421048382,  0.009942814891),
-        (  0.690421048382, -0.215957291846,  0.690421048382,  0.009942814891),
-        ( -0.690421048382, -0.215957291846,  0.690421048382,  0.009942814891),
-        (  0.690421048382,  0.215957291846, -0.690421048382,  0.009942814891),
-        ( -0.690421048382,  0.215957291846, -0.690421048382,  0.009942814891),
-        (  0.690421048382, -0.215957291846, -0.690421048382,  0.009942814891),
-        ( -0.690421048382, -0.215957291846, -0.690421048382,  0.009942814891),
-        (  0.215957291846,  0.690421048382,  0.690421048382,  0.009942814891),
-        ( -0.215957291846,  0.690421048382,  0.690421048382,  0.009942814891),
-        (  0.215957291846, -0.690421048382,  0.690421048382,  0.009942814891),
-        ( -0.215957291846, -0.690421048382,  0.690421048382,  0.009942814891),
-        (  0.215957291846,  0.690421048382, -0.690421048382,  0.009942814891),
-        ( -0.215957291846,  0.690421048382, -0.690421048382,  0.009942814891),
-        (  0.215957291846, -0.690421048382, -0.690421048382,  0.009942814891),
-        ( -0.215957291846, -0.690421048382, -0.690421048382,  0.009942814891),
-        (  0.395689473056,  0.395689473056,  0.828769981253,  0.009595471336),
-        ( -0.395689473056,  0.395689473056,  0.828769981253,  0.009595471336),
-        (  0.395689473056, -0.395689473056,  0.828769981253,  0.009595471336),
-        ( -0.395689473056, -0.395689473056,  0.828769981253,  0.009595471336),
-        (  0.395689473056,  0.395689473056, -0.828769981253,  0.009595471336),
-        ( -0.395689473056,  0.395689473056, -0.828769981253,  0.009595471336),
-        (  0.395689473056, -0.395689473056, -0.828769981253,  0.009595471336),
-        ( -0.395689473056, -0.395689473056, -0.828769981253,  0.009595471336),
-        (  0.395689473056,  0.828769981253,  0.395689473056,  0.009595471336),
-        ( -0.395689473056,  0.828769981253,  0.395689473056,  0.009595471336),
-        (  0.395689473056, -0.828769981253,  0.395689473056,  0.009595471336),
-        ( -0.395689473056, -0.828769981253,  0.395689473056,  0.009595471336),
-        (  0.395689473056,  0.828769981253, -0.395689473056,  0.009595471336),
-        ( -0.395689473056,  0.828769981253, -0.395689473056,  0.009595471336),
-        (  0.395689473056, -0.828769981253, -0.395689473056,  0.009595471336),
-        ( -0.395689473056, -0.828769981253, -0.395689473056,  0.009595471336),
-        (  0.828769981253,  0.395689473056,  0.395689473056,  0.009595471336),
-        ( -0.828769981253,  0.395689473056,  0.395689473056,  0.009595471336),
-        (  0.828769981253, -0.395689473056,  0.395689473056,  0.009595471336),
-        ( -0.828769981253, -0.395689473056,  0.395689473056,  0.009595471336),
-        (  0.828769981253,  0.395689473056, -0.395689473056,  0.009595471336),
-        ( -0.828769981253,  0.395689473056, -0.395689473056,  0.009595471336),
-        (  0.828769981253, -0.395689473056, -0.395689473056,  0.009595471336),
-        ( -0.828769981253, -0.395689473056, -0.395689473056,  0.009595471336),
-        (  0.478369028812,  0.878158910604,  0.000000000000,  0.009694996362),
-        ( -0.478369028812,  0.878158910604,  0.000000000000,  0.009694996362),
-        (  0.478369028812, -0.878158910604,  0.000000000000,  0.009694996362),
-        ( -0.478369028812, -0.878158910604,  0.000000000000,  0.009694996362),
-        (  0.878158910604,  0.478369028812,  0.000000000000,  0.009694996362),
-        ( -0.878158910604,  0.478369028812,  0.000000000000,  0.009694996362),
-        (  0.878158910604, -0.478369028812,  0.000000000000,  0.009694996362),
-        ( -0.878158910604, -0.478369028812,  0.000000000000,  0.009694996362),
-        (  0.478369028812,  0.000000000000,  0.878158910604,  0.009694996362),
-        ( -0.478369028812,  0.000000000000,  0.878158910604,  0.009694996362),
-        (  0.478369028812,  0.000000000000, -0.878158910604,  0.009694996362),
-        ( -0.478369028812,  0.000000000000, -0.878158910604,  0.009694996362),
-        (  0.878158910604,  0.000000000000,  0.478369028812,  0.009694996362),
-        ( -0.878158910604,  0.000000000000,  0.478369028812,  0.009694996362),
-        (  0.878158910604,  0.000000000000, -0.478369028812,  0.009694996362),
-        ( -0.878158910604,  0.000000000000, -0.478369028812,  0.009694996362),
-        (  0.000000000000,  0.478369028812,  0.878158910604,  0.009694996362),
-        (  0.000000000000, -0.478369028812,  0.878158910604,  0.009694996362),
-        (  0.000000000000,  0.478369028812, -0.878158910604,  0.009694996362),
-        (  0.000000000000, -0.478369028812, -0.878158910604,  0.009694996362),
-        (  0.000000000000,  0.878158910604,  0.478369028812,  0.009694996362),
-        (  0.000000000000, -0.878158910604,  0.478369028812,  0.009694996362),
-        (  0.000000000000,  0.878158910604, -0.478369028812,  0.009694996362),
-        (  0.000000000000, -0.878158910604, -0.478369028812,  0.009694996362),
-    ],
-    146 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.000599631369),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.000599631369),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.000599631369),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.000599631369),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.000599631369),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.000599631369),
-        (  0.000000000000,  0.707106781187,  0.707106781187,  0.007372999719),
-        (  0.000000000000, -0.707106781187,  0.707106781187,  0.007372999719),
-        (  0.000000000000,  0.707106781187, -0.707106781187,  0.007372999719),
-        (  0.000000000000, -0.707106781187, -0.707106781187,  0.007372999719),
-        (  0.707106781187,  0.000000000000,  0.707106781187,  0.007372999719),
-        ( -0.707106781187,  0.000000000000,  0.707106781187,  0.007372999719),
-        (  0.707106781187,  0.000000000000, -0.707106781187,  0.007372999719),
-        ( -0.707106781187,  0.000000000000, -0.707106781187,  0.007372999719),
-        (  0.707106781187,  0.707106781187,  0.000000000000,  0.007372999719),
-        ( -0.707106781187,  0.707106781187,  0.000000000000,  0.007372999719),
-        (  0.707106781187, -0.707106781187,  0.000000000000,  0.007372999719),
-        ( -0.707106781187, -0.707106781187,  0.000000000000,  0.007372999719),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.007210515360),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.007210515360),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.007210515360),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.007210515360),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.007210515360),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.007210515360),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.007210515360),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.007210515360),
-        (  0.676441040011,  0.676441040011,  0.291298882210,  0.007116355493),
-        ( -0.676441040011,  0.676441040011,  0.291298882210,  0.007116355493),
-        (  0.676441040011, -0.676441040011,  0.291298882210,  0.007116355493),
-        ( -0.676441040011, -0.676441040011,  0.291298882210,  0.007116355493),
-        (  0.676441040011,  0.676441040011, -0.291298882210,  0.007116355493),
-        ( -0.676441040011,  0.676441040011, -0.291298882210,  0.007116355493),
-        (  0.676441040011, -0.676441040011, -0.291298882210,  0.007116355493),
-        ( -0.676441040011, -0.676441040011, -0.291298882210,  0.007116355493),
-        (  0.676441040011,  0.291298882210,  0.676441040011,  0.007116355493),
-        ( -0.676441040011,  0.291298882210,  0.676441040011,  0.007116355493),
-        (  0.676441040011, -0.291298882210,  0.676441040011,  0.007116355493),
-        ( -0.676441040011, -0.291298882210,  0.676441040011,  0.007116355493),
-        (  0.676441040011,  0.291298882210, -0.676441040011,  0.007116355493),
-        ( -0.676441040011,  0.291298882210, -0.676441040011,  0.007116355493),
-        (  0.676441040011, -0.291298882210, -0.676441040011,  0.007116355493),
-        ( -0.676441040011, -0.291298882210, -0.676441040011,  0.007116355493),
-        (  0.291298882210,  0.676441040011,  0.676441040011,  0.007116355493),
-        ( -0.291298882210,  0.676441040011,  0.676441040011,  0.007116355493),
-        (  0.291298882210, -0.676441040011,  0.676441040011,  0.007116355493),
-        ( -0.291298882210, -0.676441040011,  0.676441040011,  0.007116355493),
-        (  0.291298882210,  0.676441040011, -0.676441040011,  0.007116355493),
-        ( -0.291298882210,  0.676441040011, -0.676441040011,  0.007116355493),
-        (  0.291298882210, -0.676441040011, -0.676441040011,  0.007116355493),
-        ( -0.291298882210, -0.676441040011, -0.676441040011,  0.007116355493),
-        (  0.417496122797,  0.417496122797,  0.807089818360,  0.006753829486),
-        ( -0.417496122797,  0.417496122797,  0.807089818360,  0.006753829486),
-        (  0.417496122797, -0.417496122797,  0.807089818360,  0.006753829486),
-        ( -0.417496122797, -0.417496122797,  0.807089818360,  0.006753829486),
-        (  0.417496122797,  0.417496122797, -0.807089818360,  0.006753829486),
-        ( -0.417496122797,  0.417496122797, -0.807089818360,  0.006753829486),
-        (  0.417496122797, -0.417496122797, -0.807089818360,  0.006753829486),
-        ( -0.417496122797, -0.417496122797, -0.807089818360,  0.006753829486),
-        (  0.417496122797,  0.807089818360,  0.417496122797,  0.006753829486),
-        ( -0.417496122797,  0.807089818360,  0.417496122797,  0.006753829486),
-        (  0.417496122797, -0.807089818360,  0.417496122797,  0.006753829486),
-        ( -0.417496122797, -0.807089818360,  0.417496122797,  0.006753829486),
-        (  0.417496122797,  0.807089818360, -0.417496122797,  0.006753829486),
-        ( -0.417496122797,  0.807089818360, -0.417496122797,  0.006753829486),
-        (  0.417496122797, -0.807089818360, -0.417496122797,  0.006753829486),
-        ( -0.417496122797, -0.807089818360, -0.417496122797,  0.006753829486),
-        (  0.807089818360,  0.417496122797,  0.417496122797,  0.006753829486),
-        ( -0.807089818360,  0.417496122797,  0.417496122797,  0.006753829486),
-        (  0.807089818360, -0.417496122797,  0.417496122797,  0.006753829486),
-        ( -0.807089818360, -0.417496122797,  0.417496122797,  0.006753829486),
-        (  0.807089818360,  0.417496122797, -0.417496122797,  0.006753829486),
-        ( -0.807089818360,  0.417496122797, -0.417496122797,  0.006753829486),
-        (  0.807089818360, -0.417496122797, -0.417496122797,  0.006753829486),
-        ( -0.807089818360, -0.417496122797, -0.417496122797,  0.006753829486),
-        (  0.157467667204,  0.157467667204,  0.974888643677,  0.007574394159),
-        ( -0.157467667204,  0.157467667204,  0.974888643677,  0.007574394159),
-        (  0.157467667204, -0.157467667204,  0.974888643677,  0.007574394159),
-        ( -0.157467667204, -0.157467667204,  0.974888643677,  0.007574394159),
-        (  0.157467667204,  0.157467667204, -0.974888643677,  0.007574394159),
-        ( -0.157467667204,  0.157467667204, -0.974888643677,  0.007574394159),
-        (  0.157467667204, -0.157467667204, -0.974888643677,  0.007574394159),
-        ( -0.157467667204, -0.157467667204, -0.974888643677,  0.007574394159),
-        (  0.157467667204,  0.974888643677,  0.157467667204,  0.007574394159),
-        ( -0.157467667204,  0.974888643677,  0.157467667204,  0.007574394159),
-        (  0.157467667204, -0.974888643677,  0.157467667204,  0.007574394159),
-        ( -0.157467667204, -0.974888643677,  0.157467667204,  0.007574394159),
-        (  0.157467667204,  0.974888643677, -0.157467667204,  0.007574394159),
-        ( -0.157467667204,  0.974888643677, -0.157467667204,  0.007574394159),
-        (  0.157467667204, -0.974888643677, -0.157467667204,  0.007574394159),
-        ( -0.157467667204, -0.974888643677, -0.157467667204,  0.007574394159),
-        (  0.974888643677,  0.157467667204,  0.157467667204,  0.007574394159),
-        ( -0.974888643677,  0.157467667204,  0.157467667204,  0.007574394159),
-        (  0.974888643677, -0.157467667204,  0.157467667204,  0.007574394159),
-        ( -0.974888643677, -0.157467667204,  0.157467667204,  0.007574394159),
-        (  0.974888643677,  0.157467667204, -0.157467667204,  0.007574394159),
-        ( -0.974888643677,  0.157467667204, -0.157467667204,  0.007574394159),
-        (  0.974888643677, -0.157467667204, -0.157467667204,  0.007574394159),
-        ( -0.974888643677, -0.157467667204, -0.157467667204,  0.007574394159),
-        (  0.140355381171,  0.449332832327,  0.882270011260,  0.006991087353),
-        ( -0.140355381171,  0.449332832327,  0.882270011260,  0.006991087353),
-        (  0.140355381171, -0.449332832327,  0.882270011260,  0.006991087353),
-        ( -0.140355381171, -0.449332832327,  0.882270011260,  0.006991087353),
-        (  0.140355381171,  0.449332832327, -0.882270011260,  0.006991087353),
-        ( -0.140355381171,  0.449332832327, -0.882270011260,  0.006991087353),
-        (  0.140355381171, -0.449332832327, -0.882270011260,  0.006991087353),
-        ( -0.140355381171, -0.449332832327, -0.882270011260,  0.006991087353),
-        (  0.140355381171,  0.882270011260,  0.449332832327,  0.006991087353),
-        ( -0.140355381171,  0.882270011260,  0.449332832327,  0.006991087353),
-        (  0.140355381171, -0.882270011260,  0.449332832327,  0.006991087353),
-        ( -0.140355381171, -0.882270011260,  0.449332832327,  0.006991087353),
-        (  0.140355381171,  0.882270011260, -0.449332832327,  0.006991087353),
-        ( -0.140355381171,  0.882270011260, -0.449332832327,  0.006991087353),
-        (  0.140355381171, -0.882270011260, -0.449332832327,  0.006991087353),
-        ( -0.140355381171, -0.882270011260, -0.449332832327,  0.006991087353),
-        (  0.449332832327,  0.140355381171,  0.882270011260,  0.006991087353),
-        ( -0.449332832327,  0.140355381171,  0.882270011260,  0.006991087353),
-        (  0.449332832327, -0.140355381171,  0.882270011260,  0.006991087353),
-        ( -0.449332832327, -0.140355381171,  0.882270011260,  0.006991087353),
-        (  0.449332832327,  0.140355381171, -0.882270011260,  0.006991087353),
-        ( -0.449332832327,  0.140355381171, -0.882270011260,  0.006991087353),
-        (  0.449332832327, -0.140355381171, -0.882270011260,  0.006991087353),
-        ( -0.449332832327, -0.140355381171, -0.882270011260,  0.006991087353),
-        (  0.449332832327,  0.882270011260,  0.140355381171,  0.006991087353),
-        ( -0.449332832327,  0.882270011260,  0.140355381171,  0.006991087353),
-        (  0.449332832327, -0.882270011260,  0.140355381171,  0.006991087353),
-        ( -0.449332832327, -0.882270011260,  0.140355381171,  0.006991087353),
-        (  0.449332832327,  0.882270011260, -0.140355381171,  0.006991087353),
-        ( -0.449332832327,  0.882270011260, -0.140355381171,  0.006991087353),
-        (  0.449332832327, -0.882270011260, -0.140355381171,  0.006991087353),
-        ( -0.449332832327, -0.882270011260, -0.140355381171,  0.006991087353),
-        (  0.882270011260,  0.140355381171,  0.449332832327,  0.006991087353),
-        ( -0.882270011260,  0.140355381171,  0.449332832327,  0.006991087353),
-        (  0.882270011260, -0.140355381171,  0.449332832327,  0.006991087353),
-        ( -0.882270011260, -0.140355381171,  0.449332832327,  0.006991087353),
-        (  0.882270011260,  0.140355381171, -0.449332832327,  0.006991087353),
-        ( -0.882270011260,  0.140355381171, -0.449332832327,  0.006991087353),
-        (  0.882270011260, -0.140355381171, -0.449332832327,  0.006991087353),
-        ( -0.882270011260, -0.140355381171, -0.449332832327,  0.006991087353),
-        (  0.882270011260,  0.449332832327,  0.140355381171,  0.006991087353),
-        ( -0.882270011260,  0.449332832327,  0.140355381171,  0.006991087353),
-        (  0.882270011260, -0.449332832327,  0.140355381171,  0.006991087353),
-        ( -0.882270011260, -0.449332832327,  0.140355381171,  0.006991087353),
-        (  0.882270011260,  0.449332832327, -0.140355381171,  0.006991087353),
-        ( -0.882270011260,  0.449332832327, -0.140355381171,  0.006991087353),
-        (  0.882270011260, -0.449332832327, -0.140355381171,  0.006991087353),
-        ( -0.882270011260, -0.449332832327, -0.140355381171,  0.006991087353),
-    ],
-    170 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.005544842902),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.005544842902),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.005544842902),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.005544842902),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.005544842902),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.005544842902),
-        (  0.000000000000,  0.707106781187,  0.707106781187,  0.006071332771),
-        (  0.000000000000, -0.707106781187,  0.707106781187,  0.006071332771),
-        (  0.000000000000,  0.707106781187, -0.707106781187,  0.006071332771),
-        (  0.000000000000, -0.707106781187, -0.707106781187,  0.006071332771),
-        (  0.707106781187,  0.000000000000,  0.707106781187,  0.006071332771),
-        ( -0.707106781187,  0.000000000000,  0.707106781187,  0.006071332771),
-        (  0.707106781187,  0.000000000000, -0.707106781187,  0.006071332771),
-        ( -0.707106781187,  0.000000000000, -0.707106781187,  0.006071332771),
-        (  0.707106781187,  0.707106781187,  0.000000000000,  0.006071332771),
-        ( -0.707106781187,  0.707106781187,  0.000000000000,  0.006071332771),
-        (  0.707106781187, -0.707106781187,  0.000000000000,  0.006071332771),
-        ( -0.707106781187, -0.707106781187,  0.000000000000,  0.006071332771),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.006383674774),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.006383674774),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.006383674774),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.006383674774),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.006383674774),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.006383674774),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.006383674774),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.006383674774),
-        (  0.255125262111,  0.255125262111,  0.932642590313,  0.005183387588),
-        ( -0.255125262111,  0.255125262111,  0.932642590313,  0.005183387588),
-        (  0.255125262111, -0.255125262111,  0.932642590313,  0.005183387588),
-        ( -0.255125262111, -0.255125262111,  0.932642590313,  0.005183387588),
-        (  0.255125262111,  0.255125262111, -0.932642590313,  0.005183387588),
-        ( -0.255125262111,  0.255125262111, -0.932642590313,  0.005183387588),
-        (  0.255125262111, -0.255125262111, -0.932642590313,  0.005183387588),
-        ( -0.255125262111, -0.255125262111, -0.932642590313,  0.005183387588),
-        (  0.255125262111,  0.932642590313,  0.255125262111,  0.005183387588),
-        ( -0.255125262111,  0.932642590313,  0.255125262111,  0.005183387588),
-        (  0.255125262111, -0.932642590313,  0.255125262111,  0.005183387588),
-        ( -0.255125262111, -0.932642590313,  0.255125262111,  0.005183387588),
-        (  0.255125262111,  0.932642590313, -0.255125262111,  0.005183387588),
-        ( -0.255125262111,  0.932642590313, -0.255125262111,  0.005183387588),
-        (  0.255125262111, -0.932642590313, -0.255125262111,  0.005183387588),
-        ( -0.255125262111, -0.932642590313, -0.255125262111,  0.005183387588),
-        (  0.932642590313,  0.255125262111,  0.255125262111,  0.005183387588),
-        ( -0.932642590313,  0.255125262111,  0.255125262111,  0.005183387588),
-        (  0.932642590313, -0.255125262111,  0.255125262111,  0.005183387588),
-        ( -0.932642590313, -0.255125262111,  0.255125262111,  0.005183387588),
-        (  0.932642590313,  0.255125262111, -0.255125262111,  0.005183387588),
-        ( -0.932642590313,  0.255125262111, -0.255125262111,  0.005183387588),
-        (  0.932642590313, -0.255125262111, -0.255125262111,  0.005183387588),
-        ( -0.932642590313, -0.255125262111, -0.255125262111,  0.005183387588),
-        (  0.674360146036,  0.674360146036,  0.300793595138,  0.006317929010),
-        ( -0.674360146036,  0.674360146036,  0.300793595138,  0.006317929010),
-        (  0.674360146036, -0.674360146036,  0.300793595138,  0.006317929010),
-        ( -0.674360146036, -0.674360146036,  0.300793595138,  0.006317929010),
-        (  0.674360146036,  0.674360146036, -0.300793595138,  0.006317929010),
-        ( -0.674360146036,  0.674360146036, -0.300793595138,  0.006317929010),
-        (  0.674360146036, -0.674360146036, -0.300793595138,  0.006317929010),
-        ( -0.674360146036, -0.674360146036, -0.300793595138,  0.006317929010),
-        (  0.674360146036,  0.300793595138,  0.674360146036,  0.006317929010),
-        ( -0.674360146036,  0.300793595138,  0.674360146036,  0.006317929010),
-        (  0.674360146036, -0.300793595138,  0.674360146036,  0.006317929010),
-        ( -0.674360146036, -0.300793595138,  0.674360146036,  0.006317929010),
-        (  0.674360146036,  0.300793595138, -0.674360146036,  0.006317929010),
-        ( -0.674360146036,  0.300793595138, -0.674360146036,  0.006317929010),
-        (  0.674360146036, -0.300793595138, -0.674360146036,  0.006317929010),
-        ( -0.674360146036, -0.300793595138, -0.674360146036,  0.006317929010),
-        (  0.300793595138,  0.674360146036,  0.674360146036,  0.006317929010),
-        ( -0.300793595138,  0.674360146036,  0.674360146036,  0.006317929010),
-        (  0.300793595138, -0.674360146036,  0.674360146036,  0.006317929010),
-        ( -0.300793595138, -0.674360146036,  0.674360146036,  0.006317929010),
-        (  0.300793595138,  0.674360146036, -0.674360146036,  0.006317929010),
-        ( -0.300793595138,  0.674360146036, -0.674360146036,  0.006317929010),
-        (  0.300793595138, -0.674360146036, -0.674360146036,  0.006317929010),
-        ( -0.300793595138, -0.674360146036, -0.674360146036,  0.006317929010),
-        (  0.431891069672,  0.431891069672,  0.791795559393,  0.006201670007),
-        ( -0.431891069672,  0.431891069672,  0.791795559393,  0.006201670007),
-        (  0.431891069672, -0.431891069672,  0.791795559393,  0.006201670007),
-        ( -0.431891069672, -0.431891069672,  0.791795559393,  0.006201670007),
-        (  0.431891069672,  0.431891069672, -0.791795559393,  0.006201670007),
-        ( -0.431891069672,  0.431891069672, -0.791795559393,  0.006201670007),
-        (  0.431891069672, -0.431891069672, -0.791795559393,  0.006201670007),
-        ( -0.431891069672, -0.431891069672, -0.791795559393,  0.006201670007),
-        (  0.431891069672,  0.791795559393,  0.431891069672,  0.006201670007),
-        ( -0.431891069672,  0.791795559393,  0.431891069672,  0.006201670007),
-        (  0.431891069672, -0.791795559393,  0.431891069672,  0.006201670007),
-        ( -0.431891069672, -0.791795559393,  0.431891069672,  0.006201670007),
-        (  0.431891069672,  0.791795559393, -0.431891069672,  0.006201670007),
-        ( -0.431891069672,  0.791795559393, -0.431891069672,  0.006201670007),
-        (  0.431891069672, -0.791795559393, -0.431891069672,  0.006201670007),
-        ( -0.431891069672, -0.791795559393, -0.431891069672,  0.006201670007),
-        (  0.791795559393,  0.431891069672,  0.431891069672,  0.006201670007),
-        ( -0.791795559393,  0.431891069672,  0.431891069672,  0.006201670007),
-        (  0.791795559393, -0.431891069672,  0.431891069672,  0.006201670007),
-        ( -0.791795559393, -0.431891069672,  0.431891069672,  0.006201670007),
-        (  0.791795559393,  0.431891069672, -0.431891069672,  0.006201670007),
-        ( -0.791795559393,  0.431891069672, -0.431891069672,  0.006201670007),
-        (  0.791795559393, -0.431891069672, -0.431891069672,  0.006201670007),
-        ( -0.791795559393, -0.431891069672, -0.431891069672,  0.006201670007),
-        (  0.261393136034,  0.965232421976,  0.000000000000,  0.005477143385),
-        ( -0.261393136034,  0.965232421976,  0.000000000000,  0.005477143385),
-        (  0.261393136034, -0.965232421976,  0.000000000000,  0.005477143385),
-        ( -0.261393136034, -0.965232421976,  0.000000000000,  0.005477143385),
-        (  0.965232421976,  0.261393136034,  0.000000000000,  0.005477143385),
-        ( -0.965232421976,  0.261393136034,  0.000000000000,  0.005477143385),
-        (  0.965232421976, -0.261393136034,  0.000000000000,  0.005477143385),
-        ( -0.965232421976, -0.261393136034,  0.000000000000,  0.005477143385),
-        (  0.261393136034,  0.000000000000,  0.965232421976,  0.005477143385),
-        ( -0.261393136034,  0.000000000000,  0.965232421976,  0.005477143385),
-        (  0.261393136034,  0.000000000000, -0.965232421976,  0.005477143385),
-        ( -0.261393136034,  0.000000000000, -0.965232421976,  0.005477143385),
-        (  0.965232421976,  0.000000000000,  0.261393136034,  0.005477143385),
-        ( -0.965232421976,  0.000000000000,  0.261393136034,  0.005477143385),
-        (  0.965232421976,  0.000000000000, -0.261393136034,  0.005477143385),
-        ( -0.965232421976,  0.000000000000, -0.261393136034,  0.005477143385),
-        (  0.000000000000,  0.261393136034,  0.965232421976,  0.005477143385),
-        (  0.000000000000, -0.261393136034,  0.965232421976,  0.005477143385),
-        (  0.000000000000,  0.261393136034, -0.965232421976,  0.005477143385),
-        (  0.000000000000, -0.261393136034, -0.965232421976,  0.005477143385),
-        (  0.000000000000,  0.965232421976,  0.261393136034,  0.005477143385),
-        (  0.000000000000, -0.965232421976,  0.261393136034,  0.005477143385),
-        (  0.000000000000,  0.965232421976, -0.261393136034,  0.005477143385),
-        (  0.000000000000, -0.965232421976, -0.261393136034,  0.005477143385),
-        (  0.499045316180,  0.144663074433,  0.854415804685,  0.005968383988),
-        ( -0.499045316180,  0.144663074433,  0.854415804685,  0.005968383988),
-        (  0.499045316180, -0.144663074433,  0.854415804685,  0.005968383988),
-        ( -0.499045316180, -0.144663074433,  0.854415804685,  0.005968383988),
-        (  0.499045316180,  0.144663074433, -0.854415804685,  0.005968383988),
-        ( -0.499045316180,  0.144663074433, -0.854415804685,  0.005968383988),
-        (  0.499045316180, -0.144663074433, -0.854415804685,  0.005968383988),
-        ( -0.499045316180, -0.144663074433, -0.854415804685,  0.005968383988),
-        (  0.499045316180,  0.854415804685,  0.144663074433,  0.005968383988),
-        ( -0.499045316180,  0.854415804685,  0.144663074433,  0.005968383988),
-        (  0.499045316180, -0.854415804685,  0.144663074433,  0.005968383988),
-        ( -0.499045316180, -0.854415804685,  0.144663074433,  0.005968383988),
-        (  0.499045316180,  0.854415804685, -0.144663074433,  0.005968383988),
-        ( -0.499045316180,  0.854415804685, -0.144663074433,  0.005968383988),
-        (  0.499045316180, -0.854415804685, -0.144663074433,  0.005968383988),
-        ( -0.499045316180, -0.854415804685, -0.144663074433,  0.005968383988),
-        (  0.144663074433,  0.499045316180,  0.854415804685,  0.005968383988),
-        ( -0.144663074433,  0.499045316180,  0.854415804685,  0.005968383988),
-        (  0.144663074433, -0.499045316180,  0.854415804685,  0.005968383988),
-        ( -0.144663074433, -0.499045316180,  0.854415804685,  0.005968383988),
-        (  0.144663074433,  0.499045316180, -0.854415804685,  0.005968383988),
-        ( -0.144663074433,  0.499045316180, -0.854415804685,  0.005968383988),
-        (  0.144663074433, -0.499045316180, -0.854415804685,  0.005968383988),
-        ( -0.144663074433, -0.499045316180, -0.854415804685,  0.005968383988),
-        (  0.144663074433,  0.854415804685,  0.499045316180,  0.005968383988),
-        ( -0.144663074433,  0.854415804685,  0.499045316180,  0.005968383988),
-        (  0.144663074433, -0.854415804685,  0.499045316180,  0.005968383988),
-        ( -0.144663074433, -0.854415804685,  0.499045316180,  0.005968383988),
-        (  0.144663074433,  0.854415804685, -0.499045316180,  0.005968383988),
-        ( -0.144663074433,  0.854415804685, -0.499045316180,  0.005968383988),
-        (  0.144663074433, -0.854415804685, -0.499045316180,  0.005968383988),
-        ( -0.144663074433, -0.854415804685, -0.499045316180,  0.005968383988),
-        (  0.854415804685,  0.499045316180,  0.144663074433,  0.005968383988),
-        ( -0.854415804685,  0.499045316180,  0.144663074433,  0.005968383988),
-        (  0.854415804685, -0.499045316180,  0.144663074433,  0.005968383988),
-        ( -0.854415804685, -0.499045316180,  0.144663074433,  0.005968383988),
-        (  0.854415804685,  0.499045316180, -0.144663074433,  0.005968383988),
-        ( -0.854415804685,  0.499045316180, -0.144663074433,  0.005968383988),
-        (  0.854415804685, -0.499045316180, -0.144663074433,  0.005968383988),
-        ( -0.854415804685, -0.499045316180, -0.144663074433,  0.005968383988),
-        (  0.854415804685,  0.144663074433,  0.499045316180,  0.005968383988),
-        ( -0.854415804685,  0.144663074433,  0.499045316180,  0.005968383988),
-        (  0.854415804685, -0.144663074433,  0.499045316180,  0.005968383988),
-        ( -0.854415804685, -0.144663074433,  0.499045316180,  0.005968383988),
-        (  0.854415804685,  0.144663074433, -0.499045316180,  0.005968383988),
-        ( -0.854415804685,  0.144663074433, -0.499045316180,  0.005968383988),
-        (  0.854415804685, -0.144663074433, -0.499045316180,  0.005968383988),
-        ( -0.854415804685, -0.144663074433, -0.499045316180,  0.005968383988),
-    ],
-    194 : [
-        (  1.000000000000,  0.000000000000,  0.000000000000,  0.001782340447),
-        ( -1.000000000000,  0.000000000000,  0.000000000000,  0.001782340447),
-        (  0.000000000000,  1.000000000000,  0.000000000000,  0.001782340447),
-        (  0.000000000000, -1.000000000000,  0.000000000000,  0.001782340447),
-        (  0.000000000000,  0.000000000000,  1.000000000000,  0.001782340447),
-        (  0.000000000000,  0.000000000000, -1.000000000000,  0.001782340447),
-        (  0.000000000000,  0.707106781187,  0.707106781187,  0.005716905950),
-        (  0.000000000000, -0.707106781187,  0.707106781187,  0.005716905950),
-        (  0.000000000000,  0.707106781187, -0.707106781187,  0.005716905950),
-        (  0.000000000000, -0.707106781187, -0.707106781187,  0.005716905950),
-        (  0.707106781187,  0.000000000000,  0.707106781187,  0.005716905950),
-        ( -0.707106781187,  0.000000000000,  0.707106781187,  0.005716905950),
-        (  0.707106781187,  0.000000000000, -0.707106781187,  0.005716905950),
-        ( -0.707106781187,  0.000000000000, -0.707106781187,  0.005716905950),
-        (  0.707106781187,  0.707106781187,  0.000000000000,  0.005716905950),
-        ( -0.707106781187,  0.707106781187,  0.000000000000,  0.005716905950),
-        (  0.707106781187, -0.707106781187,  0.000000000000,  0.005716905950),
-        ( -0.707106781187, -0.707106781187,  0.000000000000,  0.005716905950),
-        (  0.577350269190,  0.577350269190,  0.577350269190,  0.005573383179),
-        ( -0.577350269190,  0.577350269190,  0.577350269190,  0.005573383179),
-        (  0.577350269190, -0.577350269190,  0.577350269190,  0.005573383179),
-        ( -0.577350269190, -0.577350269190,  0.577350269190,  0.005573383179),
-        (  0.577350269190,  0.577350269190, -0.577350269190,  0.005573383179),
-        ( -0.577350269190,  0.577350269190, -0.577350269190,  0.005573383179),
-        (  0.577350269190, -0.577350269190, -0.577350269190,  0.005573383179),
-        ( -0.577350269190, -0.577350269190, -0.577350269190,  0.005573383179),
-        (  0.671297344270,  0.671297344270,  0.314196994183,  0.005608704083),
-        ( -0.671297344270,  0.671297344270,  0.314196994183,  0.005608704083),
-        (  0.671297344270, -0.671297344270,  0.314196994183,  0.005608704083),
-        ( -0.671297344270, -0.671297344270,  0.314196994183,  0.005608704083),
-        (  0.671297344270,  0.671297344270, -0.314196994183,  0.005608704083),
-        ( -0.671297344270,  0.671297344270, -0.314196994183,  0.005608704083),
-        (  0.671297344270, -0.671297344270, -0.314196994183,  0.005608704083),
-        ( -0.671297344270, -0.671297344270, -0.314196994183,  0.005608704083),
-        (  0.671297344270,  0.314196994183,  0.671297344270,  0.005608704083),
-        ( -0.671297344270,  0.314196994183,  0.671297344270,  0.005608704083),
-        (  0.671297344270, -0.314196994183,  0.671297344270,  0.005608704083),
-        ( -0.671297344270, -0.314196994183,  0.671297344270,  0.005608704083),
-        (  0.671297344270,  0.314196994183, -0.671297344270,  0.005608704083),
-        ( -0.671297344270,  0.314196994183, -0.671297344270,  0.005608704083),
-        (  0.671297344270, -0.314196994183, -0.671297344270,  0.005608704083),
-        ( -0.671297344270, -0.314196994183, -0.671297344270,  0.005608704083),
-        (  0.314196994183,  0.671297344270,  0.671297344270,  0.005608704083),
-        ( -0.314196994183,  0.671297344270,  0.671297344270,  0.005608704083),
-        (  0.314196994183, -0.671297344270,  0.671297344270,  0.005608704083),
-        ( -0.314196994183, -0.671297344270,  0.671297344270,  0.005608704083),
-        (  0.314196994183,  0.671297344270, -0.671297344270,  0.005608704083),
-        ( -0.314196994183,  0.671297344270, -0.671297344270,  0.005608704083),
-        (  0.314196994183, -0.671297344270, -0.671297344270,  0.005608704083),
-        ( -0.314196994183, -0.671297344270, -0.671297344270,  0.005608704083),
-        (  0.289246562758,  0.289246562758,  0.912509096867,  0.005158237712),
-        ( -0.289246562758,  0.289246562758,  0.912509096867,  0.005158237712),
-        (  0.289246562758, -0.289246562758,  0.912509096867,  0.005158237712),
-        ( -0.289246562758, -0.289246562758,  0.912509096867,  0.005158237712),
-        (  0.289246562758,  0.289246562758, -0.912509096867,  0.005158237712),
-        ( -0.289246562758,  0.289246562758, -0.912509096867,  0.005158237712),
-        (  0.289246562758, -0.289246562758, -0.912509096867,  0.005158237712),
-        ( -0.289246562758, -0.289246562758, -0.912509096867,  0.005158237712),
-        (  0.289246562758,  0.912509096867,  0.289246562758,  0.005158237712),
-        ( -0.289246562758,  0.912509096867,  0.289246562758,  0.005158237712),
-        (  0.289246562758, -0.912509096867,  0.289246562758,  0.005158237712),
-        ( -0.289246562758, -0.912509096867,  0.289246562758,  0.005158237712),
-        (  0.289246562758,  0.912509096867, -0.289246562758,  0.005158237712),
-        ( -0.289246562758,  0.912509096867, -0.289246562758,  0.005158237712),
-        (  0.289246562758, -0.912509096867, -0.289246562758,  0.005158237712),
-        ( -0.289246562758, -0.912509096867, -0.289246562758,  0.005158237712),
-        (  0.912509096867,  0.289246562758,  0.289246562758,  0.005158237712),
-        ( -0.912509096867,  0.289246562758,  0.289246562758,  0.005158237712),
-        (  0.912509096867, -0.289246562758,  0.289246562758,  0.005158237712),
-        ( -0.912509096867, -0.289246562758,  0.289246562758,  0.005158237712),
-        (  0.912509096867,  0.289246562758, -0.289246562758,  0.005158237712),
-        ( -0.912509096867,  0.289246562758, -0.289246562758,  0.005158237712),
-        (  0.912509096867, -0.289246562758, -0.289246562758,  0.005158237712),
-        ( -0.912509096867, -0.289246562758, -0.289246562758,  0.005158237712),
-        (  0.444693317872,  0.444693317872,  0.777493219315,  0.005518771467),
-        ( -0.444693317872,  0.444693317872,  0.777493219315,  0.005518771467),
-        (  0.444693317872, -0.444693317872,  0.777493219315,  0.005518771467),
-        ( -0.444693317872, -0.444693317872,  0.777493219315,  0.005518771467),
-        (  0.444693317872,  0.444693317872, -0.777493219315,  0.005518771467),
-        ( -0.444693317872,  0.444693317872, -0.777493219315,  0.005518771467),
-        (  0.444693317872, -0.444693317872, -0.777493219315,  0.005518771467),
-        ( -0.444693317872, -0.444693317872, -0.777493219315,  0.005518771467),
-        (  0.444693317872,  0.777493219315,  0.444693317872,  0.005518771467),
-        ( -0.444693317872,  0.777493219315,  0.444693317872,  0.005518771467),
-        (  0.444693317872, -0.777493219315,  0.444693317872,  0.005518771467),
-        ( -0.444693317872, -0.777493219315,  0.444693317872,  0.005518771467),
-        (  0.444693317872,  0.777493219315, -0.444693317872,  0.005518771467),
-        ( -0.444693317872,  0.777493219315, -0.444693317872,  0.005518771467),
-        (  0.444693317872, -0.777493219315, -0.444693317872,  0.005518771467),
-        ( -0.444693317872, -0.777493219315, -0.444693317872,  0.005518771467),
-        (  0.777493219315,  0.444693317872,  0.444693317872,  0.005518771467),
-        ( -0.777493219315,  0.444693317872,  0.444693317872,  0.005518771467),
-        (  0.777493219315, -0.444693317872,  0.444693317872,  0.005518771467),
-        ( -0.777493219315, -0.444693317872,  0.444693317872,  0.005518771467),
-        (  0.777493219315,  0.444693317872, -0.444693317872,  0.005518771467),
-        ( -0.777493219315,  0.444693317872, -0.444693317872,  0.005518771467),
-        (  0.777493219315, -0.444693317872, -0.444693317872,  0.005518771467),
-        ( -0.777493219315, -0.444693317872, -0.444693317872,  0.005518771467),
-        (  0.129933544765,  0.129933544765,  0.982972302707,  0.004106777028),
-        ( -0.129933544765,  0.129933544765,  0.982972302707,  0.004106777028),
-        (  0.129933544765, -0.129933544765,  0.982972302707,  0.004106777028),
-        ( -0.129933544765, -0.129933544765,  0.982972302707,  0.004106777028),
-        (  0.129933544765,  0.129933544765, -0.982972302707,  0.004106777028),
-        ( -0.129933544765,  0.129933544765, -0.982972302707,  0.004106777028),
-        (  0.129933544765, -0.129933544765, -0.982972302707,  0.004106777028),
-        ( -0.129933544765, -0.129933544765, -0.982972302707,  0.004106777028),
-        (  0.129933544765,  0.982972302707,  0.129933544765,  0.004106777028),
-        ( -0.129933544765,  0.982972302707,  0.129933544765,  0.004106777028),
-        (  0.129933544765, -0.982972302707,  0.129933544765,  0.004106777028),
-        ( -0.129933544765, -0.982972302707,  0.129933544765,  0.004106777028),
-        (  0.129933544765,  0.982972302707, -0.129933544765,  0.004106777028),
-        ( -0.129933544765,  0.982972302707, -0.129933544765,  0.004106777028),
-        (  0.129933544765, -0.982972302707, -0.129933544765,  0.004106777028),
-        ( -0.129933544765, -0.982972302707, -0.129933544765,  0.004106777028),
-        (  0.982972302707,  0.129933544765,  0.129933544765,  0.004106777028),
-        ( -0.982972302707,  0.129933544765,  0.129933544765,  0.004106777028),
-        (  0.982972302707, -0.129933544765,  0.129933544765,  0.004106777028),
-        ( -0.982972302707, -0.129933544765,  0.129933544765,  0.004106777028),
-        (  0.982972302707,  0.129933544765, -0.129933544765,  0.004106777028),
-        ( -0.982972302707,  0.129933544765, -0.129933544765,  0.004106777028),
-        (  0.982972302707, -0.129933544765, -0.129933544765,  0.004106777028),
-        ( -0.982972302707, -0.129933544765, -0.129933544765,  0.004106777028),
-        (  0.345770219761,  0.938319218138,  0.000000000000,  0.005051846065),
-        ( -0.345770219761,  0.938319218138,  0.000000000000,  0.005051846065),
-        (  0.345770219761, -0.938319218138,  0.000000000000,  0.005051846065),
-        ( -0.345770219761, -0.938319218138,  0.000000000000,  0.005051846065),
-        (  0.938319218138,  0.345770219761,  0.000000000000,  0.005051846065),
-        ( -0.938319218138,  0.345770219761,  0.000000000000,  0.005051846065),
-        (  0.938319218138, -0.345770219761,  0.000000000000,  0.005051846065),
-        ( -0.938319218138, -0.345770219761,  0.000000000000,  0.005051846065),
-        (  0.345770219761,  0.000000000000,  0.938319218138,  0.005051846065),
-        ( -0.345770219761,  0.000000000000,  0.938319218138,  0.005051846065),
-        (  0.345770219761,  0.000000000000, -0.938319218138,  0.005051846065),
-        ( -0.345770219761,  0.000000000000, -0.938319218138,  0.005051846065),
-        (  0.938319218138,  0.000000000000,  0.345770219761,  0.005051846065),
-        ( -0.938319218138,  0.000000000000,  0.345770219761,  0.005051846065),
-        (  0.938319218138,  0.000000000000, -0.345770219761,  0.005051846065),
-        ( -0.938319218138,  0.000000000000, -0.345770219761,  0.005051846065),
-        (  0.000000000000,  0.345770219761,  0.938319218138,  0.005051846065),
-        (  0.000000000000, -0.345770219761,  0.938319218138,  0.005051846065),
-        (  0.000000000000,  0.345770219761, -0.938319218138,  0.005051846065),
-        (  0.000000000000, -0.345770219761, -0.938319218138,  0.005051846065),
-        (  0.000000000000,  0.938319218138,  0.345770219761,  0.005051846065),
-        (  0.000000000000, -0.938319218138,  0.345770219761,  0.005051846065),
-        (  0.000000000000,  0.938319218138, -0.345770219761,  0.005051846065),
-        (  0.000000000000, -0.938319218138, -0.345770219761,  0.005051846065),
-        (  0.159041710538,  0.836036015482,  0.525118572444,  0.005530248916),
-        ( -0.159041710538,  0.836036015482,  0.525118572444,  0.005530248916),
-        (  0.159041710538, -0.836036015482,  0.525118572444,  0.005530248916),
-        ( -0.159041710538, -0.836036015482,  0.525118572444,  0.005530248916),
-        (  0.159041710538,  0.836036015482, -0.525118572444,  0.005530248916),
-        ( -0.159041710538,  0.836036015482, -0.525118572444,  0.005530248916),
-        (  0.159041710538, -0.836036015482, -0.525118572444,  0.005530248916),
-        ( -0.159041710538, -0.836036015482, -0.525118572444,  0.005530248916),
-        (  0.159041710538,  0.525118572444,  0.836036015482,  0.005530248916),
-        ( -0.159041710538,  0.525118572444,  0.836036015482,  0.005530248916),
-        (  0.159041710538, -0.525118572444,  0.836036015482,  0.005530248916),
-        ( -0.159041710538, -0.525118572444,  0.836036015482,  0.005530248916),
-        (  0.159041710538,  0.525118572444, -0.836036015482,  0.005530248916),
-        ( -0.159041710538,  0.525118572444, -0.836036015482,  0.005530248916),
-        (  0.159041710538, -0.525118572444, -0.836036015482,  0.005530248916),
-        ( -0.159041710538, -0.525118572444, -0.836036015482,  0.005530248916),
-        (  0.836036015482,  0.159041710538,  0.525118572444,  0.005530248916),
-        ( -0.836036015482,  0.159041710538,  0.525118572444,  0.005530248916),
-        (  0.836036015482, -0.159041710538,  0.525118572444,  0.005530248916),
-        ( -0.836036015482, -0.159041710538,  0.525118572444,  0.005530248916),
-        (  0.836036015482,  0.159041710538, -0.525118572444,  0.005530248916),
-        ( -0.836036015482,  0.159041710538, -0.525118572444,  0.005530248916),
-        (  0.836036015482, -0.159041710538, -0.525118572444,  0.005530248916),
-        ( -0.836036015482, -0.159041710538, -0.525118572444,  0.005530248916),
-        (  0.836036015482,  0.525118572444,  0.159041710538,  0.005530248916),
-        ( -0.836036015482,  0.525118572444,  0.159041710538,  0.005530248916),
-        (  0.836036015482, -0.525118572444,  0.159041710538,  0.005530248916),
-        ( -0.836036015482, -0.525118572444,  0.159041710538,  0.005530248916),
-        (  0.836036015482,  0.525118572444, -0.159041710538,  0.005530248916),
-        ( -0.836036015482,  0.525118572444, -0.159041710538,  0.005530248916),
-        (  0.836036015482, -0.525118572444, -0.159041710538,  0.005530248916),
-        ( -0.836036015482, -0.525118572444, -0.159041710538,  0.005530248916),
-        (  0.525118572444,  0.159041710538,  0.836036015482,  0.005530248916),
-        ( -0.525118572444,  0.159041710538,  0.836036015482,  0.005530248916),
-        (  0.525118572444, -0.159041710538,  0.836036015482,  0.005530248916),
-        ( -0.525118572444, -0.159041710538,  0.836036015482,  0.005530248916),
-        (  0.525118572444,  0.159041710538, -0.836036015482,  0.005530248916),
-        ( -0.525118572444,  0.159041710538, -0.836036015482,  0.005530248916),
-        (  0.525118572444, -0.159041710538, -0.836036015482,  0.005530248916),
-        ( -0.525118572444, -0.159041710538, -0.836036015482,  0.005530248916),
-        (  0.525118572444,  0.836036015482,  0.159041710538,  0.005530248916),
-        ( -0.525118572444,  0.836036015482,  0.159041710538,  0.005530248916),
-        (  0.525118572444, -0.836036015482,  0.159041710538,  0.005530248916),
-        ( -0.525118572444, -0.836036015482,  0.159041710538,  0.005530248916),
-        (  0.525118572444,  0.836036015482, -0.159041710538,  0.005530248916),
-        ( -0.525118572444,  0.836036015482, -0.159041710538,  0.005530248916),
-        (  0.525118572444, -0.836036015482, -0.159041710538,  0.005530248916),
-        ( -0.525118572444, -0.836036015482, -0.159041710538,  0.005530248916),
-    ],
-}
+Lebedev = QuadratureTable('lebedev',4,
+                          [6,14,26,38,50,74,86,110,146,170,194])
@@ -4,6 +4,9 @@
  Roots and weights of Legendre polynomials: see Abramowitz/Stegun
   table 25.4, p. 917
 
+ Legendre[n] is the (n,2) array of roots and weights for n points,
+ loaded from GridData the first time it is used (see Lebedev.py).
+
  This program is part of the PyQuante quantum chemistry program suite.
 
  Copyright (c) 2004, Richard P. Muller. All Rights Reserved. 
@@ -12,156 +15,6 @@
  license. Please see the file LICENSE that is part of this
  distribution. 
 """
+from Lebedev import QuadratureTable
 
-Legendre = {
-    20: [
-        (  -0.993128599185095,   0.017614007139151),
-        (  -0.963971927277914,   0.040601429800388),
-        (  -0.912234428251326,   0.062672048334110),
-        (  -0.839116971822219,   0.083276741576705),
-        (  -0.746331906460151,   0.101930119817241),
-        (  -0.636053680726515,   0.118194531961518),
-        (  -0.510867001950827,   0.131688638449176),
-        (  -0.373706088715419,   0.142096109318382),
-        (  -0.227785851141645,   0.149172986472604),
-        (  -0.076526521133497,   0.152753387130726),
-        (   0.076526521133497,   0.152753387130726),
-        (   0.227785851141645,   0.149172986472604),
-        (   0.373706088715419,   0.142096109318382),
-        (   0.510867001950827,   0.131688638449176),
-        (   0.636053680726515,   0.118194531961519),
-        (   0.746331906460150,   0.101930119817240),
-        (   0.839116971822218,   0.083276741576704),
-        (   0.912234428251326,   0.062672048334109),
-        (   0.963971927277914,   0.040601429800387),
-        (   0.993128599185096,   0.017614007139152),
-    ],
-    24: [
-        (  -0.995187219997021,   0.012341229799986),
-        (  -0.974728555971310,   0.028531388628934),
-        (  -0.938274552002733,   0.044277438817421),
-        (  -0.886415527004401,   0.059298584915437),
-        (  -0.820001985973903,   0.073346481411080),
-        (  -0.740124191578555,   0.086190161531953),
-        (  -0.648093651936976,   0.097618652104113),
-        (  -0.545421471388840,   0.107444270115966),
-        (  -0.433793507626045,   0.115505668053726),
-        (  -0.315042679696164,   0.121670472927804),
-        (  -0.191118867473616,   0.125837456346828),
-        (  -0.064056892862606,   0.127938195346752),
-        (   0.064056892862606,   0.127938195346753),
-        (   0.191118867473616,   0.125837456346828),
-        (   0.315042679696164,   0.121670472927803),
-        (   0.433793507626045,   0.115505668053725),
-        (   0.545421471388839,   0.107444270115966),
-        (   0.648093651936975,   0.097618652104113),
-        (   0.740124191578554,   0.086190161531954),
-        (   0.820001985973903,   0.073346481411081),
-        (   0.886415527004401,   0.059298584915436),
-        (   0.938274552002733,   0.044277438817421),
-        (   0.974728555971309,   0.028531388628933),
-        (   0.995187219997021,   0.012341229799987),
-    ],
-    28: [
-        (  -0.996442497573954,   0.009124282593095),
-        (  -0.981303165370873,   0.021132112592772),
-        (  -0.954259280628938,   0.032901427782304),
-        (  -0.915633026392132,   0.044272934759005),
-        (  -0.865892522574396,   0.055107345675716),
-        (  -0.805641370917179,   0.065272923966999),
-        (  -0.735610878013632,   0.074646214234570),
-        (  -0.656651094038865,   0.083113417228900),
-        (  -0.569720471811402,   0.090571744393033),
-        (  -0.475874224955119,   0.096930657997930),
-        (  -0.376251516089078,   0.102112967578060),
-        (  -0.272061627635178,   0.106055765922847),
-        (  -0.164569282133381,   0.108711192258294),
-        (  -0.055079289884034,   0.110047013016475),
-        (   0.055079289884034,   0.110047013016475),
-        (   0.164569282133381,   0.108711192258294),
-        (   0.272061627635178,   0.106055765922846),
-        (   0.376251516089079,   0.102112967578061),
-        (   0.475874224955118,   0.096930657997930),
-        (   0.569720471811402,   0.090571744393032),
-        (   0.656651094038865,   0.083113417228901),
-        (   0.735610878013632,   0.074646214234570),
-        (   0.805641370917179,   0.065272923966999),
-        (   0.865892522574395,   0.055107345675717),
-        (   0.915633026392132,   0.044272934759004),
-        (   0.954259280628938,   0.032901427782305),
-        (   0.981303165370872,   0.021132112592771),
-        (   0.996442497573955,   0.009124282593095),
-    ],
-    32: [
-        (  -0.997263861849481,   0.007018610009468),
-        (  -0.985611511545268,   0.016274394730907),
-        (  -0.964762255587507,   0.025392065309262),
-        (  -0.934906075937740,   0.034273862913022),
-        (  -0.896321155766052,   0.042835898022228),
-        (  -0.849367613732571,   0.050998059262376),
-        (  -0.794483795967942,   0.058684093478536),
-        (  -0.732182118740290,   0.065822222776363),
-        (  -0.663044266930215,   0.072345794108848),
-        (  -0.587715757240762,   0.078193895787070),
-        (  -0.506899908932230,   0.083311924226947),
-        (  -0.421351276130635,   0.087652093004404),
-        (  -0.331868602282127,   0.091173878695763),
-        (  -0.239287362252137,   0.093844399080805),
-        (  -0.144471961582796,   0.095638720079275),
-        (  -0.048307665687738,   0.096540088514728),
-        (   0.048307665687739,   0.096540088514728),
-        (   0.144471961582796,   0.095638720079275),
-        (   0.239287362252137,   0.093844399080805),
-        (   0.331868602282128,   0.091173878695764),
-        (   0.421351276130635,   0.087652093004404),
-        (   0.506899908932229,   0.083311924226947),
-        (   0.587715757240762,   0.078193895787069),
-        (   0.663044266930215,   0.072345794108848),
-        (   0.732182118740290,   0.065822222776362),
-        (   0.794483795967942,   0.058684093478535),
-        (   0.849367613732570,   0.050998059262377),
-        (   0.896321155766052,   0.042835898022227),
-        (   0.934906075937739,   0.034273862913021),
-        (   0.964762255587506,   0.025392065309263),
-        (   0.985611511545269,   0.016274394730905),
-        (   0.997263861849483,   0.007018610009470),
-    ],
-    36: [
-        (  -0.997830462484086,   0.005565719664244),
-        (  -0.988586478902212,   0.012915947284065),
-        (  -0.972027691049698,   0.020181515297736),
-        (  -0.948272984399507,   0.027298621498570),
-        (  -0.917497774515660,   0.034213810770306),
-        (  -0.879929800890397,   0.040875750923645),
-        (  -0.835847166992476,   0.047235083490266),
-        (  -0.785576230132207,   0.053244713977760),
-        (  -0.729489171593557,   0.058860144245325),
-        (  -0.668001236585522,   0.064039797355016),
-        (  -0.601567658135980,   0.068745323835737),
-        (  -0.530680285926245,   0.072941885005653),
-        (  -0.455863944433421,   0.076598410645870),
-        (  -0.377672547119689,   0.079687828912072),
-        (  -0.296684995344029,   0.082187266704340),
-        (  -0.213500892316866,   0.084078218979662),
-        (  -0.128736103809385,   0.085346685739338),
-        (  -0.043018198473709,   0.085983275670395),
-        (   0.043018198473709,   0.085983275670395),
-        (   0.128736103809385,   0.085346685739338),
-        (   0.213500892316866,   0.084078218979662),
-        (   0.296684995344029,   0.082187266704340),
-        (   0.377672547119689,   0.079687828912072),
-        (   0.455863944433420,   0.076598410645871),
-        (   0.530680285926245,   0.072941885005653),
-        (   0.601567658135981,   0.068745323835735),
-        (   0.668001236585521,   0.064039797355016),
-        (   0.729489171593557,   0.058860144245326),
-        (   0.785576230132207,   0.053244713977759),
-        (   0.835847166992475,   0.047235083490267),
-        (   0.879929800890397,   0.040875750923645),
-        (   0.917497774515659,   0.034213810770306),
-        (   0.948272984399508,   0.027298621498570),
-        (   0.972027691049698,   0.020181515297734),
-        (   0.988586478902213,   0.012915947284067),
-        (   0.997830462484086,   0.005565719664245),
-    ],
-}
+Legendre = QuadratureTable('legendre',2,[20,24,28,32,36])
@@ -1,5 +1,8 @@
 import settings
-from NumWrap import zeros,dot,matrixmultiply
+from NumWrap import zeros,dot,matrixmultiply,concatenate,array,sqrt,\
+     nonzero,floor,argsort,ix_,unique
+import logging
+logger = logging.getLogger("pyquante")
 
 class MG2:
     """
@@ -35,14 +38,41 @@ class MG2:
       ng x 3 ndarray, the gamma matrix, which contains dot(gradi,gradj)
        for i,j in a,b
 
-    bfgrid:
-      ng x nbf ndarray, the basis functions evaluated at the grid points
+    blocks:
+      list of GridBlocks. The grid points are sorted into spatial blocks,
+       of at most block_points points, and each block keeps the basis
+       functions (and, if needed, their gradients) only for the functions
+       that reach it. See GridBlock.
 
-    bfgrads:
-      ng x nbf x 3 ndarray, the gradient of each basis function at each
-       grid point. This is the largest storage we require, and at some point
-       we need to figure out whether we can reduce this by computing, say,
-       basis function gradients on the fly.
+    cache_size:
+      Float or None, the memory (in MB) allowed for the block basis
+       function values. Blocks that don't fit in it are recomputed
+       each time they are used, and discarded afterwards. None keeps
+       every block.
+
+    nthreads:
+      Integer, the number of threads that work on the blocks at once.
+       The thread pool is made on first use and kept until close().
+       See map_blocks.
+
+    bf_dtype:
+      'f' if the grid was made with single_precision, else 'd'. The
+       block basis functions and gradients are stored, and multiplied
+       with the density and XC potential, in this type. The density,
+       gradients, gamma and the sums over the grid stay in double
+       precision.
+
+    iatom:
+      ng ndarray, the index of the atom each grid point belongs to
+
+    atom_npts:
+      List of the number of points in each atomic grid. These depend on
+       the element when the atomic grids are pruned (see the pruning
+       option of AtomicGrid.atomic_shells).
+
+    positions:
+      natoms x 3 ndarray, the atom positions the grid was made for.
+       See update_geometry.
 
 
     Public Functions:
@@ -55,7 +85,25 @@ class MG2:
         self.atoms = atoms
         self.nrad = nrad
         self.fineness = fineness
+        self.block_size = kwargs.get('grid_block_size',
+                                     settings.DFTGridBlockSize)
+        self.block_points = kwargs.get('grid_block_points',
+                                       settings.DFTGridBlockPoints)
+        self.bf_cutoff = kwargs.get('bf_cutoff',settings.DFTBasisCutoff)
+        self.cache_size = kwargs.get('grid_cache_size',
+                                     settings.DFTGridCacheSize)
+        self.nthreads = kwargs.get('nthreads',settings.DFTThreads)
+        self._pool = None
+        self.bf_dtype = 'd'
+        if kwargs.get('single_precision',settings.DFTGridSinglePrecision):
+            self.bf_dtype = 'f'
+        self.move_tol = kwargs.get('move_tol',settings.DFTGridMoveTolerance)
+        self.options = kwargs
+        # Unpartitioned atomic grids about the origin, reused by
+        #  update_geometry; see AtomicGrid.atomic_grid_xyzw
+        self._atomic_grids = {}
         self.make_grid(**kwargs)
+        self.make_blocks()
         self.zero_density()
         return
 
@@ -63,121 +111,225 @@ class MG2:
     def __getitem__(self,item): return self.xyzw[item,:]
 
     def add_basis(self,bfs):
-        # Compute the amplitudes of the basis functions over the grid
+        """Find the basis functions whose cutoff radius reaches each
+        block, and compute their amplitudes over the blocks that fit
+        in cache_size"""
+        for block in self.blocks: block.bfgrid = block.bfgrads = None
+        self.screen_basis(bfs)
+        return
+
+    def screen_basis(self,bfs,moved_bfs=None):
+        """Screen bfs against each block and fill the cache. A block
+        that is still cached keeps its values if the same functions
+        reach it, and none of them are flagged in moved_bfs."""
+        from PyQuante.CGBF import cutoff_radius
+        self.bfs = bfs
         self.nbf = len(bfs)
-        self.bfgrid = zeros((self.ng,self.nbf),'d')
-        for ibf in xrange(self.nbf):
-            for ig in xrange(self.ng):
-                x,y,z,w = self.xyzw[ig,:]
-                self.bfgrid[ig,ibf] = bfs[ibf].amp(x,y,z)
-        if self.do_grad_dens:
-            self.bfgrads = zeros((self.ng,self.nbf,3),'d')
-            for ibf in xrange(self.nbf):
-                for ig in xrange(self.ng):
-                    x,y,z,w = self.xyzw[ig,:]
-                    self.bfgrads[ig,ibf,:] = bfs[ibf].grad(x,y,z)
+        self.origins = array([bfs[i].origin for i in xrange(self.nbf)])
+        rcut = array([cutoff_radius(bfs[i],self.bf_cutoff)
+                      for i in xrange(self.nbf)])
+        nvals = 1
+        if self.do_grad_dens: nvals = 4
+        itemsize = zeros(0,self.bf_dtype).itemsize
+        cached = 0
+        for block in self.blocks:
+            dist = sqrt(((self.origins-block.center)**2).sum(1))
+            ibfs = nonzero(dist-block.radius < rcut)[0]
+            nbytes = itemsize*nvals*block.npts*len(ibfs)
+            if block.bfgrid is not None and len(ibfs) == len(block.ibfs) \
+                   and (ibfs == block.ibfs).all() \
+                   and (moved_bfs is None or not moved_bfs[ibfs].any()):
+                cached += nbytes
+                continue
+            block.ibfs = ibfs
+            block.bfgrid = block.bfgrads = None
+            if self.cache_size is None \
+                   or cached+nbytes <= 1024*1024*self.cache_size:
+                block.bfgrid,block.bfgrads = self.eval_block(block)
+                cached += nbytes
         return
 
-    def floor_density(self,tol=1e-9):
+    def update_geometry(self,atoms,bfs):
+        """\
+        Move the grid to a new geometry of the same molecule, instead
+        of making a new one. The atomic grids are translated copies from
+        _atomic_grids, so only the partition weights are computed
+        again. The points stay in their blocks. bfs, the basis at the
+        new geometry, is required: the basis functions are screened
+        against the moved blocks again, and only computed again over
+        the blocks that touch an atom that moved by more than move_tol.
         """
-        Set density values below tol to zero
-        """
-        self.density[self.density<tol] = 0
+        old_positions = self.positions
+        self.atoms = atoms
+        self.make_grid(**self.options)
+        self.xyzw = self.xyzw[self.order]
+        self.iatom = self.iatom[self.order]
+        moved = sqrt(((self.positions-old_positions)**2).sum(1)) \
+                > self.move_tol
+        for block in self.blocks:
+            block.center,block.radius = bounding_sphere(self.xyzw[block.sl,:3])
+            if moved[block.iatoms].any():
+                block.bfgrid = block.bfgrads = None
+        origins = array([bfs[i].origin for i in xrange(len(bfs))])
+        moved_bfs = sqrt(((origins-self.origins)**2).sum(1)) \
+                    > self.move_tol
+        self.screen_basis(bfs,moved_bfs)
+        self.zero_density()
         return
 
-    def compute_grid_size(self,atomgrids):
-        self.ng = 0
-        for ag in atomgrids:
-            self.ng += len(ag)
-        self._length = self.ng # backwards compatibility
+    def eval_block(self,block):
+        "Compute the basis functions (and gradients) over a block"
+        from PyQuante.CGBF import eval_bfs
+        block_bfs = [self.bfs[i] for i in block.ibfs]
+        xyz = self.xyzw[block.sl,:3]
+        if self.do_grad_dens:
+            amps,grads = eval_bfs(block_bfs,xyz,1)
+            return amps.astype(self.bf_dtype),grads.astype(self.bf_dtype)
+        return eval_bfs(block_bfs,xyz).astype(self.bf_dtype),None
+
+    def map_blocks(self,func):
+        """Generate func(block) for each block, in block order. With
+        nthreads > 1 the blocks are run in a pool of threads; numpy
+        releases the GIL in the array work, so they run concurrently,
+        and the order of the results doesn't depend on the threads."""
+        if self.nthreads <= 1:
+            for block in self.blocks: yield func(block)
+            return
+        for result in self.get_pool().imap(func,self.blocks):
+            yield result
         return
 
-    def make_atomgrids(self,**kwargs):
-        from PyQuante.AtomicGrid import AtomicGrid
-        atomgrids = []
-        for atom in self.atoms:
-            atomgrids.append(AtomicGrid(atom,nrad=self.nrad,**kwargs))
-        self.patch_atoms(atomgrids)
-        return atomgrids
-
-    def make_grid(self,**kwargs):
-        atomgrids = self.make_atomgrids(**kwargs)
-        self.compute_grid_size(atomgrids)
-        self.patch_grids(atomgrids)
+    def get_pool(self):
+        """The pool of nthreads threads used by map_blocks. It is made
+        the first time it is needed, and again if nthreads changes, so
+        the SCF iterations all share one pool"""
+        if self._pool is not None and self._pool_threads != self.nthreads:
+            self.close()
+        if self._pool is None:
+            from multiprocessing.pool import ThreadPool
+            self._pool = ThreadPool(self.nthreads)
+            self._pool_threads = self.nthreads
+        return self._pool
+
+    def close(self):
+        "Stop the threads of map_blocks, if there are any"
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
         return
 
-    def patch_atoms(self,atomgrids,**kwargs):
-        """This is Becke's patching algorithm. Attempting to implement
-        the normalization that is in eq 22 of that reference."""
-        from PyQuante.MolecularGrid import becke_atomic_grid_p
-        nat = len(self.atoms)
-        for iat in xrange(nat):
-            ati = self.atoms[iat]
-            npts = len(atomgrids[iat])
-            for i in xrange(npts):
-                point = atomgrids[iat].points[i]
-                xp,yp,zp,wp = point.xyzw()
-                Pnum = 1
-                Pdenom = 0
-                for jat in xrange(nat):
-                    bap = becke_atomic_grid_p(jat,(xp,yp,zp),self.atoms,**kwargs)
-                    Pdenom += bap
-                    if iat == jat: P_iat = bap
-                Ptot = P_iat/Pdenom
-                point._w *= Ptot
+    def __del__(self): self.close()
+
+    def block_values(self,block):
+        """The basis functions and gradients over a block, from the cache
+        if it was kept by add_basis, and computed afresh otherwise"""
+        if block.bfgrid is not None: return block.bfgrid,block.bfgrads
+        return self.eval_block(block)
+
+    def make_blocks(self):
+        """Sort the grid points into cubes of side block_size, so that
+        the points in each block are contiguous in xyzw, and split cubes
+        with more than block_points points. The order array maps the
+        sorted points back to make_grid's order."""
+        xyz = self.xyzw[:,:3]
+        boxes = floor((xyz-xyz.min(0))/self.block_size).astype(int)
+        nx,ny,nz = boxes.max(0)+1
+        keys = (boxes[:,0]*ny+boxes[:,1])*nz+boxes[:,2]
+        self.order = argsort(keys,kind='mergesort')
+        self.xyzw = self.xyzw[self.order]
+        self.iatom = self.iatom[self.order]
+        keys = keys[self.order]
+        starts = [0] + list(nonzero(keys[1:] != keys[:-1])[0]+1) + [self.ng]
+        self.blocks = []
+        for i in xrange(len(starts)-1):
+            step = starts[i+1]-starts[i]
+            if self.block_points: step = min(step,self.block_points)
+            for start in xrange(starts[i],starts[i+1],step):
+                sl = slice(start,min(start+step,starts[i+1]))
+                center,radius = bounding_sphere(self.xyzw[sl,:3])
+                block = GridBlock(sl,center,radius)
+                block.iatoms = unique(self.iatom[sl])
+                self.blocks.append(block)
         return
 
-    def patch_grids(self,atomgrids):
-        """Create the xyzw array from the atomgrids, which
-        can then be discarded."""
-        self.xyzw = zeros((self.ng,4),'d')
-        #self.iatom = zeros(self.ng,'l') # Can also keep the atom index, if desired
-        ig = 0
-        nat = len(atomgrids)
-        for iat in xrange(nat):
-            npts = len(atomgrids[iat])
-            for i in xrange(npts):
-                point = atomgrids[iat].points[i]
-                self.xyzw[ig,:] = point.xyzw()
-                #self.iatom[ig] = iat
-                ig += 1
-        assert ig == self.ng
+    def get_bfgrid(self):
+        "Assemble the dense ng x nbf array of basis function amplitudes"
+        bfgrid = zeros((self.ng,self.nbf),'d')
+        for block in self.blocks:
+            bfgrid[block.sl][:,block.ibfs] = self.block_values(block)[0]
+        return bfgrid
+
+    def floor_density(self,tol=1e-9):
+        """
+        Set density values below tol to zero
+        """
+        self.density[self.density<tol] = 0
         return
 
-    def grad_bf_prod(self,a,b):
-        "Form grad(chia,chib)."
-        gab = zeros((self.ng,3),'d')
-        for i in xrange(3):
-            gab[:,i] = self.bfgrid[:,a]*self.bfgrads[:,b,i] \
-                     + self.bfgrid[:,b]*self.bfgrads[:,a,i]
-        return gab
+    def make_grid(self,**kwargs):
+        """Form the xyzw array directly from the atomic grids, with
+        Becke's (or Stratmann-Scuseria) patching applied to the weights."""
+        from PyQuante.AtomicGrid import atomic_grid_xyzw
+        from PyQuante.MolecularGrid import partition_weights,atom_pairs
+        xyzws = []
+        iatoms = []
+        pairs = atom_pairs(self.atoms)
+        for iat in xrange(len(self.atoms)):
+            xyzw = atomic_grid_xyzw(self.atoms[iat],self._atomic_grids,
+                                    nrad=self.nrad,**kwargs)
+            xyzw[:,3] *= partition_weights(self.atoms,xyzw[:,:3],iat,
+                                           pairs=pairs,**kwargs)
+            xyzws.append(xyzw)
+            iatoms.append(iat+zeros(len(xyzw),int))
+        self.atom_npts = [len(xyzw) for xyzw in xyzws]
+        for iat in xrange(len(self.atoms)):
+            logger.info("Atom %d (Z=%d): %d grid points" %
+                        (iat,self.atoms[iat].atno,self.atom_npts[iat]))
+        self.xyzw = concatenate(xyzws)
+        self.iatom = concatenate(iatoms)
+        self.positions = array([atom.pos() for atom in self.atoms])
+        self.ng = len(self.xyzw)
+        self._length = self.ng # backwards compatibility
+        return
 
     def set_density(self,D,Db=None):
         """Given either one density matrix, corresponding to
         a spin unpolarized case, or two density matrices, corresponding
         to a spin polarized case, create the density array and,
-        if necessary, the gradients"""
-
-        self.density[:,0] = bdb(self.bfgrid,D)
+        if necessary, the gradients. This is done a block at a time,
+        so uncached blocks are only computed once."""
+        if self.do_grad_dens:
+            self.grada = zeros((self.ng,3),'d')
+            if Db is not None: self.gradb = zeros((self.ng,3),'d')
+        def block_density(block):
+            # Each block only writes its own slice of the arrays
+            sl = block.sl
+            bfgrid,bfgrads = self.block_values(block)
+            Da = D[ix_(block.ibfs,block.ibfs)].astype(self.bf_dtype)
+            self.density[sl,0] = bdb(bfgrid,Da)
+            # Note: the gradient was bdg(bfgrid,D,bfgrads) +
+            # gdb(bfgrads,D,bfgrid), but for symmetric D the
+            # gdb part is the same as the bdg part
+            if self.do_grad_dens:
+                self.grada[sl] = 2*bdg(bfgrid,Da,bfgrads)
+            if Db is not None:
+                Dbb = Db[ix_(block.ibfs,block.ibfs)].astype(self.bf_dtype)
+                self.density[sl,1] = bdb(bfgrid,Dbb)
+                if self.do_grad_dens:
+                    self.gradb[sl] = 2*bdg(bfgrid,Dbb,bfgrads)
+            return
+        for result in self.map_blocks(block_density): pass
         if Db is None: # Spin unpolarized case
             self.density[:,1] = self.density[:,0]
-        else:
-            self.density[:,1] = bdb(self.bfgrid,Db)
 
         if self.do_grad_dens:
-            self.grada = 2*bdg(self.bfgrid,D,self.bfgrads)
-            # Note: this code was:
-            #self.grada = bdg(self.bfgrid,D,self.bfgrads) +\
-            #             gdb(self.bfgrads,D,self.bfgrid)
-            # but I can't see that the gdb part does anything different
-            # than the bdg
             self.gamma[:,0] = abdot(self.grada,self.grada)
             if Db is None:
                 self.gradb = self.grada
                 self.gamma[:,1] = self.gamma[:,0]
                 self.gamma[:,2] = self.gamma[:,0]
             else:
-                self.gradb = 2*bdg(self.bfgrid,Db,self.bfgrads)
                 self.gamma[:,1] = abdot(self.gradb,self.gradb)
                 self.gamma[:,2] = abdot(self.grada,self.gradb)
         return
@@ -219,6 +371,49 @@ class MG2:
     # quite different. But this might avoid a few crashes during
     # porting to the new grids.
 
+class GridBlock:
+    """\
+    A spatial block of grid points.
+
+    sl:
+      slice of the MG2 per-point arrays (xyzw, density, ...) in the block
+
+    npts:
+      number of points in the block
+
+    iatoms:
+      indices of the atoms whose grids have points in the block
+
+    center, radius:
+      bounding sphere of the points in the block
+
+    ibfs:
+      indices of the basis functions that are non-negligible in the block
+
+    bfgrid:
+      npts x len(ibfs) ndarray, those basis functions at the block's
+       points, or None if the block isn't cached (see MG2.block_values)
+
+    bfgrads:
+      npts x len(ibfs) x 3 ndarray, their gradients, if needed
+    """
+    def __init__(self,sl,center,radius):
+        self.sl = sl
+        self.npts = sl.stop-sl.start
+        self.center = center
+        self.radius = radius
+        self.iatoms = None
+        self.ibfs = None
+        self.bfgrid = None
+        self.bfgrads = None
+        return
+
+def bounding_sphere(xyz):
+    "Center and radius of a sphere around the points in xyz"
+    center = xyz.mean(0)
+    radius = sqrt(((xyz-center)**2).sum(1).max())
+    return center,radius
+
 # Need to find a faster way to do these, perhaps using tensordot?
 def bdb(b,d):
     """Basis x Density x Basis matrix multiply."""
@@ -237,9 +432,9 @@ def bdg(b,d,g):
 def abdot(A,B):
     """
     Multiply two n x m matrices together so that the result is a n-length vector
-    (i.e. the part over m is accumulated).
+    (i.e. the part over m is accumulated, in double precision).
     """
-    return (A*B).sum(1)
+    return (A*B).sum(1,dtype='d')
 
 def new_grid_tester():
     from PyQuante.TestMolecules import he,h2
@@ -266,12 +461,13 @@ def new_grid_tester():
     print "test_density: ",test_density(gr,gr2)
     print "test_gamma: ",test_gamma(gr,gr2)
 
+# The MG2 points are sorted into blocks; new.order maps them back
 def test_density(old,new):
-    d = old.dens()-new.density[:,0]-new.density[:,1]
+    d = old.dens()[new.order]-new.density[:,0]-new.density[:,1]
     return sum(d) < 1e-5
 
 def test_bfgrid(old,new):
-    d = old.bfgrid-new.bfgrid
+    d = old.bfgrid[new.order]-new.get_bfgrid()
     return sum(sum(d)) < 1e-5
 
 def test_length(old,new):
@@ -282,13 +478,13 @@ def test_distance(old,new):
     points = old.points()
     s = 0
     for i in xrange(new.ng):
-        x1,y1,z1,w1 = points[i].xyzw()
+        x1,y1,z1,w1 = points[new.order[i]].xyzw()
         x2,y2,z2,w2 = new[i]
         s += dist2((x1,y1,z1),(x2,y2,z2))
     return s<1e-5
 
 def test_gamma(old,new):
-    d = old.get_gamma()-2*(new.gamma[:,0]+new.gamma[:,1])
+    d = old.get_gamma()[new.order]-2*(new.gamma[:,0]+new.gamma[:,1])
     return sum(d) < 1e-5
     
 
@@ -197,25 +197,27 @@ def get_F1_open(atoms,Da,Db):
         ibf += atomi.nbf
     return F1
 
-Gij_cache = None
-def get_F2(atoms,D,use_cache=False):
-    "Two-center corrections to the core fock matrix"
-    global Gij_cache
+def get_gamma_matrix(atoms):
+    "Matrix of the two-center gamma values between all pairs of atoms"
+    nat = len(atoms)
+    Gij = zeros((nat,nat),'d')
+    for iat in xrange(nat):
+        atomi = atoms[iat]
+        for jat in xrange(iat):
+            atomj = atoms[jat]
+            Gij[iat,jat] = get_gamma(atomi,atomj)
+            Gij[jat,iat] = Gij[iat,jat]
+    return Gij
+
+def get_F2(atoms,D,Gij=None):
+    """Two-center corrections to the core fock matrix. The gamma values
+    can be passed in as Gij, from get_gamma_matrix, to avoid recomputing
+    them every iteration."""
     nbf = get_nbf(atoms)
     nat = len(atoms)
 
     F2 = zeros((nbf,nbf),'d')
 
-    # Optionally cache Gamma values
-    if use_cache and Gij_cache is None:
-        Gij_cache = zeros((nat,nat),'d')
-        for iat in xrange(nat):
-            atomi = atoms[iat]
-            for jat in xrange(iat):
-                atomj = atoms[jat]
-                Gij_cache[iat,jat] = get_gamma(atomi,atomj)
-                Gij_cache[jat,iat] = Gij_cache[iat,jat]
-
     ibf = 0 # bf number of the first bfn on iat
     for iat in xrange(nat):
         atomi = atoms[iat]
@@ -223,8 +225,8 @@ def get_F2(atoms,D,use_cache=False):
         for jat in xrange(nat):
             atomj = atoms[jat]
             if iat != jat:
-                if use_cache:
-                    gammaij = Gij_cache[iat,jat]
+                if Gij is not None:
+                    gammaij = Gij[iat,jat]
                 else:
                     gammaij = get_gamma(atomi,atomj)
                 for i in xrange(atomi.nbf):
@@ -241,7 +243,7 @@ def get_F2(atoms,D,use_cache=False):
         ibf += atomi.nbf
     return F2
 
-def get_F2_open(atoms,Da,Db):
+def get_F2_open(atoms,Da,Db,Gij=None):
     "Two-center corrections to the core fock matrix"
     nbf = get_nbf(atoms)
     nat = len(atoms)
@@ -255,7 +257,10 @@ def get_F2_open(atoms,Da,Db):
         for jat in xrange(nat):
             atomj = atoms[jat]
             if iat != jat:
-                gammaij = get_gamma(atomi,atomj)
+                if Gij is not None:
+                    gammaij = Gij[iat,jat]
+                else:
+                    gammaij = get_gamma(atomi,atomj)
                 for i in xrange(atomi.nbf):
                     for j in xrange(atomj.nbf):
                         pija = Da[ibf+i,jbf+j] 
@@ -384,12 +389,13 @@ def scfclosed(atoms,F0,nclosed,**kwargs):
     do_avg = kwargs.get('avg',settings.MINDOAveraging)
     maxiter = kwargs.get('maxiter',settings.MaxIter)
     D = get_guess_D(atoms)
+    Gij = get_gamma_matrix(atoms)
     Eold = 0
     if do_avg: avg = SimpleAverager(do_avg)
     for i in xrange(maxiter):
         if do_avg: D = avg.getD(D)
         F1 = get_F1(atoms,D)
-        F2 = get_F2(atoms,D)
+        F2 = get_F2(atoms,D,Gij)
         F = F0+F1+F2
         Eel = 0.5*trace2(D,F0+F)
         if verbose: print i+1,Eel,get_Hf(atoms,Eel)
@@ -409,12 +415,13 @@ def scfopen(atoms,F0,nalpha,nbeta,**kwargs):
     D = get_guess_D(atoms)
     Da = 0.5*D
     Db = 0.5*D
+    Gij = get_gamma_matrix(atoms)
     Eold = 0
     for i in xrange(10):
         F1a = get_F1_open(atoms,Da,Db)
         F1b = get_F1_open(atoms,Db,Da)
-        F2a = get_F2_open(atoms,Da,Db)
-        F2b = get_F2_open(atoms,Db,Da)
+        F2a = get_F2_open(atoms,Da,Db,Gij)
+        F2b = get_F2_open(atoms,Db,Da,Gij)
         Fa = F0+F1a+F2a
         Fb = F0+F1b+F2b
         Eel = 0.5*trace2(Da,F0+Fa)+0.5*trace2(Db,F0+Fb)
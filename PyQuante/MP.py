@@ -12,8 +12,15 @@
  distribution. 
 """
 
-from PyQuante.cints import ijkl2intindex
-from NumWrap import zeros,dot
+import settings
+from PyQuante.Ints import transform_ints,half_transform_ints,\
+     finish_transform_ints
+from PyQuante.DensityFitting import aux_basis,get3ints,get2cints,\
+     fitted_mo_ints
+from NumWrap import zeros,dot,asarray,newaxis,memmap
+from tempfile import TemporaryFile
+import logging
+logger = logging.getLogger("pyquante")
 
 VERBOSE=0
 
@@ -21,108 +28,155 @@ def TransformIntsMP2(Ints,orbs,nclosed):
     """\
     O(N^5) 4-index transformation of the two-electron integrals.
     Only transform the ones needed for MP2, which reduces the
-    scaling to O(nN^4), where n are the occs (<<N).
+    scaling to O(nN^4), where n are the occs (<<N). Returns the
+    (nclosed,nmo,nclosed,nmo) array of (ai|bj), a and b occupied.
     """
+    occs = orbs[:,:nclosed]
+    return transform_ints(Ints,(occs,orbs,occs,orbs))
 
-    from time import time
-
-    t0 = time()
-
-    nbf,nmo = orbs.shape
-    totlen = nmo*(nmo+1)*(nmo*nmo+nmo+2)/8
-
-    occs = range(nclosed)
-    mos = range(nmo)
-    bfs = range(nbf)
-
-    # Start with (mu,nu|sigma,eta)
-    # Unpack aoints and transform sigma -> b
-    temp = zeros((nbf,nbf,nclosed,nbf),'d')
-    tempvec = zeros(nbf,'d')
-    for mu in bfs:
-        for nu in bfs:
-            for eta in bfs:
-                for b in occs:
-                    for sigma in bfs:
-                        tempvec[sigma] = Ints[ijkl2intindex(mu,nu,sigma,eta)]
-                    temp[mu,nu,b,eta] = dot(orbs[:,b],tempvec)
-
-    temp2 = zeros((nclosed,nbf,nclosed,nbf),'d')
-    for nu in bfs:
-        for eta in bfs:
-            for b in occs:
-                for a in occs:
-                    temp2[a,nu,b,eta] = dot(orbs[:,a],temp[:,nu,b,eta])
-
-    temp = zeros((nclosed,nbf,nclosed,nmo),'d')
-    for a in occs:
-        for nu in bfs:
-            for b in occs:
-                for j in mos:
-                    temp[a,nu,b,j] = dot(orbs[:,j],temp2[a,nu,b,:])
-
-    # Transform mu -> i and repack integrals:
-    MOInts = zeros(totlen,'d')
-    for a in occs:
-        for j in mos:
-            for b in occs:
-                for i in mos:
-                    aibj = ijkl2intindex(a,i,b,j)
-                    MOInts[aibj] = dot(orbs[:,i],temp[a,:,b,j])
-
-    #print "Integral transform time = ",time()-t0
-    del temp,temp2,tempvec #force garbage collection now
-    return MOInts
-
-def MP2(aoints,orbs,orbe,nclosed,nvirt):
-    #moints = TransformInts(aoints,orbs)
-    moints = TransformIntsMP2(aoints,orbs,nclosed)
-    occs = range(nclosed)
-    unoccs = range(nclosed,nclosed+nvirt)
-    nocc = len(occs)
-
-    Epairs = zeros((nocc,nocc),'d')
-
-    Emp2 = 0
-    for a in occs:
-        for b in occs:
-            for r in unoccs:
-                for s in unoccs:
-                    arbs = moints[ijkl2intindex(a,r,b,s)]
-                    asbr = moints[ijkl2intindex(a,s,b,r)]
-                    Epairs[a,b] += arbs*(2*arbs-asbr)/\
-                                   (orbe[a]+orbe[b]-orbe[r]-orbe[s])
-    if VERBOSE:
-        print "MP2 pair energies"
-        for a in xrange(nocc):
-            for b in xrange(a):
-                print a,b,Epairs[a,b]+Epairs[b,a]
-            print a,a,Epairs[a,a]
+def MP2Pairs(aoints,orbs,orbe,nclosed,nvirt,**kwargs):
+    """\
+    Epairs = MP2Pairs(aoints,orbs,orbe,nclosed,nvirt,**kwargs)
+
+    The (nclosed,nclosed) MP2 pair energies e_ij, which sum to the
+    MP2 correlation energy.
+
+    The AO integrals are half transformed once to (mu nu|jb), and
+    the occupied orbitals i are then taken in batches, each one
+    finishing the transformation to (ia|jb) for all j,a,b and
+    summing the pair energies with the denominators of the whole
+    batch at once. Only the half transformed integrals and one
+    batch of (ia|jb) are held at a time.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    memory        256     MB of (ia|jb) integrals, and temporaries,
+                          per batch of occupied orbitals
+                          (settings.MP2Memory)
+    scratch       None    Directory in which to keep the half
+                          transformed integrals in a memory mapped
+                          file, or True for the system's temporary
+                          directory. None keeps them in memory.
+                          (settings.MP2Scratch)
+    block_size    256     Pairs unpacked at a time in the integral
+                          transformation (settings.TransformBlockSize)
+    """
+    memory = kwargs.get('memory',settings.MP2Memory)
+    scratch = kwargs.get('scratch',settings.MP2Scratch)
+    nbf = orbs.shape[0]
+    npair = nbf*(nbf+1)/2
+    occs = orbs[:,:nclosed]
+    virts = orbs[:,nclosed:nclosed+nvirt]
+    orbe = asarray(orbe)
+    eocc = orbe[:nclosed]
+    evirt = orbe[nclosed:nclosed+nvirt]
+
+    out = None
+    if scratch:
+        if scratch is True: scratch = None
+        out = memmap(TemporaryFile(dir=scratch),'d','w+',
+                     shape=(npair,nclosed,nvirt))
+    half = half_transform_ints(aoints,occs,virts,out=out,**kwargs)
+
+    # Four (nbatch,nclosed,nvirt,nvirt) arrays are held at once:
+    # (ia|jb), its exchange partner, the denominators and the product
+    nbatch = int(memory*1024*1024/(32.*nclosed*nvirt*nvirt))
+    nbatch = max(1,min(nbatch,nclosed))
+    logger.info("MP2: %d occupied orbitals per batch" % nbatch)
+
+    Epairs = zeros((nclosed,nclosed),'d')
+    for start in xrange(0,nclosed,nbatch):
+        batch = slice(start,min(start+nbatch,nclosed))
+        iajb = finish_transform_ints(half,occs[:,batch],virts,**kwargs)
+        K = iajb.transpose((0,2,1,3)) # [i,j,a,b]
+        denom = eocc[batch,newaxis,newaxis,newaxis] \
+                + eocc[newaxis,:,newaxis,newaxis] \
+                - evirt[:,newaxis] - evirt
+        E = K*(2*K-K.transpose((0,1,3,2)))/denom
+        Epairs[batch] = E.sum(axis=3).sum(axis=2)
+    return Epairs
+
+def RIMP2Pairs(bfs,atoms,orbs,orbe,nclosed,nvirt,**kwargs):
+    """\
+    Epairs = RIMP2Pairs(bfs,atoms,orbs,orbe,nclosed,nvirt,**kwargs)
+
+    The MP2 pair energies of MP2Pairs, with the (ia|jb) integrals
+    fitted to an auxiliary basis (RI-MP2):
+
+      (ia|jb) ~= sum_P B[i,a,P] B[j,b,P]
+
+    so only the (nclosed,nvirt,naux) B are kept, rather than the
+    four-index integrals, and the (ia|jb) are formed as B[i] B[j]^T
+    one occupied pair at a time. The bfs and atoms are used for the
+    three-centre integrals, as in density fitted SCF.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    aux_basis     None    Auxiliary basis set, as for
+                          DensityFitting.aux_basis
+    aux_ratio     2.5     Exponent ratio of the default aux basis
+    block_size    256     Pairs unpacked at a time in the integral
+                          transformation (settings.TransformBlockSize)
+
+    Reference: Feyereisen, Fitzgerald, Komornicki, Chem. Phys. Lett.
+    208, 359 (1993).
+    """
+    occs = orbs[:,:nclosed]
+    virts = orbs[:,nclosed:nclosed+nvirt]
+    orbe = asarray(orbe)
+    eocc = orbe[:nclosed]
+    evirt = orbe[nclosed:nclosed+nvirt]
+
+    abfs = aux_basis(atoms,bfs,**kwargs)
+    logger.info("RI-MP2: %d auxiliary functions" % len(abfs))
+    B = fitted_mo_ints(get3ints(bfs,abfs),get2cints(abfs),occs,virts,
+                       **kwargs)
+
+    Epairs = zeros((nclosed,nclosed),'d')
+    for i in xrange(nclosed):
+        for j in xrange(i+1):
+            K = dot(B[i],B[j].T) # (ia|jb)
+            denom = eocc[i] + eocc[j] - evirt[:,newaxis] - evirt
+            Epairs[i,j] = Epairs[j,i] = (K*(2*K-K.T)/denom).sum()
+    return Epairs
+
+def print_pairs(name,Epairs):
+    print "%s pair energies" % name
+    for a in xrange(len(Epairs)):
+        for b in xrange(a):
+            print a,b,Epairs[a,b]+Epairs[b,a]
+        print a,a,Epairs[a,a]
+    return
+
+def MP2(aoints,orbs,orbe,nclosed,nvirt,**kwargs):
+    """\
+    Emp2 = MP2(aoints,orbs,orbe,nclosed,nvirt,**kwargs)
+
+    The MP2 correlation energy of a closed shell system, from its
+    AO integrals, orbitals and orbital energies, correlating the
+    nclosed occupied and the first nvirt virtual orbitals. The pair
+    energies are printed if VERBOSE is set. Options are the same as
+    for MP2Pairs.
+    """
+    Epairs = MP2Pairs(aoints,orbs,orbe,nclosed,nvirt,**kwargs)
+    if VERBOSE: print_pairs("MP2",Epairs)
+    return sum(sum(Epairs))
+
+def RIMP2(bfs,atoms,orbs,orbe,nclosed,nvirt,**kwargs):
+    """\
+    Emp2 = RIMP2(bfs,atoms,orbs,orbe,nclosed,nvirt,**kwargs)
+
+    The RI-MP2 correlation energy; see RIMP2Pairs for the options.
+    Needs the basis functions and atoms in place of the integrals
+    used by MP2.
+    """
+    Epairs = RIMP2Pairs(bfs,atoms,orbs,orbe,nclosed,nvirt,**kwargs)
+    if VERBOSE: print_pairs("RI-MP2",Epairs)
     return sum(sum(Epairs))
 
-def EN2(aoints,orbs,orbe,nclosed,nvirt):
-    moints = TransformIntsMP2(aoints,orbs,nclosed)
-    occs = range(nclosed)
-    unoccs = range(nclosed,nclosed+nvirt)
-    nocc = len(occs)
-
-    Epairs = zeros((nocc,nocc),'d')
-
-    Emp2 = 0
-    for a in occs:
-        for b in occs:
-            for r in unoccs:
-                for s in unoccs:
-                    arbs = moints[ijkl2intindex(a,r,b,s)]
-                    asbr = moints[ijkl2intindex(a,s,b,r)]
-                    Epairs[a,b] += arbs*(2*arbs-asbr)/\
-                                   (orbe[a]+orbe[b]-orbe[r]-orbe[s])
-    if VERBOSE:
-        print "EN2 pair energies"
-        for a in xrange(nocc):
-            for b in xrange(a):
-                print a,b,Epairs[a,b]+Epairs[b,a]
-            print a,a,Epairs[a,a]
+def EN2(aoints,orbs,orbe,nclosed,nvirt,**kwargs):
+    Epairs = MP2Pairs(aoints,orbs,orbe,nclosed,nvirt,**kwargs)
+    if VERBOSE: print_pairs("EN2",Epairs)
     return sum(sum(Epairs))
 
 def test():
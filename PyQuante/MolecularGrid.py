@@ -18,9 +18,13 @@
 """
 from math import sqrt
 import settings
+import logging
 from AtomicGrid import AtomicGrid, Bragg
-from NumWrap import array,reshape,zeros,dot
+from NumWrap import array,reshape,zeros,ones,dot,newaxis,clip,argsort,\
+     searchsorted
 from PyQuante.cints import dist2
+from PyQuante.Bunch import Bunch
+logger = logging.getLogger("pyquante")
 
 class MolecularGrid:
     "Class to hold grid information from patched atomic grids"
@@ -58,6 +62,10 @@ class MolecularGrid:
         for atom in self.atoms:
             atom.grid = AtomicGrid(atom, **kwargs)
             self.atomgrids.append(atom.grid)
+        self.atom_npts = [len(agr) for agr in self.atomgrids]
+        for iat in xrange(len(self.atoms)):
+            logger.info("Atom %d (Z=%d): %d grid points" %
+                        (iat,self.atoms[iat].atno,self.atom_npts[iat]))
         return
 
     def patch_atoms_naive(self,**kwargs):
@@ -85,25 +93,17 @@ class MolecularGrid:
     def patch_atoms(self,**kwargs):
         """\
         This is Becke's patching algorithm. Attempting to implement
-        the normalization that is in eq 22 of that reference.
+        the normalization that is in eq 22 of that reference. The
+        grid_partition option selects Stratmann-Scuseria weights instead.
         """
         nat = len(self.atoms)
+        pairs = atom_pairs(self.atoms)
         for iat in xrange(nat):
-            ati = self.atoms[iat]
-            npts = len(self.atomgrids[iat])
-            for i in xrange(npts):
-                point = self.atomgrids[iat].points[i]
-                xp,yp,zp,wp = point.xyzw()
-                rip2 = dist2(ati.pos(),(xp,yp,zp))
-                rip = sqrt(rip2)
-                Pnum = 1
-                Pdenom = 0
-                for jat in xrange(nat):
-                    bap = becke_atomic_grid_p(jat,(xp,yp,zp),self.atoms,**kwargs)
-                    Pdenom += bap
-                    if iat == jat: P_iat = bap
-                Ptot = P_iat/Pdenom
-                point._w *= Ptot
+            points = self.atomgrids[iat].points
+            xyz = array([point.xyzw()[:3] for point in points])
+            Ptot = partition_weights(self.atoms,xyz,iat,pairs=pairs,**kwargs)
+            for i in xrange(len(points)):
+                points[i]._w *= Ptot[i]
         return
 
     def points(self):
@@ -258,6 +258,139 @@ def becke_atomic_grid_p(iat,(xp,yp,zp),atoms,**kwargs):
         sprod *= sbecke(mu)
     return sprod
 
+def atom_pairs(atoms):
+    """\
+    pairs = atom_pairs(atoms)
+
+    The interatomic quantities the partition weights need, which only
+    depend on the geometry, so a grid builds them once per molecule:
+    pairs.pos, the (nat,3) positions; pairs.rij, the (nat,nat)
+    distances; and pairs.neighbors[j] and pairs.neighbor_dists[j], the
+    other atoms sorted by their distance from atom j.
+    """
+    nat = len(atoms)
+    pos = array([atom.pos() for atom in atoms])
+    rij = ((pos[:,newaxis,:]-pos[newaxis,:,:])**2).sum(2)**0.5
+    neighbors = []
+    neighbor_dists = []
+    for j in xrange(nat):
+        order = [k for k in argsort(rij[j]) if k != j]
+        neighbors.append(order)
+        neighbor_dists.append(rij[j,order])
+    return Bunch(pos=pos,rij=rij,neighbors=neighbors,
+                 neighbor_dists=neighbor_dists)
+
+def becke_weights(atoms,xyz,iat,**kwargs):
+    """\
+    P = becke_weights(atoms,xyz,iat,pairs=None)
+
+    Vectorized version of the Becke patching: the partition weights,
+    P_iat/sum_j P_j, for an (npts,3) array xyz of points that belong
+    to atom iat. pairs, from atom_pairs(atoms), is made here if it
+    isn't given.
+    """
+    do_becke_hetero = kwargs.get('do_becke_hetero',settings.DFTBeckeHetero)
+    pairs = kwargs.get('pairs') or atom_pairs(atoms)
+    nat = len(atoms)
+    npts = len(xyz)
+    pos = pairs.pos
+    rp = ((xyz[:,newaxis,:]-pos[newaxis,:,:])**2).sum(2)**0.5
+    rij = pairs.rij.copy()
+    rij[range(nat),range(nat)] = 1 # Avoid 0/0; the diagonal is unused
+    if do_becke_hetero:
+        a = becke_hetero_a(atoms)
+    else:
+        a = zeros((nat,nat),'d')
+    P = zeros((npts,nat),'d')
+    for i in xrange(nat):
+        mu = (rp[:,i:i+1]-rp)/rij[i]
+        mu += a[i]*(1-mu*mu)
+        s = sbecke(mu)
+        s[:,i] = 1
+        P[:,i] = s.prod(1)
+    return P[:,iat]/P.sum(1)
+
+# Stratmann, Scuseria and Frisch, CPL 257, 213 (1996)
+SSF_A = 0.64
+
+def sssf(mu):
+    "Stratmann-Scuseria cell function"
+    z = clip(mu/SSF_A,-1,1)
+    g = (35*z - 35*pow(z,3) + 21*pow(z,5) - 5*pow(z,7))/16
+    return 0.5*(1-g)
+
+def stratmann_weights(atoms,xyz,iat,**kwargs):
+    """\
+    P = stratmann_weights(atoms,xyz,iat,pairs=None)
+
+    Stratmann-Scuseria partition weights for an (npts,3) array xyz of
+    points that belong to atom iat. Points well inside the atom's sphere
+    get a weight of one straight away, and each cell function only
+    includes the neighbors that are close enough to change it. Becke's
+    heteronuclear size adjustments aren't used. pairs, from
+    atom_pairs(atoms), is made here if it isn't given.
+    """
+    nat = len(atoms)
+    npts = len(xyz)
+    P = ones(npts,'d')
+    if nat == 1: return P
+    pairs = kwargs.get('pairs') or atom_pairs(atoms)
+    pos = pairs.pos
+    rij = pairs.rij
+    neighbors = pairs.neighbors
+    neighbor_dists = pairs.neighbor_dists
+
+    rip = ((xyz-pos[iat])**2).sum(1)**0.5
+    outer = rip >= 0.5*(1-SSF_A)*neighbor_dists[iat][0]
+    if not outer.any(): return P
+    rp = ((xyz[outer][:,newaxis,:]-pos[newaxis,:,:])**2).sum(2)**0.5
+
+    Pj = zeros((len(rp),nat),'d')
+    for j in xrange(nat):
+        # s(mu_ji) = 0 wherever mu_ji >= a, so P_j vanishes there
+        if j != iat and (rp[:,j]-rp[:,iat] >= SSF_A*rij[j,iat]).all():
+            continue
+        # s(mu_jk) = 1 unless R_jk < 2 r_j/(1-a)
+        nk = searchsorted(neighbor_dists[j],2*rp[:,j].max()/(1-SSF_A))
+        ks = neighbors[j][:nk]
+        mu = (rp[:,j:j+1]-rp[:,ks])/rij[j,ks]
+        Pj[:,j] = sssf(mu).prod(1)
+    P[outer] = Pj[:,iat]/Pj.sum(1)
+    return P
+
+def partition_weights(atoms,xyz,iat,**kwargs):
+    """\
+    P = partition_weights(atoms,xyz,iat,**options)
+
+    Partition weights for an (npts,3) array xyz of points that belong
+    to atom iat.
+
+    Options:         Value      Description
+    --------         -----      -----------
+    grid_partition   Becke      Becke's fuzzy cells (default)
+                     Stratmann  Stratmann-Scuseria weights, which are
+                                much cheaper for large molecules
+    pairs            None       Distances and neighbor lists from
+                                atom_pairs(atoms), which callers looping
+                                over the atoms should make once
+    """
+    scheme = kwargs.get('grid_partition',settings.DFTGridPartition)
+    if scheme == 'Stratmann':
+        return stratmann_weights(atoms,xyz,iat,**kwargs)
+    return becke_weights(atoms,xyz,iat,**kwargs)
+
+def becke_hetero_a(atoms):
+    "Becke's size adjustments a_ij for heteronuclear pairs (App A)"
+    nat = len(atoms)
+    a = zeros((nat,nat),'d')
+    for i in xrange(nat):
+        for j in xrange(nat):
+            if atoms[i].atno == atoms[j].atno: continue
+            chi = Bragg[atoms[i].atno]/Bragg[atoms[j].atno]
+            u = (chi-1.)/(chi+1.)
+            a[i,j] = max(min(u/(u*u-1),0.5),-0.5)
+    return a
+
 if __name__ == '__main__':
     # Test the becke projection grids
     from PyQuante.Molecule import Molecule
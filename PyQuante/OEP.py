@@ -14,7 +14,6 @@ from PyQuante.fermi_dirac import get_efermi, get_fermi_occs,mkdens_occs,\
 import logging
 
 logger = logging.getLogger("pyquante")
-gradcall=0
 
 class EXXSolver:
     "EXXSolver(solver)"
@@ -346,11 +345,6 @@ def get_exx_gradient(b,nbf,nel,nocc,ETemp,Enuke,S,h,Ints,H0,Gij,**kwargs):
                    1   Return energy,gradient 
                    2   Return energy,gradient,orbe,orbs 
     """
-    # Dump the gradient every 10 steps so we can restart...
-    global gradcall
-    gradcall += 1
-    #if gradcall % 5 == 0: logging.debug("B vector:\n%s" % b)
-
     # Form the new potential and the new orbitals
     energy,orbe,orbs,F = get_exx_energy(b,nbf,nel,nocc,ETemp,Enuke,
                                         S,h,Ints,H0,Gij,return_flag=2)
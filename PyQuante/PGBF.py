@@ -178,9 +178,9 @@ class PGBF(PrimitiveGTO):
         gx = -2*alpha*(x-x0)*fx
         gy = -2*alpha*(y-y0)*fy
         gz = -2*alpha*(z-z0)*fz
-        if I > 0: gx += pow(x-x0,I-1)*exp(-alpha*pow(x-x0,2))
-        if J > 0: gy += pow(y-y0,J-1)*exp(-alpha*pow(y-y0,2))
-        if K > 0: gz += pow(z-z0,K-1)*exp(-alpha*pow(z-z0,2))
+        if I > 0: gx += I*pow(x-x0,I-1)*exp(-alpha*pow(x-x0,2))
+        if J > 0: gy += J*pow(y-y0,J-1)*exp(-alpha*pow(y-y0,2))
+        if K > 0: gz += K*pow(z-z0,K-1)*exp(-alpha*pow(z-z0,2))
         return array([C*gx*fy*fz,C*fx*gy*fz,C*fx*fy*gz])
         
 
@@ -29,6 +29,7 @@ Options passed into solver.iterate(**options):
 Options:      Value   Description
 --------      -----   -----------
 etol          1e-5    Energy convergence criteria
+dtol          1e-4    Density convergence criteria on max|FDS-SDF|
 max_iter      50      Maximum SCF iterations
 (do_averaging  True    Use DIIS for accelerated convergence (default)
               False   No convergence acceleration)
@@ -46,6 +47,7 @@ logging.basicConfig(level=settings.LoggingLevel,
 class SCFIterator:
     def __init__(self,**kwargs):
         self.energy_history = [0]
+        self.error_history = []
         self.converged = False
         return
 
@@ -57,7 +59,7 @@ class SCFIterator:
             energy_var=abs(ham.energy - self.energy_history[-1]) 
             logging.info("Iteration: %d    Energy: %f    EnergyVar: %f"%
                         (self.iter,ham.energy,energy_var))
-            if self.is_converged(ham): break
+            if self.is_converged(ham,**kwargs): break
         if self.iter < self.max_iter:
             logging.info("PyQuante converged in %d iterations" % self.iter)
         else:
@@ -66,15 +68,18 @@ class SCFIterator:
         return
 
     def is_converged(self,ham,**kwargs):
+        from PyQuante.Convergence import is_converged
         self.energy = ham.get_energy()
-        etol = kwargs.get('etol',settings.ConvergenceCriteria)
+        error = ham.get_error()
         if not self.energy_history:
             self.energy_history.append(self.energy)
             return False
-        dE = abs(self.energy-self.energy_history[-1])
-        self.converged = dE < etol
-        #print self.energy,dE,etol,self.converged
+        dE = self.energy-self.energy_history[-1]
+        self.converged = is_converged(dE,error,**kwargs)
         self.energy_history.append(self.energy)
+        if error is not None:
+            logging.debug("Max commutator error: %g" % error)
+            self.error_history.append(error)
         return self.converged
 
     def __repr__(self):
@@ -141,6 +146,9 @@ class AbstractHamiltonian:
         raise Exception("AbstractHamiltonian::iterate")
     def get_energy(self,**kwargs):
         raise Exception("AbstractHamiltonian::get_energy")
+    def get_error(self,**kwargs):
+        "Max element of FDS-SDF, or None if only the energy can be tested"
+        return None
 
 class HFHamiltonian(AbstractHamiltonian):
     method='HF'
@@ -164,7 +172,9 @@ class HFHamiltonian(AbstractHamiltonian):
         nel = molecule.get_nel()
         nclosed,nopen = molecule.get_closedopen()
         logging.info("Nclosed/open = %d, %d" % (nclosed,nopen))
-        self.solver = SolverFactory(nel,nclosed,nopen,self.S,**kwargs)
+        self.solver = SolverFactory(nel,nclosed,nopen,self.S,
+                                    response=self.response,**kwargs)
+        if self.solver.does_averaging: self.DoAveraging = False
         return
 
     def __repr__(self):
@@ -175,6 +185,7 @@ class HFHamiltonian(AbstractHamiltonian):
         return '\n'.join(lstr)
 
     def get_energy(self): return self.energy
+    def get_error(self): return self.error
     def iterate(self,**kwargs):
         self.iterator.iterate(self,**kwargs)
         if self.iterator.converged:
@@ -184,6 +195,7 @@ class HFHamiltonian(AbstractHamiltonian):
     def update(self,**kwargs):
         from PyQuante.LA2 import trace2
         from PyQuante.Ints import getJ,getK
+        from PyQuante.Convergence import max_error
 
         if self.DoAveraging and self.dmat is not None:
             self.F = self.Averager.getF(self.F,self.dmat)
@@ -196,9 +208,15 @@ class HFHamiltonian(AbstractHamiltonian):
         self.Exc = -trace2(D,self.K)
         self.Eone = 2*trace2(D,self.h)
         self.F = self.h + 2*self.J - self.K
+        self.error = max_error(self.F,D,self.S)
         self.energy = self.Eone + self.Ej + self.Exc + self.Enuke + self.entropy
         return
 
+    def response(self,D1):
+        "Change in the Fock matrix for a change D1 in the density"
+        from PyQuante.Ints import getJ,getK
+        return 2*getJ(self.ERI,D1) - getK(self.ERI,D1)
+
 class DFTHamiltonian(AbstractHamiltonian):
     method='DFT'
     def __init__(self,molecule,**kwargs):
@@ -207,7 +225,8 @@ class DFTHamiltonian(AbstractHamiltonian):
         self.molecule = molecule
         logging.info("DFT calculation on system %s" % self.molecule.name)
         self.basis_set = BasisSet(molecule,**kwargs)
-        self.integrals = Integrals(molecule,self.basis_set,**kwargs)
+        self.integrals = Integrals(molecule,self.basis_set,exchange=False,
+                                   **kwargs)
         self.iterator = SCFIterator()
         self.h = self.integrals.get_h()
         self.S = self.integrals.get_S()
@@ -226,7 +245,9 @@ class DFTHamiltonian(AbstractHamiltonian):
         nel = molecule.get_nel()
         nclosed,nopen = molecule.get_closedopen()
         logging.info("Nclosed/open = %d, %d" % (nclosed,nopen))
-        self.solver = SolverFactory(nel,nclosed,nopen,self.S,**kwargs)
+        self.solver = SolverFactory(nel,nclosed,nopen,self.S,
+                                    response=self.response,**kwargs)
+        if self.solver.does_averaging: self.DoAveraging = False
         return
         
     def __repr__(self):
@@ -237,6 +258,7 @@ class DFTHamiltonian(AbstractHamiltonian):
         return '\n'.join(lstr)
 
     def get_energy(self): return self.energy
+    def get_error(self): return self.error
     def iterate(self,**kwargs): return self.iterator.iterate(self,**kwargs)
 
     def setup_grid(self,molecule,bfs,**kwargs):
@@ -244,14 +266,21 @@ class DFTHamiltonian(AbstractHamiltonian):
         from PyQuante.MG2 import MG2 as MolecularGrid
         grid_nrad = kwargs.get('grid_nrad',settings.DFTGridRadii)
         grid_fineness = kwargs.get('grid_fineness',settings.DFTGridFineness)
-        self.gr = MolecularGrid(molecule,grid_nrad,grid_fineness,**kwargs) 
-        self.gr.set_bf_amps(bfs)
+        # A grid from another geometry of the molecule can be passed in
+        # as grid, and is moved to this one rather than made again
+        self.gr = kwargs.get('grid')
+        if self.gr is None:
+            self.gr = MolecularGrid(molecule,grid_nrad,grid_fineness,**kwargs) 
+            self.gr.set_bf_amps(bfs)
+        else:
+            self.gr.update_geometry(molecule,bfs)
         return
 
     def update(self,**kwargs):
         from PyQuante.LA2 import trace2
         from PyQuante.Ints import getJ
         from PyQuante.dft import getXC
+        from PyQuante.Convergence import max_error
 
         #self.DoAveraging = kwargs.get('DoAveraging',True)
         #if self.DoAveraging:
@@ -272,9 +301,17 @@ class DFTHamiltonian(AbstractHamiltonian):
         self.Eone = 2*trace2(D,self.h)
 
         self.F = self.h+2*self.J+self.XC
+        self.error = max_error(self.F,D,self.S)
         self.energy = self.Eone + self.Ej + self.Exc + self.Enuke + self.entropy
         return
 
+    def response(self,D1):
+        """Approximate change in the Fock matrix for a change D1 in the
+        density. The XC kernel is neglected, so only the Coulomb part is
+        included."""
+        from PyQuante.Ints import getJ
+        return 2*getJ(self.ERI,D1)
+
 class UHFHamiltonian(AbstractHamiltonian):
     method='UHF'
     def __init__(self,molecule,**kwargs):
@@ -296,8 +333,10 @@ class UHFHamiltonian(AbstractHamiltonian):
         self.entropy = None
         nalpha,nbeta = molecule.get_alphabeta()
         logging.info("Nalpha/beta = %d, %d" % (nalpha,nbeta))
-        self.solvera = SolverFactory(2*nalpha,nalpha,0,self.S,**kwargs)
-        self.solverb = SolverFactory(2*nbeta,nbeta,0,self.S,**kwargs)
+        self.solvera = SolverFactory(2*nalpha,nalpha,0,self.S,
+                                     response=self.response,**kwargs)
+        self.solverb = SolverFactory(2*nbeta,nbeta,0,self.S,
+                                     response=self.response,**kwargs)
         return
 
     def __repr__(self):
@@ -308,11 +347,13 @@ class UHFHamiltonian(AbstractHamiltonian):
         return '\n'.join(lstr)
 
     def get_energy(self): return self.energy
+    def get_error(self): return self.error
     def iterate(self,**kwargs): return self.iterator.iterate(self,**kwargs)
 
     def update(self,**kwargs):
         from PyQuante.LA2 import trace2
         from PyQuante.Ints import getJ,getK
+        from PyQuante.Convergence import max_error
 
         self.amat,entropya = self.solvera.solve(self.Fa)
         self.bmat,entropyb = self.solverb.solve(self.Fb)
@@ -331,9 +372,18 @@ class UHFHamiltonian(AbstractHamiltonian):
         self.Eone = trace2(D,self.h)
         self.Fa = self.h + self.J - self.Ka
         self.Fb = self.h + self.J - self.Kb
+        self.error = max(max_error(self.Fa,Da,self.S),
+                         max_error(self.Fb,Db,self.S))
         self.energy = self.Eone + self.Ej + self.Exc + self.Enuke + self.entropy
         return
 
+    def response(self,D1):
+        """Change in the Fock matrix of one spin for a change D1 in the
+        density of that spin. The coupling to the other spin through J
+        is neglected."""
+        from PyQuante.Ints import getJ,getK
+        return getJ(self.ERI,D1) - getK(self.ERI,D1)
+
 class ROHFHamiltonian(AbstractHamiltonian):
     method='ROHF'
     def __init__(self,molecule,**kwargs):
@@ -420,7 +470,8 @@ class MINDO3Hamiltonian(AbstractHamiltonian):
     method='MINDO3'
     def __init__(self,molecule,**kwargs):
         from PyQuante.MINDO3 import initialize, get_nbf, get_reference_energy,\
-             get_F0, get_nel,get_open_closed,get_enuke,get_guess_D
+             get_F0, get_nel,get_open_closed,get_enuke,get_guess_D,\
+             get_gamma_matrix
         self.molecule = molecule
         logging.info("MINDO3 calculation on system %s" % self.molecule.name)
         self.iterator = SCFIterator()
@@ -439,6 +490,7 @@ class MINDO3Hamiltonian(AbstractHamiltonian):
         self.nbf = get_nbf(self.molecule)
         self.eref = get_reference_energy(self.molecule)
         self.F0 = get_F0(self.molecule)
+        self.Gij = get_gamma_matrix(self.molecule)
         self.F = self.F0
         self.D = get_guess_D(self.molecule)
         logging.info("Nel = %d Nclosed = %d Nopen = %d Enuke = %f Nbf = %d"
@@ -466,7 +518,7 @@ class MINDO3Hamiltonian(AbstractHamiltonian):
         avg = 0.25
         Fold = self.F
         self.F1 = get_F1(self.molecule,self.D)
-        self.F2 = get_F2(self.molecule,self.D)
+        self.F2 = get_F2(self.molecule,self.D,self.Gij)
         self.F = self.F0+self.F1+self.F2
         #self.F = avg*self.F + (1-avg)*Fold
         
@@ -488,7 +540,8 @@ class MINDO3Hamiltonian(AbstractHamiltonian):
 class UMINDO3Hamiltonian(AbstractHamiltonian):
     def __init__(self,molecule,**kwargs):
         from PyQuante.MINDO3 import initialize, get_nbf, get_reference_energy,\
-             get_F0, get_nel,get_open_closed,get_enuke,get_guess_D
+             get_F0, get_nel,get_open_closed,get_enuke,get_guess_D,\
+             get_gamma_matrix
         self.molecule = molecule
         logging.info("uMINDO3 calculation on system %s" % self.molecule.name)
         self.iterator = SCFIterator()
@@ -508,6 +561,7 @@ class UMINDO3Hamiltonian(AbstractHamiltonian):
         self.nbf = get_nbf(self.molecule)
         self.eref = get_reference_energy(self.molecule)
         self.F0 = get_F0(self.molecule)
+        self.Gij = get_gamma_matrix(self.molecule)
         self.Fa = self.Fb = self.F0
         self.nalpha = self.nclosed+self.nopen
         self.nbeta = self.nclosed
@@ -535,8 +589,8 @@ class UMINDO3Hamiltonian(AbstractHamiltonian):
         from PyQuante.MINDO3 import get_F1_open, get_F2_open
         F1a = get_F1_open(self.molecule,self.Da,self.Db)
         F1b = get_F1_open(self.molecule,self.Db,self.Da)
-        F2a = get_F2_open(self.molecule,self.Da,self.Db)
-        F2b = get_F2_open(self.molecule,self.Db,self.Da)
+        F2a = get_F2_open(self.molecule,self.Da,self.Db,self.Gij)
+        F2b = get_F2_open(self.molecule,self.Db,self.Da,self.Gij)
         self.Fa = self.F0+F1a+F2a
         self.Fb = self.F0+F1b+F2b
         return
@@ -571,9 +625,14 @@ def SolverFactory(nel,nclosed,nopen,S,**kwargs):
         return kwargs["SolverConstructor"](nel,nclosed,nopen,S,**kwargs)
     if kwargs.get('etemp',settings.ElectronTemperature):
         return FermiDiracSolver(nel,nclosed,nopen,S,**kwargs)
+    if kwargs.get('solver_method',settings.SolverMethod) == 'Newton':
+        return NewtonSolver(nel,nclosed,nopen,S,**kwargs)
     return BasicSolver(nel,nclosed,nopen,S,**kwargs)
 
 class AbstractSolver:
+    # Set to True in solvers that do their own convergence acceleration,
+    # in which case the Hamiltonian shouldn't do DIIS on the Fock matrix
+    does_averaging = False
     def __init__(self,S,**kwargs):
         raise Exception("AbstractSolver::__init__")
     def solve(self,ham,**kwargs):
@@ -581,32 +640,35 @@ class AbstractSolver:
 
 class BasicSolver(AbstractSolver):
     def __init__(self,nel,nclosed,nopen,S,**kwargs):
+        from PyQuante.LA2 import GeneralizedEigensolver
         self.S = S
         self.nel = nel
         self.nclosed = nclosed
         self.nopen = nopen
+        self.eigensolver = GeneralizedEigensolver(S)
         return
 
     def solve(self,H,**kwargs):
-        from PyQuante.LA2 import geigh,mkdens_spinavg
-        self.orbe,self.orbs = geigh(H,self.S)
+        from PyQuante.LA2 import mkdens_spinavg
+        self.orbe,self.orbs = self.eigensolver.solve(H)
         self.D = mkdens_spinavg(self.orbs,self.nclosed,self.nopen)
         self.entropy = 0
         return self.D,self.entropy
 
 class FermiDiracSolver(AbstractSolver):
     def __init__(self,nel,nclosed,nopen,S,**kwargs):
+        from PyQuante.LA2 import GeneralizedEigensolver
         self.S = S
         self.nel = nel
         self.nclosed = nclosed
         self.nopen = nopen
         self.etemp = kwargs.get('etemp',settings.ElectronTemperature)
+        self.eigensolver = GeneralizedEigensolver(S)
         return
 
     def solve(self,H,**kwargs):
-        from PyQuante.LA2 import geigh
         from PyQuante.fermi_dirac import mkdens_fermi
-        self.orbe,self.orbs = geigh(H,self.S)
+        self.orbe,self.orbs = self.eigensolver.solve(H)
         self.D,self.entropy = mkdens_fermi(self.nel,self.orbe,
                                            self.orbs,self.etemp)
         return self.D,self.entropy
@@ -632,7 +694,8 @@ class SubspaceSolver(AbstractSolver):
 
     def solve(self,H,**kwargs):
         from PyQuante.LA2 import mkdens_spinavg,simx,geigh
-        from PyQuante.NumWrap import matrixmultiply,eigh
+        from PyQuante.NumWrap import matrixmultiply,eigh,qr,concatenate,\
+             identity
         if self.first_iteration:
             self.first_iteration = False
             self.orbe,self.orbs = geigh(H,self.S)
@@ -642,6 +705,10 @@ class SubspaceSolver(AbstractSolver):
                 self.orbe,orbs = self.solver(Ht,self.nroots)
             else:
                 self.orbe,orbs = self.solver(Ht)
+            if orbs.shape[1] < len(Ht):
+                # Only nroots vectors (e.g. davidson): fill in the rest
+                # of the space, so that later iterations can use it
+                orbs = qr(concatenate((orbs,identity(len(Ht))),1))[0]
             self.orbs = matrixmultiply(self.orbs,orbs)
         self.D = mkdens_spinavg(self.orbs,self.nclosed,self.nopen)
         self.entropy = 0
@@ -666,6 +733,164 @@ class DmatSolver(AbstractSolver):
         self.D = solver.D
         return self.D,self.entropy
 
+class NewtonSolver(AbstractSolver):
+    """\
+    Second-order SCF solver. Uses DIIS-accelerated diagonalization until
+    the DIIS error stalls, and then switches to truncated Newton steps
+    on the occupied-virtual orbital rotations. The orbital Hessian is
+    applied to trial rotations through the Fock matrix response to the
+    trial density, which the Hamiltonian supplies as
+
+      G = response(D1)
+
+    Options:         Value   Description
+    --------         -----   -----------
+    response         None    Fock matrix response to a density change
+    newton_stall     3       Switch to Newton steps if the DIIS error 
+    newton_ratio     0.5      hasn't dropped by this ratio in this many its
+    newton_max_step  0.5     Trust radius for the rotation step
+    newton_micro     10      Max CG iterations per Newton step
+
+    Without a response function, or for a spin-averaged open shell,
+    the solver never leaves the DIIS phase: the Newton step only
+    rotates doubly occupied (or, in UHF, singly occupied spin)
+    orbitals into empty ones. UHF open shells use one solver per
+    spin, each of which has no open orbitals, and so do get Newton
+    steps; ROHF and spin-averaged HF open shells don't.
+
+    After a Newton step, orbe is the diagonal of the Fock matrix in
+    the new orbitals, which only equals the orbital energies at
+    convergence.
+    """
+    does_averaging = True
+    def __init__(self,nel,nclosed,nopen,S,**kwargs):
+        from PyQuante.LA2 import GeneralizedEigensolver
+        from PyQuante.Convergence import DIIS
+        self.S = S
+        self.nel = nel
+        self.nclosed = nclosed
+        self.nopen = nopen
+        self.response = kwargs.get('response')
+        self.nstall = kwargs.get('newton_stall',settings.NewtonStallIterations)
+        self.stall_ratio = kwargs.get('newton_ratio',settings.NewtonStallRatio)
+        self.max_step = kwargs.get('newton_max_step',settings.NewtonMaxStep)
+        self.nmicro = kwargs.get('newton_micro',settings.NewtonMicroIterations)
+        self.eigensolver = GeneralizedEigensolver(S)
+        self.averager = DIIS(S)
+        self.errors = []
+        self.newton = False
+        self.D = None
+        return
+
+    def solve(self,H,**kwargs):
+        from PyQuante.LA2 import mkdens_spinavg
+        from PyQuante.Convergence import max_error
+        if self.D is None:
+            self.orbe,self.orbs = self.eigensolver.solve(H)
+        elif self.newton:
+            self.errors.append(max_error(H,self.D,self.S))
+            self.newton_step(H)
+        else:
+            F = self.averager.getF(H,self.D)
+            self.errors.append(self.averager.error())
+            self.orbe,self.orbs = self.eigensolver.solve(F)
+            if self.is_stalled():
+                logging.info("DIIS stalled at error %g, switching to Newton"
+                             % self.errors[-1])
+                self.newton = True
+        self.D = mkdens_spinavg(self.orbs,self.nclosed,self.nopen)
+        self.entropy = 0
+        return self.D,self.entropy
+
+    def is_stalled(self):
+        if self.response is None or self.nopen: return False
+        if len(self.errors) <= self.nstall: return False
+        return self.errors[-1] > self.stall_ratio*self.errors[-1-self.nstall]
+
+    def newton_step(self,F):
+        """Rotate the orbitals by an approximate solution of the Newton
+        equations Hx = -g, where, in semicanonical orbitals,
+
+          g_ai = F_ai
+          (Hx)_ai = (e_a-e_i)x_ai + [Cv'G(D1)Co]_ai
+          D1 = Cv x Co' + Co x' Cv'
+        """
+        from PyQuante.LA2 import simx,SymOrth
+        from PyQuante.NumWrap import matrixmultiply,eigh,identity,\
+             zeros,concatenate,newaxis,diagonal
+        nocc = self.nclosed
+        C = self.orbs
+
+        # Semicanonicalize, which leaves the density unchanged
+        Fmo = simx(F,C)
+        eo,Uo = eigh(Fmo[:nocc,:nocc])
+        ev,Uv = eigh(Fmo[nocc:,nocc:])
+        Co = matrixmultiply(C[:,:nocc],Uo)
+        Cv = matrixmultiply(C[:,nocc:],Uv)
+        g = matrixmultiply(Cv.T,matrixmultiply(F,Co))
+
+        denom = ev[:,newaxis]-eo[newaxis,:]
+        denom[denom < 0.1] = 0.1 # Level shift nearly degenerate pairs
+
+        def hess(x):
+            D1 = matrixmultiply(Cv,matrixmultiply(x,Co.T))
+            D1 = D1 + D1.T
+            return denom*x + matrixmultiply(Cv.T,
+                                   matrixmultiply(self.response(D1),Co))
+
+        x = truncated_cg(hess,-g,denom,self.max_step,self.nmicro)
+
+        # Rotate the orbitals by exp(kappa), to second order, and
+        # reorthonormalize
+        nmo = C.shape[1]
+        kappa = zeros((nmo,nmo),'d')
+        kappa[nocc:,:nocc] = x
+        kappa[:nocc,nocc:] = -x.T
+        U = identity(nmo,'d') + kappa + 0.5*matrixmultiply(kappa,kappa)
+        C = matrixmultiply(concatenate((Co,Cv),1),U)
+        self.orbs = matrixmultiply(C,SymOrth(simx(self.S,C)))
+
+        # The diagonal of F in the new orbitals. These aren't
+        # eigenvalues, since the orbitals don't diagonalize F, but they
+        # go over to the orbital energies as the SCF converges.
+        self.orbe = diagonal(simx(F,self.orbs))
+        return
+
+def truncated_cg(hess,b,precond,radius,maxiter,**kwargs):
+    """\
+    x = truncated_cg(hess,b,precond,radius,maxiter)
+    Approximately solve hess(x) = b by preconditioned conjugate gradients,
+    stopping at the trust radius or when negative curvature is found
+    (Steihaug's method). The vectors can be arrays of any shape.
+    """
+    from math import sqrt
+    from PyQuante.NumWrap import zeros
+    tol = kwargs.get('tol',0.1)
+    def norm(v): return sqrt((v*v).sum())
+    x = zeros(b.shape,'d')
+    r = b.copy()
+    z = r/precond
+    p = z.copy()
+    rz = (r*z).sum()
+    rtol = tol*norm(b)
+    for i in xrange(maxiter):
+        Hp = hess(p)
+        pHp = (p*Hp).sum()
+        if pHp <= 0:
+            # Negative curvature: go to the trust radius along p
+            return x + (radius-norm(x))*p/norm(p)
+        alpha = rz/pHp
+        x = x + alpha*p
+        if norm(x) > radius:
+            return x*(radius/norm(x))
+        r = r - alpha*Hp
+        if norm(r) < rtol: break
+        z = r/precond
+        rznew = (r*z).sum()
+        p = z + (rznew/rz)*p
+        rz = rznew
+    return x
+
 class UnitTests(unittest.TestCase):
     def setUp(self):
         from PyQuante.Molecule import Molecule
@@ -790,6 +1015,32 @@ class UnitTests(unittest.TestCase):
         h2_hf.iterate()
         self.assertAlmostEqual(h2_hf.energy,-1.130501,4)
 
+    def testNewtonSolver(self):
+        h2_hf = SCF(self.h2,method='HF',solver_method='Newton')
+        h2_hf.iterate()
+        self.assertAlmostEqual(h2_hf.energy,-1.130501,4)
+
+    def testLiUHFNewton(self):
+        li_uhf = SCF(self.li,method='UHF',solver_method='Newton')
+        li_uhf.iterate()
+        self.assertAlmostEqual(li_uhf.energy,-7.431364,4)
+
+    def testNewtonSteps(self):
+        # A zero stall ratio switches to Newton steps after two DIIS steps
+        h2_hf = SCF(self.h2,method='HF',solver_method='Newton',
+                    newton_stall=1,newton_ratio=0.)
+        h2_hf.iterate()
+        self.assertTrue(h2_hf.solver.newton)
+        self.assertAlmostEqual(h2_hf.energy,-1.130501,4)
+
+    def testLiUHFNewtonSteps(self):
+        li_uhf = SCF(self.li,method='UHF',solver_method='Newton',
+                     newton_stall=1,newton_ratio=0.)
+        li_uhf.iterate()
+        self.assertTrue(li_uhf.solvera.newton)
+        self.assertTrue(li_uhf.solverb.newton)
+        self.assertAlmostEqual(li_uhf.energy,-7.431364,4)
+
     ########## Basis set tests ##########
 
     def testSTO3G(self):
@@ -5,70 +5,120 @@ Solvers.py - explores ways to use different eigensolvers in Python
 import settings
 from PyQuante import Molecule
 from PyQuante.NumWrap import eigh,zeros,matrixmultiply,transpose,dot,\
-     identity,diagonal,array
+     identity,diagonal,array,argsort,arange,newaxis,where
 from math import sqrt
+import logging
+logger = logging.getLogger("pyquante")
 
 
 ### General functions required for the davidson solver
-def appendColumn(A,newVec):
+def orthonormal_columns(Q,B,ntol):
     """\
-    Append a column vector onto matrix A; this creates a new
-    matrix and does the relevant copying.
+    Orthonormalize the columns of Q to the orthonormal columns of B
+    and to each other, dropping those whose norm falls below ntol.
     """
-    n,m = A.shape
-    Anew = zeros((n,m+1),'d')
-    Anew[:,:m] = A
-    Anew[:,m] = newVec
-    return Anew
-
-def orthog(q,qs,**kwargs):
-    "Orthonormalize vector q to set of vectors qs"
-    nbasis,nvec = qs.shape
-    north = kwargs.get('north',nvec)
-    #if north==-1: north = nvec
-    #north = min(north,nvec)
-    for i in xrange(north):
-        olap = dot(q,qs[:,i])
-        q -= olap*qs[:,i]
-    norm = sqrt(dot(q,q))
-    return norm
+    cols = []
+    for i in xrange(Q.shape[1]):
+        q = Q[:,i]
+        for k in xrange(2): # Twice is enough
+            q = q - dot(B,dot(q,B))
+            for c in cols: q = q - dot(q,c)*c
+        norm = sqrt(dot(q,q))
+        if norm > ntol: cols.append(q/norm)
+    Qnew = zeros((Q.shape[0],len(cols)),'d')
+    for i in xrange(len(cols)): Qnew[:,i] = cols[i]
+    return Qnew
 
 def davidson(A,nroots,**kwargs):
-    etol = kwargs.get('etol',settings.DavidsonEvecTolerance) # tolerance on the eigenval convergence
-    ntol = kwargs.get('ntol',settings.DavidsonNormTolerance) # tolerance on the vector norms for addn
-    n,m = A.shape
-    ninit = max(nroots,2)
-    B = zeros((n,ninit),'d')
-    for i in xrange(ninit): B[i,i] = 1.
-
-    nc = 0 # number of converged roots
-    eigold = 1e10
-    for iter in xrange(n):
-        if nc >= nroots: break
-        D = matrixmultiply(A,B)
-        S = matrixmultiply(transpose(B),D)
-        m = len(S)
-        eval,evec = eigh(S)
-
-        bnew = zeros(n,'d')
-        for i in xrange(m):
-            bnew += evec[i,nc]*(D[:,i] - eval[nc]*B[:,i])
-
-        for i in xrange(n):
-            denom = max(eval[nc]-A[i,i],1e-8) # Maximum amplification factor
-            bnew[i] /= denom
-
-        norm = orthog(bnew,B)
-        bnew = bnew / norm
-
-        if abs(eval[nc]-eigold) < etol:
-            nc += 1
-        eigold = eval[nc]
-        if norm > ntol: B = appendColumn(B,bnew)
-
-    E = eval[:nroots]
-    nv = len(evec)
-    V = matrixmultiply(B[:,:nv],evec)
+    """\
+    E,V = davidson(A,nroots,**kwargs)
+
+    The nroots lowest eigenvalues E and eigenvectors V (as columns)
+    of the symmetric matrix A, by block_davidson. A may also be a
+    function returning A*B for an (n,k) block of vectors B, in which
+    case the diagonal of A must be given as the diag option. The
+    other options are those of block_davidson.
+    """
+    if not callable(A):
+        return block_davidson(lambda B: dot(A,B),diagonal(A),nroots,**kwargs)
+    diag = kwargs.pop('diag',None)
+    if diag is None:
+        raise ValueError("davidson needs the diagonal of a matrix-free A")
+    return block_davidson(A,diag,nroots,**kwargs)
+
+def block_davidson(sigma,diag,nroots,**kwargs):
+    """\
+    E,V = block_davidson(sigma,diag,nroots,**kwargs)
+
+    The nroots lowest eigenvalues E and eigenvectors V (as columns)
+    of a symmetric matrix A known only through its diagonal diag
+    and the function sigma(B), which returns A*B for an (n,k) block
+    of vectors B. Each iteration adds the preconditioned residuals
+    of all of the unconverged roots to the subspace, and calls sigma
+    on these new vectors only. When the subspace is full, it is
+    collapsed to the current approximations to the roots.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    rtol          1e-5    Largest residual norm of a converged root
+                          (settings.DavidsonResidualTolerance)
+    ntol          1e-10   Smallest norm of a new vector kept after
+                          orthogonalization
+                          (settings.DavidsonNormTolerance)
+    maxiter       100     Maximum number of iterations
+                          (settings.DavidsonMaxIter)
+    nguess        nroots  Number of unit vectors, on the smallest
+                          elements of diag, to start from
+    max_subspace  20*     Most vectors in the subspace before it is
+                  nroots  collapsed (settings.DavidsonMaxSubspace
+                          per root)
+    """
+    rtol = kwargs.get('rtol',settings.DavidsonResidualTolerance)
+    ntol = kwargs.get('ntol',settings.DavidsonNormTolerance)
+    maxiter = kwargs.get('maxiter',settings.DavidsonMaxIter)
+    n = len(diag)
+    nroots = min(nroots,n)
+    nguess = min(max(kwargs.get('nguess',nroots),nroots),n)
+    maxsub = kwargs.get('max_subspace',settings.DavidsonMaxSubspace*nroots)
+    maxsub = min(max(maxsub,nguess,2*nroots),n)
+
+    # The subspace B and A*B, of which the first m columns are in use
+    B = zeros((n,maxsub),'d')
+    AB = zeros((n,maxsub),'d')
+    m = 0
+    new = zeros((n,nguess),'d')
+    new[argsort(diag)[:nguess],arange(nguess)] = 1.
+    for iter in xrange(maxiter):
+        k = new.shape[1]
+        B[:,m:m+k] = new
+        AB[:,m:m+k] = sigma(new)
+        m += k
+        E,U = eigh(dot(B[:,:m].T,AB[:,:m]))
+        E,U = E[:nroots],U[:,:nroots]
+        V = dot(B[:,:m],U)
+        AV = dot(AB[:,:m],U)
+        R = AV-V*E
+        rnorms = (R*R).sum(axis=0)**0.5
+        logger.debug("Davidson iteration %d: %d vectors, max residual %g" %
+                     (iter,m,max(rnorms)))
+        todo = rnorms > rtol
+        if not todo.any(): break
+
+        # Diagonal (Davidson) preconditioner, keeping away from zero
+        denom = E[todo]-diag[:,newaxis]
+        denom = where(abs(denom) < 1e-8,1e-8,denom)
+        new = orthonormal_columns(R[:,todo]/denom,B[:,:m],ntol)
+        if not new.shape[1]: break
+        if m+new.shape[1] > maxsub:
+            # Collapse onto the roots. The new vectors stay orthogonal
+            # to them, since the roots lie in the old subspace
+            B[:,:nroots] = V
+            AB[:,:nroots] = AV
+            m = nroots
+            new = new[:,:maxsub-m]
+    else:
+        logger.warning("block_davidson: %d roots not converged in %d"\
+                       " iterations" % (todo.sum(),maxiter))
     return E,V
 
 
@@ -14,9 +14,9 @@ import settings
 from Ints import getbasis,getJ,getints
 #from MolecularGrid import MolecularGrid
 from MG2 import MG2 as MolecularGrid
-from LA2 import geigh,mkdens,mkdens_spinavg,trace2
+from LA2 import geigh,mkdens,mkdens_spinavg,trace2,GeneralizedEigensolver
 from fermi_dirac import get_efermi, get_fermi_occs,mkdens_occs, get_entropy
-from NumWrap import zeros,dot,ravel,transpose,sum
+from NumWrap import zeros,dot,ravel,transpose,sum,ix_,newaxis,concatenate
 from DFunctionals import XC,need_gradients
 from time import time
 from Convergence import DIIS
@@ -52,66 +52,90 @@ def getXC(gr,nel,**kwargs):
         amdens = gr.density.T
         amgamma = gr.gamma.T
 
-    fxc,dfxcdna,dfxcdnb,dfxcdgaa,dfxcdgab,dfxcdgbb = XC(amdens,amgamma,**kwargs)
+    if gr.version == 2 and gr.nthreads > 1:
+        # The functionals are pointwise, so can be done a block at a time
+        def block_xc(block):
+            sl = block.sl
+            return XC(amdens[:,sl],amgamma[:,sl],**kwargs)
+        terms = list(gr.map_blocks(block_xc))
+        fxc,dfxcdna,dfxcdnb,dfxcdgaa,dfxcdgab,dfxcdgbb = \
+            [concatenate([term[i] for term in terms]) for i in xrange(6)]
+    else:
+        fxc,dfxcdna,dfxcdnb,dfxcdgaa,dfxcdgab,dfxcdgbb = \
+            XC(amdens,amgamma,**kwargs)
 
     Exc = dot(weight,fxc)
 
-    wva = weight*dfxcdna  # Combine w*v in a vector for multiplication by bfs
-
-    # First do the part that doesn't depend upon gamma
-    nbf = gr.get_nbf()
-    Fxca = zeros((nbf,nbf),'d')
-    for i in xrange(nbf):
-        wva_i = wva*gr.bfgrid[:,i] 
-        for j in xrange(nbf):
-            Fxca[i,j] = dot(wva_i,gr.bfgrid[:,j])
-
-    # Now do the gamma-dependent part.
+    # The gradient-dependent part is contracted with grad(chia*chib):
     # Fxc_a += dot(2 dfxcdgaa*graddensa + dfxcdgab*graddensb,grad(chia*chib))
-    # We can do the dot product as
-    #  sum_grid sum_xyz A[grid,xyz]*B[grid,xyz]
-    # or a 2d trace product
-    # Here A contains the dfxcdgaa stuff
-    #      B contains the grad(chia*chib)
+    # Here A contains the dfxcdgaa stuff, dimensioned (npts,3)
 
     # Possible errors: gr.grad() here should be the grad of the b part?
+    Aa = Ab = None
     if do_grad_dens:
-        # A,B are dimensioned (npts,3)
-        A = transpose(0.5*transpose(gr.grad())*(weight*(2*dfxcdgaa+dfxcdgab)))
-        for a in xrange(nbf):
-            for b in xrange(a+1):
-                B = gr.grad_bf_prod(a,b)
-                Fxca[a,b] += sum(ravel(A*B))
-                Fxca[b,a] = Fxca[a,b]
-    if not do_spin_polarized: return Exc,Fxca
+        grad = gr.grad()
+        Aa = 0.5*grad*(weight*(2*dfxcdgaa+dfxcdgab))[:,newaxis]
+        Ab = 0.5*grad*(weight*(2*dfxcdgbb+dfxcdgab))[:,newaxis]
 
-    wvb = weight*dfxcdnb  # Combine w*v in a vector for multiplication by bfs
+    Fxca = xc_matrix(gr,weight*dfxcdna,Aa)
+    if not do_spin_polarized: return Exc,Fxca
+    Fxcb = xc_matrix(gr,weight*dfxcdnb,Ab)
+    return Exc,Fxca,Fxcb
 
-    # First do the part that doesn't depend upon gamma
-    Fxcb = zeros((nbf,nbf),'d')
-    for i in xrange(nbf):
-        wvb_i = wvb*gr.bfgrid[:,i] 
-        for j in xrange(nbf):
-            Fxcb[i,j] = dot(wvb_i,gr.bfgrid[:,j])
+def xc_matrix(gr,wv,A=None):
+    """\
+    Fxc = xc_matrix(gr,wv,A=None)
+    Form the XC matrix as
 
-    # Now do the gamma-dependent part.
-    # Fxc_b += dot(2 dfxcdgbb*graddensb + dfxcdgab*graddensa,grad(chia*chib))
-    # We can do the dot product as
-    #  sum_grid sum_xyz A[grid,xyz]*B[grid,xyz]
-    # or a 2d trace product
-    # Here A contains the dfxcdgaa stuff
-    #      B contains the grad(chia*chib)
+      Fxc = B'diag(wv)B + B'G + G'B,  G = sum_k A[:,k]*dB/dk
 
-    # Possible errors: gr.grad() here should be the grad of the b part?
-    if do_grad_dens:
-        # A,B are dimensioned (npts,3)
-        A = transpose(0.5*transpose(gr.grad())*(weight*(2*dfxcdgbb+dfxcdgab)))
-        for a in xrange(nbf):
-            for b in xrange(a+1):
-                B = gr.grad_bf_prod(a,b)
-                Fxcb[a,b] += sum(ravel(A*B))
-                Fxcb[b,a] = Fxcb[a,b]
-    return Exc,Fxca,Fxcb
+    where B holds the basis functions over the grid, wv is the weight
+    times the XC potential, and A, for gradient-corrected functionals,
+    holds the (npts,3) coefficients of grad(chia*chib). MG2 grids are
+    done a block at a time, over the functions that reach each block.
+    """
+    if gr.version == 1:
+        bfgrads = None
+        if A is not None: bfgrads = gr.bfgrads
+        return block_xc_matrix(gr.bfgrid,bfgrads,wv,A)
+    def block_matrix(block):
+        sl = block.sl
+        bfgrid,bfgrads = gr.block_values(block)
+        if A is None:
+            return block.ibfs,block_xc_matrix(bfgrid,None,wv[sl])
+        return block.ibfs,block_xc_matrix(bfgrid,bfgrads,wv[sl],A[sl])
+    # The blocks are added in order, so threads don't change the sums
+    nbf = gr.get_nbf()
+    Fxc = zeros((nbf,nbf),'d')
+    for ibfs,Fblock in gr.map_blocks(block_matrix):
+        Fxc[ix_(ibfs,ibfs)] += Fblock
+    return Fxc
+
+# Points per single precision product in block_xc_matrix
+XC_SUM_POINTS = 128
+
+def block_xc_matrix(bfgrid,bfgrads,wv,A=None):
+    "XC matrix over one block of points; see xc_matrix"
+    # Symmetrize by forming C = 0.5*diag(wv)B + G, and then B'C + C'B
+    # The products are done in the type of B, which is single precision
+    # for a single_precision MG2 grid. In that case B'C is summed in
+    # float64 over products of at most XC_SUM_POINTS points each, so
+    # the float32 sums don't run over the whole block.
+    dtype = bfgrid.dtype
+    C = 0.5*wv[:,newaxis].astype(dtype)*bfgrid
+    if A is not None:
+        A = A.astype(dtype)
+        for k in xrange(3):
+            C += A[:,k,newaxis]*bfgrads[:,:,k]
+    if dtype == 'd':
+        M = dot(transpose(bfgrid),C)
+    else:
+        npts,nbf = bfgrid.shape
+        M = zeros((nbf,nbf),'d')
+        for i in xrange(0,npts,XC_SUM_POINTS):
+            sl = slice(i,i+XC_SUM_POINTS)
+            M += dot(transpose(bfgrid[sl]),C[sl])
+    return M + transpose(M)
 
 def dft(atoms,**kwargs):
     """\
@@ -133,6 +157,8 @@ def dft(atoms,**kwargs):
     basis_data    None    The basis data to use to construct bfs
     integrals     None    The one- and two-electron integrals to use
                           If not None, S,h,Ints
+    density_fit   False   Fit the Coulomb matrix to an auxiliary basis
+                          (see DensityFitting.aux_basis for its options)
     orbs          None    If not none, the guess orbitals
     functional    SVWN    Use the SVWN (LDA) DFT functional (default)
                   S0      Use the Slater Xalpha DFT functional
@@ -140,6 +166,12 @@ def dft(atoms,**kwargs):
                   PBE     Use the PBE DFT functional
     grid_nrad     32      Number of radial shells per atom
     grid_fineness 1       Radial shell fineness. 0->coarse, 1->medium, 2->fine
+    pruning       None    SG1, SG2 or SG3 for element-dependent pruned
+                          atomic grids (see AtomicGrid.PrunedGrids)
+    single_precision False Keep the grid basis functions in float32
+                          (see MG2.bf_dtype)
+    grid          None    An MG2 grid from an earlier geometry of the same
+                          molecule, which is moved rather than made again
     spin_type     A       Average occupation method for open shell (default)
                   R       Restricted open shell (not implemented yet)
                   U       Unrestricted open shell (aka spin-polarized dft)
@@ -154,7 +186,7 @@ def dft(atoms,**kwargs):
     kwargs['do_grad_dens'] = need_gradients[functional]
 
     bfs = getbasis(atoms,**kwargs)
-    S,h,Ints = getints(bfs,atoms,**kwargs)
+    S,h,Ints = getints(bfs,atoms,exchange=False,**kwargs)
 
     nel = atoms.get_nel()
     enuke = atoms.get_enuke()
@@ -163,13 +195,18 @@ def dft(atoms,**kwargs):
     grid_nrad = kwargs.get('grid_nrad',settings.DFTGridRadii)
     grid_fineness = kwargs.get('grid_fineness',settings.DFTGridFineness)
 
-    gr = MolecularGrid(atoms,grid_nrad,grid_fineness,**kwargs) 
-    gr.set_bf_amps(bfs)
+    gr = kwargs.get('grid')
+    if gr is None:
+        gr = MolecularGrid(atoms,grid_nrad,grid_fineness,**kwargs) 
+        gr.set_bf_amps(bfs)
+    else:
+        gr.update_geometry(atoms,bfs)
 
     # It would be nice to have a more intelligent treatment of the guess
     # so that I could pass in a density rather than a set of orbs.
+    solver = GeneralizedEigensolver(S)
     orbs = kwargs.get('orbs')
-    if orbs is None: orbe,orbs = geigh(h,S)
+    if orbs is None: orbe,orbs = solver.solve(h)
 
     nclosed,nopen = atoms.get_closedopen()
 
@@ -206,7 +243,7 @@ def dft(atoms,**kwargs):
         F = h+2*J+XC
         if DoAveraging: F = avg.getF(F,D)
         
-        orbe,orbs = geigh(F,S)
+        orbe,orbs = solver.solve(F)
         
         Ej = 2*trace2(D,J)
         Eone = 2*trace2(D,h)
@@ -257,7 +294,7 @@ def udft(atoms,**kwargs):
     kwargs['do_spin_polarized'] = True
 
     bfs = getbasis(atoms,**kwargs)
-    S,h,Ints = getints(bfs,atoms,**kwargs)
+    S,h,Ints = getints(bfs,atoms,exchange=False,**kwargs)
     nel = atoms.get_nel()
     enuke = atoms.get_enuke()
 
@@ -270,8 +307,9 @@ def udft(atoms,**kwargs):
 
     # It would be nice to have a more intelligent treatment of the guess
     # so that I could pass in a density rather than a set of orbs.
+    solver = GeneralizedEigensolver(S)
     orbs = kwargs.get('orbs')
-    if not orbs: orbe,orbs = geigh(h,S)
+    if not orbs: orbe,orbs = solver.solve(h)
     orbsa = orbsb = orbs
 
     nalpha,nbeta = atoms.get_alphabeta()
@@ -301,8 +339,8 @@ def udft(atoms,**kwargs):
         Fa = h+Ja+Jb-Ka
         Fb = h+Ja+Jb-Kb
         
-        orbea,orbsa = geigh(Fa,S)
-        orbeb,orbsb = geigh(Fb,S)
+        orbea,orbsa = solver.solve(Fa)
+        orbeb,orbsb = solver.solve(Fb)
         
         Eja = trace2(D,Ja)
         Ejb = trace2(D,Jb)
@@ -370,7 +408,7 @@ def dft_fixed_occ(atoms,occs,**kwargs):
     kwargs['do_grad_dens'] = need_gradients[functional]
 
     bfs = getbasis(atoms,**kwargs)
-    S,h,Ints = getints(bfs,atoms,**kwargs)
+    S,h,Ints = getints(bfs,atoms,exchange=False,**kwargs)
 
     nel = atoms.get_nel()
     enuke = atoms.get_enuke()
@@ -384,8 +422,9 @@ def dft_fixed_occ(atoms,occs,**kwargs):
 
     # It would be nice to have a more intelligent treatment of the guess
     # so that I could pass in a density rather than a set of orbs.
+    solver = GeneralizedEigensolver(S)
     orbs = kwargs.get('orbs')
-    if orbs is None: orbe,orbs = geigh(h,S)
+    if orbs is None: orbe,orbs = solver.solve(h)
 
     nclosed,nopen = atoms.get_closedopen()
 
@@ -426,7 +465,7 @@ def dft_fixed_occ(atoms,occs,**kwargs):
         F = h+2*J+XC
         if DoAveraging: F = avg.getF(F,D)
         
-        orbe,orbs = geigh(F,S)
+        orbe,orbs = solver.solve(F)
         #pad_out(orbs)
         #save the new eigenstates of the fock operator F
         neworbs=orbs
@@ -491,7 +530,7 @@ def udft_fixed_occ(atoms,occa, occb, **kwargs):
     kwargs['do_spin_polarized'] = True
 
     bfs = getbasis(atoms,**kwargs)
-    S,h,Ints = getints(bfs,atoms,**kwargs)
+    S,h,Ints = getints(bfs,atoms,exchange=False,**kwargs)
 
     nel = atoms.get_nel()
     enuke = atoms.get_enuke()
@@ -505,8 +544,9 @@ def udft_fixed_occ(atoms,occa, occb, **kwargs):
 
     # It would be nice to have a more intelligent treatment of the guess
     # so that I could pass in a density rather than a set of orbs.
+    solver = GeneralizedEigensolver(S)
     orbs = kwargs.get('orbs')
-    if not orbs: orbe,orbs = geigh(h,S)
+    if not orbs: orbe,orbs = solver.solve(h)
     orbsa = orbsb = orbs
 
     nalpha,nbeta = atoms.get_alphabeta()
@@ -544,8 +584,8 @@ def udft_fixed_occ(atoms,occa, occb, **kwargs):
         Fa = h+Ja+Jb+XCa
         Fb = h+Ja+Jb+XCb
         
-        orbea,orbsa = geigh(Fa,S)
-        orbeb,orbsb = geigh(Fb,S)
+        orbea,orbsa = solver.solve(Fa)
+        orbeb,orbsb = solver.solve(Fb)
         
         Eone = trace2(Dab,h)
         Ej   = 0.5*trace2(Dab,Ja+Jb)
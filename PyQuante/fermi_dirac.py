@@ -11,8 +11,9 @@
 """
 import sys
 import settings
-from NumWrap import matrixmultiply,transpose
-from math import exp,log
+from NumWrap import matrixmultiply,transpose,asarray,zeros,where,tanh,\
+     log,dot,newaxis
+from math import exp
 from Constants import Kboltz
 from LA2 import mkdens
 import logging
@@ -59,8 +60,8 @@ def mkdens_occs(c,occs,**kwargs):
     if verbose:
         print "mkdens_occs: %d closed-shell orbitals found" % nclosed
     D = mkdens(c,0,nclosed)
-    for i in xrange(nclosed,norb):
-        D = D + occs[i]*matrixmultiply(c[:,i:i+1],transpose(c[:,i:i+1]))
+    cp = c[:,nclosed:norb]
+    D = D + matrixmultiply(cp*asarray(occs[nclosed:norb]),transpose(cp))
     return D
     
 def get_fermi_occ(efermi,en,temp):
@@ -71,21 +72,31 @@ def get_fermi_occ(efermi,en,temp):
     return 1/(1+exp(x))
 
 def get_entropy(occs,temp):
+    """\
+    The entropy term kT*sum(f*ln(f)+(1-f)*ln(1-f)) of the occupations
+    occs, summed over the last axis. Batched occupations, as returned by
+    get_fermi_occs, give one entropy per set.
+    """
     kT = Kboltz*temp
-    entropy = 0
-    for fi in occs:
-        if abs(fi) < 1e-10: break # stop summing when occs get small
-        if fi > 1e-10:
-            entropy += kT*fi*log(fi)
-        if (1-fi) > 1e-10:
-            entropy += kT*(1.-fi)*log(1.-fi)
-    return entropy
+    f = asarray(occs,'d')
+    g = 1-f
+    # f*ln(f) -> 0 as f -> 0, so occupations of 0 or 1 add nothing
+    fok,gok = f > 1e-10,g > 1e-10
+    terms = where(fok,f*log(where(fok,f,1)),0) + \
+            where(gok,g*log(where(gok,g,1)),0)
+    return kT*terms.sum(-1)
 
 def get_fermi_occs(efermi,orbe,temp):
-    occs = []
-    for en in orbe:
-        occs.append(get_fermi_occ(efermi,en,temp))
-    return occs
+    """\
+    Fermi-Dirac occupations of the orbital energies orbe at the Fermi
+    energy efermi. Written as (1-tanh(x/2))/2, x = (e-efermi)/kT, which
+    can't overflow. efermi and orbe broadcast against each other, so
+    efermi[:,newaxis] with orbe of shape (nsets,norb) gives the
+    occupations of each set at its own Fermi energy.
+    """
+    kT = Kboltz*temp
+    x = (asarray(orbe,'d')-efermi)/kT
+    return 0.5*(1-tanh(0.5*x))
 
 def get_t0_occs(nel,nbf):
     occs = [0]*nbf
@@ -95,31 +106,67 @@ def get_t0_occs(nel,nbf):
     return occs
 
 def get_efermi(nel,orbe,temp,**kwargs):
-    "Bisection method to get Fermi energy from Fermi-Dirac dist"
+    """\
+    efermi = get_efermi(nel,orbe,temp,**kwargs)
+
+    The Fermi energy at which the Fermi-Dirac occupations of the orbital
+    energies orbe, two electrons per orbital, hold nel electrons. Found
+    by Newton's method on the electron count, falling back to bisection
+    whenever a step would leave the bracket around the root.
+
+    orbe can be a list of orbital energies, or an array of several sets
+    of them, with the orbitals along the last axis. Each set then gets
+    its own Fermi energy, and nel is either one count for all the sets
+    or one count per set, e.g. [2*nalpha,2*nbeta] for the two spins.
+
+    Options:      Value   Description
+    --------      -----   -----------
+    tol           1e-9    Tolerance on the number of electrons
+    weights       None    Weights of the sets of orbe, e.g. k-points.
+                          If given, the sets share one Fermi energy,
+                          and nel is the weighted total over the sets
+    """
     tol = kwargs.get('tol',settings.FDTolerance)
-    verbose = kwargs.get('verbose')
-
-    elow,ehigh = orbe[0]-100.,orbe[-1]
-    nlow = 2*sum(get_fermi_occs(elow,orbe,temp))
-    nhigh = 2*sum(get_fermi_occs(ehigh,orbe,temp))
-
-    if nlow > nel:
-        logger.error("elow incorrect %f -> %f " % (elow,nlow))
-        raise Exception("elow incorrect %f -> %f " % (elow,nlow))
-    if nhigh < nel:
-        logger.error("ehigh incorrect %f -> %f " % (ehigh,nhigh))
-        raise Exception("ehigh incorrect %f -> %f " % (ehigh,nhigh))
+    weights = kwargs.get('weights')
+    orbe = asarray(orbe,'d')
+    kT = Kboltz*temp
 
+    if weights is None:
+        nel = nel + zeros(orbe.shape[:-1],'d')
+    else:
+        weights = asarray(weights,'d')
+        nel = nel + zeros((),'d')
+
+    def count(efermi):
+        "Number of electrons and its derivative wrt efermi"
+        occs = get_fermi_occs(efermi[...,newaxis],orbe,temp)
+        n = 2*occs.sum(-1)
+        dn = 2*(occs*(1-occs)).sum(-1)/kT
+        if weights is not None: return dot(n,weights),dot(dn,weights)
+        return n,dn
+
+    elow = zeros(nel.shape,'d') + orbe.min()-100.
+    ehigh = zeros(nel.shape,'d') + orbe.max()+100.
+    nlow,dn = count(elow)
+    nhigh,dn = count(ehigh)
+    if (nlow > nel).any():
+        logger.error("elow incorrect %s -> %s " % (elow,nlow))
+        raise Exception("elow incorrect %s -> %s " % (elow,nlow))
+    if (nhigh < nel).any():
+        logger.error("ehigh incorrect %s -> %s " % (ehigh,nhigh))
+        raise Exception("ehigh incorrect %s -> %s " % (ehigh,nhigh))
+
+    efermi = 0.5*(elow+ehigh)
     for i in xrange(100):
-        efermi = (elow+ehigh)/2
-        n = 2*sum(get_fermi_occs(efermi,orbe,temp))
-        if abs(n-nel) < tol:
-            break
-        elif n < nel:
-            elow = efermi
-        else:
-            ehigh = efermi
+        n,dn = count(efermi)
+        if (abs(n-nel) < tol).all(): break
+        below = n < nel
+        elow = where(below,efermi,elow)
+        ehigh = where(below,ehigh,efermi)
+        newton = efermi + (nel-n)/where(dn > 0,dn,1)
+        inside = (dn > 0) & (newton > elow) & (newton < ehigh)
+        efermi = where(inside,newton,0.5*(elow+ehigh))
     else:
-        print "get_fd_occs: Too many iterations"
+        logger.warning("get_efermi: Too many iterations")
+    if efermi.ndim == 0: return float(efermi)
     return efermi
-
@@ -13,9 +13,9 @@
 import string,sys,time
 import settings
 from fermi_dirac import get_efermi, get_fermi_occs,mkdens_occs,get_entropy
-from LA2 import geigh,mkdens,trace2
+from LA2 import geigh,mkdens,trace2,GeneralizedEigensolver
 from Ints import get2JmK,getbasis,getints,getJ,getK
-from Convergence import DIIS
+from Convergence import DIIS,max_error,is_converged
 import logging
 
 logger = logging.getLogger("pyquante") # Hack!!!
@@ -71,7 +71,8 @@ def rhf(atoms,**kwargs):
 
     Options:      Value   Description
     --------      -----   -----------
-    ConvCriteria  1e-4    Convergence Criteria
+    ConvCriteria  1e-4    Convergence Criteria on the energy
+    DensConvCriteria 1e-4 Convergence Criteria on max|FDS-SDF|
     MaxIter       20      Maximum SCF iterations
     DoAveraging   True    Use DIIS for accelerated convergence (default)
                   False   No convergence acceleration
@@ -84,6 +85,8 @@ def rhf(atoms,**kwargs):
     orbs          None    If not none, the guess orbitals
     """
     ConvCriteria = kwargs.get('ConvCriteria',settings.ConvergenceCriteria)
+    DensConvCriteria = kwargs.get('DensConvCriteria',
+                                  settings.DensityConvergenceCriteria)
     MaxIter = kwargs.get('MaxIter',settings.MaxIter)
     DoAveraging = kwargs.get('DoAveraging',settings.Averaging)
     ETemp = kwargs.get('ETemp',settings.ElectronTemperature)
@@ -101,9 +104,10 @@ def rhf(atoms,**kwargs):
 
     S,h,Ints = getints(bfs,atoms,**kwargs)
     nel = atoms.get_nel()
+    solver = GeneralizedEigensolver(S)
 
     orbs = kwargs.get('orbs')
-    if orbs is None: orbe,orbs = geigh(h,S)
+    if orbs is None: orbe,orbs = solver.solve(h)
 
     enuke = atoms.get_enuke()
     eold = 0.
@@ -123,14 +127,20 @@ def rhf(atoms,**kwargs):
             D = mkdens(orbs,0,nocc)
         G = get2JmK(Ints,D)
         F = h+G
-        if DoAveraging: F = avg.getF(F,D)
-        orbe,orbs = geigh(F,S)
+        if DoAveraging:
+            F = avg.getF(F,D)
+            err = avg.error()
+        else:
+            err = max_error(F,D,S)
+        orbe,orbs = solver.solve(F)
         energy = get_energy(h,F,D,enuke)
         if ETemp:
             energy += entropy
-        logging.debug("%d %f" % (i,energy))
-        if abs(energy-eold) < ConvCriteria: break
-        logger.info("Iteration: %d    Energy: %f    EnergyVar: %f"%(i,energy,abs(energy-eold)))
+        logging.debug("%d %f %g" % (i,energy,err))
+        if is_converged(energy-eold,err,etol=ConvCriteria,
+                        dtol=DensConvCriteria): break
+        logger.info("Iteration: %d    Energy: %f    EnergyVar: %f    MaxErr: %g"
+                    % (i,energy,abs(energy-eold),err))
         eold = energy
     if i < MaxIter:
         logger.info("PyQuante converged in %d iterations" % i)
@@ -170,6 +180,7 @@ def uhf(atoms,**kwargs):
     nel = atoms.get_nel()
 
     nalpha,nbeta = atoms.get_alphabeta() #pass in kwargs for multiplicity
+    solver = GeneralizedEigensolver(S)
 
     orbs = kwargs.get('orbs')
     if orbs!=None:
@@ -177,7 +188,7 @@ def uhf(atoms,**kwargs):
         orbsa = orbs[0]
         orbsb = orbs[1]
     else:
-        orbe,orbs = geigh(h,S)
+        orbe,orbs = solver.solve(h)
         orbea = orbeb = orbe
         orbsa = orbsb = orbs
 
@@ -220,8 +231,8 @@ def uhf(atoms,**kwargs):
         Kb = getK(Ints,Db)
         Fa = h+Ja+Jb-Ka
         Fb = h+Ja+Jb-Kb
-        orbea,orbsa = geigh(Fa,S)
-        orbeb,orbsb = geigh(Fb,S)
+        orbea,orbsa = solver.solve(Fa)
+        orbeb,orbsb = solver.solve(Fb)
         energya = get_energy(h,Fa,Da)
         energyb = get_energy(h,Fb,Db)
         energy = (energya+energyb)/2+enuke
@@ -284,10 +295,12 @@ def uhf_fixed_occ(atoms,occa, occb,**kwargs):
 
     nalpha,nbeta = atoms.get_alphabeta() #pass in kwargs for multiplicity
 
+    solver = GeneralizedEigensolver(S)
+
     orbsa = kwargs.get('orbsa')
     orbsb = kwargs.get('orbsb')
     if (orbsa == None or orbsb == None):
-        orbe,orbs = geigh(h,S)
+        orbe,orbs = solver.solve(h)
         orbea = orbeb = orbe
         orbsa = orbsb = orbs
     
@@ -325,8 +338,8 @@ def uhf_fixed_occ(atoms,occa, occb,**kwargs):
         Fa = h+Ja+Jb-Ka
         Fb = h+Ja+Jb-Kb
 
-        orbea,orbsa = geigh(Fa,S)
-        orbeb,orbsb = geigh(Fb,S)
+        orbea,orbsa = solver.solve(Fa)
+        orbeb,orbsb = solver.solve(Fb)
         
         #save the new orbitals
         neworbs_a=orbsa
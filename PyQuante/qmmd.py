@@ -23,6 +23,7 @@ COPYRIGHT
 import settings
 from leapfrog import leapfrog
 from hartree_fock import rhf,uhf,uhf_fixed_occ
+from Convergence import ConvergenceSchedule
 from Wavefunction import Wavefunction
 from force import hf_force
 
@@ -41,6 +42,8 @@ def rhf_dyn(atoms,**kwargs):
                           stored in bohrs, velocities are in bohr/ps,
                           acceleration is in bohr/ps^2
                           and forces are in hartree/bohr
+    nloose        0       number of initial steps run with loosened
+                          SCF tolerances (see ConvergenceSchedule)
     
     
     Hartree-Fock options copied from hartree_fock.py -> rhf
@@ -50,7 +53,8 @@ def rhf_dyn(atoms,**kwargs):
 
     Options:      Value   Description
     --------      -----   -----------
-    ConvCriteria  1e-4    Convergence Criteria
+    ConvCriteria  1e-4    Convergence Criteria on the energy
+    DensConvCriteria 1e-4 Convergence Criteria on max|FDS-SDF|
     MaxIter       20      Maximum SCF iterations
     DoAveraging   True    Use DIIS for accelerated convergence (default)
                   False   No convergence acceleration
@@ -66,9 +70,12 @@ def rhf_dyn(atoms,**kwargs):
     job = kwargs.get('job',settings.DynJob)
     nsteps = kwargs.get('nsteps',settings.DynSteps)
     dt = kwargs.get('dt',settings.DynTStep)
+    nloose = kwargs.get('nloose',0)
     
     #save any given RHF options
     cc = kwargs.get('ConvCriteria',settings.ConvergenceCriteria)
+    dc = kwargs.get('DensConvCriteria',settings.DensityConvergenceCriteria)
+    schedule = ConvergenceSchedule(nloose,etol=cc,dtol=dc)
     maxit = kwargs.get('MaxIter',settings.MaxIters)
     doavg = kwargs.get('DoAveraging',settings.Averaging)
     temp = kwargs.get('ETemp',settings.ElectronTemperature)
@@ -90,7 +97,9 @@ def rhf_dyn(atoms,**kwargs):
     t=0.
     for n in xrange(nsteps):
         t+=n*dt
-        pe,orben,coefs = rhf(atoms,ConvCriteria=cc,MaxIter=maxit,\
+        etol,dtol = schedule.next()
+        pe,orben,coefs = rhf(atoms,ConvCriteria=etol,DensConvCriteria=dtol,\
+                           MaxIter=maxit,\
                            DoAveraging=doavg,ETemp=temp,bfs=bfcns,\
                            basis_data=bdat,integrals=ints,orbs=init_orbs)
 
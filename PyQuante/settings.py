@@ -37,14 +37,16 @@ contr_coulomb = chgp.contr_coulomb
 #libint_enabled = False
 
 IntsOmitF = False
+SortInts = True # Keep the rows of the ERIs needed by getJ/getK
 
 # SCF flags
 MaxIter = 30
-DerivativeType = 'analyt'
 MolecularCharge = 0
 SpinMultiplicity = 1
 LengthUnits = 'bohr'
 ConvergenceCriteria = 1e-5
+DensityConvergenceCriteria = 1e-4 # Max element of the commutator FDS-SDF
+LooseConvergenceFactor = 100. # Tolerance multiplier for loose SCF steps
 HamiltonianMethod = 'HF'
 Averaging = True
 MixingFraction = 0.5
@@ -67,12 +69,23 @@ DFTGridRadii = 32
 DFTGridFineness = 1
 DFTDensityGradient = False
 DFTRadialGridType = 'EulerMaclaurin'
-DFTGridSG1 = True
+DFTGridPruning = None # 'SG1', 'SG2' or 'SG3' for pruned atomic grids
 DFTGridAngularPoints = 194
 DFTDensityCutoff = 1e-10
+DFTGridBlockSize = 5.0 # Side (bohr) of the spatial blocks of grid points
+DFTBasisCutoff = 1e-10 # Drop basis functions smaller than this from a block
+DFTGridBlockPoints = 2048 # Max points per grid block; None = whole cubes
+DFTGridCacheSize = None # MB of block basis values to keep; None = keep all
+DFTThreads = 1 # Threads working on the grid blocks in the DFT routines
+DFTGridMoveTolerance = 1e-8 # Atoms moving less than this keep their grid bfs
+DFTGridSinglePrecision = False # Keep the grid basis functions as float32
+DFTDensityFit = False # Fit the Coulomb matrix of pure DFT to an aux basis
+DFAuxBasis = None # Aux basis for density fitting; None = even-tempered
+DFAuxRatio = 2.5 # Exponent ratio of the even-tempered aux basis
 AM05DensityCutoff = 1e-16
 DFTXalphaFactor = 2./3.
 DFTBeckeHetero = True
+DFTGridPartition = 'Becke' # or 'Stratmann' for Stratmann-Scuseria weights
 OEPOptMethod = 'BFGS'
 OEPIters = 100
 OEPTolerance = 1e-5
@@ -87,14 +100,30 @@ OrthogMethod = 'Chol'
 NumericForceDx = 1e-6
 NumericForceSym = True
 SubspaceVirtualOrbs = 1
-DavidsonEvecTolerance = 1e-6
+SolverMethod = 'Basic' # 'Newton' for the second-order solver
+NewtonStallIterations = 3 # Switch from DIIS to Newton if the error
+NewtonStallRatio = 0.5    #  hasn't dropped by this ratio in this many its
+NewtonMaxStep = 0.5 # Trust radius for the orbital rotation step
+NewtonMicroIterations = 10 # Max CG iterations per Newton step
 DavidsonNormTolerance = 1e-10
+DavidsonResidualTolerance = 1e-5 # Residual norm of a converged block_davidson root
+DavidsonMaxIter = 100
+DavidsonMaxSubspace = 20 # Subspace vectors per root before block_davidson collapses
 JacobiSweeps = 100
 JacobiTolerance = 1e-10
 ExpSteps = 12
 ExpCutoff = 1e-8
+TransformBlockSize = 256 # AO (or MO) pairs unpacked at a time in transform_ints
+
+# MP2 options
+MP2Memory = 256 # MB for each batch of occupied orbitals' (ia|jb) integrals
+MP2Scratch = None # Directory for a memory mapped file of the half
+                  #  transformed integrals; None = keep them in memory
 
 # Dynamics options
 DynSteps = 100
 DynJob = 'pydyn'
 DynTStep = 0.1
+
+# Batch options
+BatchProcesses = None # Worker processes for run_batch; None = one per CPU
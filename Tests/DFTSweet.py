@@ -47,6 +47,32 @@ class UnitTests(unittest.TestCase):
         li_uhf.iterate()
         self.assertAlmostEqual(li_uhf.energy,-7.431364,4)
 
+    def single_precision_error(self,molecule,functional):
+        # Difference of the energies with float32 and float64 grid
+        # basis functions, converged well past the 1e-6 being tested
+        energies = []
+        for single in [False,True]:
+            scf = SCF(molecule,method='DFT',functional=functional,
+                      single_precision=single)
+            scf.iterate(etol=1e-9,dtol=1e-7)
+            energies.append(scf.energy)
+        return abs(energies[1]-energies[0])
+
+    def testH2LDASingle(self):
+        self.assertTrue(self.single_precision_error(self.h2,'SVWN') < 1e-6)
+
+    def testH2BLYPSingle(self):
+        self.assertTrue(self.single_precision_error(self.h2,'BLYP') < 1e-6)
+
+    def testLiLDASingle(self):
+        self.assertTrue(self.single_precision_error(self.li,'SVWN') < 1e-6)
+
+    def testH2OLDASingle(self):
+        self.assertTrue(self.single_precision_error(self.h2o,'SVWN') < 1e-6)
+
+    def testLiHLDASingle(self):
+        self.assertTrue(self.single_precision_error(self.lih,'SVWN') < 1e-6)
+
 def runsuite(verbose=True):
     # To use psyco, uncomment this line:
     #import psyco; psyco.full()
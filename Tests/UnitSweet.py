@@ -20,6 +20,19 @@ from PyQuante.PyQuante2 import SCF,SubspaceSolver,DmatSolver
 # Import test molecules
 from PyQuante.TestMolecules import h2,he,li,li_p,li_m,h2o,oh,lih
 
+def rimp2(molecule):
+    "MP2 and RI-MP2 correlation energies of a closed shell molecule"
+    from PyQuante.MP import RIMP2
+    solv = SCF(molecule,method="HF")
+    solv.iterate()
+    nclosed,nopen = molecule.get_closedopen()
+    bfs = solv.basis_set.get()
+    nbf = len(bfs)
+    orbs,orbe = solv.solver.orbs,solv.solver.orbe
+    emp2 = MP2(solv.ERI,orbs,orbe,nclosed,nbf-nclosed)
+    erimp2 = RIMP2(bfs,molecule,orbs,orbe,nclosed,nbf-nclosed)
+    return emp2,erimp2
+
 class UnitTests(unittest.TestCase):
     def testH2BLYP(self):
         h2_blyp = SCF(h2,method="DFT",functional='BLYP')
@@ -68,6 +81,22 @@ class UnitTests(unittest.TestCase):
         solv.iterate()
         self.assertAlmostEqual(solv.energy,-1.131334,4)
 
+    def testBlockDavidson(self):
+        # Matrix-free, with the subspace collapsing, against eigh
+        from PyQuante.Solvers import davidson
+        from PyQuante.NumWrap import eigh,dot,arange,diagonal,cos,outer,eye
+        n = 200
+        A = 0.01*cos(outer(arange(n),arange(n))) + 0.1*(1+arange(n))*eye(n)
+        A = A+A.T
+        E,V = eigh(A)
+        E1,V1 = davidson(lambda B: dot(A,B),4,diag=diagonal(A),
+                         max_subspace=10,rtol=1e-8)
+        E2,V2 = davidson(A,4,rtol=1e-8)
+        for i in xrange(4):
+            self.assertAlmostEqual(E1[i],E[i],10)
+            self.assertAlmostEqual(E2[i],E[i],10)
+            self.assertAlmostEqual(abs(dot(V1[:,i],V[:,i])),1,8)
+
     #def testJacobiSolver(self):
     #    from PyQuante.Solvers import jacobi
     #    solv = SCF(h2,method='HF',SolverConstructor=SubspaceSolver,
@@ -108,6 +137,372 @@ class UnitTests(unittest.TestCase):
         solv.iterate()
         self.assertAlmostEqual(solv.energy,-1.131334,4)
 
+    def testDensityConvergence(self):
+        solv = SCF(h2,method='HF')
+        solv.iterate(etol=1e-6,dtol=1e-6)
+        self.assertTrue(solv.iterator.converged)
+        self.assertTrue(solv.get_error() < 1e-6)
+        self.assertAlmostEqual(solv.energy,-1.131334,4)
+
+    def testConvergenceSchedule(self):
+        from PyQuante.Convergence import ConvergenceSchedule
+        schedule = ConvergenceSchedule(2,etol=1e-6,dtol=1e-5,loose_factor=100)
+        etol,dtol = schedule.next()
+        self.assertAlmostEqual(etol,1e-4,10)
+        self.assertAlmostEqual(dtol,1e-3,10)
+        schedule.tighten()
+        etol,dtol = schedule.next()
+        self.assertAlmostEqual(etol,1e-6,10)
+        self.assertAlmostEqual(dtol,1e-5,10)
+
+    def testBatch(self):
+        from PyQuante.Batch import run_batch
+        for nprocs in [1,2]:
+            results = list(run_batch([h2,he],method='HF',nprocs=nprocs))
+            self.assertEqual(len(results),2)
+            results.sort(key=lambda result: result.index)
+            self.assertEqual(results[0].error,None)
+            self.assertAlmostEqual(results[0].energy,-1.131334,4)
+            self.assertAlmostEqual(results[1].energy,-2.855160,3)
+
+    def testIntsReentrant(self):
+        # Integrals for a second molecule mustn't clobber the first's
+        h2_hf = SCF(h2,method='HF')
+        he_hf = SCF(he,method='HF')
+        h2_hf.iterate()
+        self.assertAlmostEqual(h2_hf.energy,-1.131334,4)
+
+    def testBeckeWeights(self):
+        from PyQuante.AtomicGrid import atomic_grid_xyzw
+        from PyQuante.MolecularGrid import becke_weights,becke_atomic_grid_p
+        for iat in xrange(len(oh.atoms)):
+            xyzw = atomic_grid_xyzw(oh.atoms[iat],nrad=8)
+            P = becke_weights(oh.atoms,xyzw[:,:3],iat)
+            for i in xrange(0,len(xyzw),17):
+                Ps = [becke_atomic_grid_p(jat,xyzw[i,:3],oh.atoms)
+                      for jat in xrange(len(oh.atoms))]
+                self.assertAlmostEqual(P[i],Ps[iat]/sum(Ps),8)
+
+    def testStratmannWeights(self):
+        # Both partitions should integrate a unit gaussian on O equally well
+        from PyQuante.MG2 import MG2
+        from PyQuante.NumWrap import exp,array,dot,pi
+        x0,y0,z0 = h2o.atoms[0].pos()
+        for partition in ['Becke','Stratmann']:
+            gr = MG2(h2o,grid_partition=partition)
+            r2 = ((gr.xyzw[:,:3]-array((x0,y0,z0)))**2).sum(1)
+            norm = dot(gr.xyzw[:,3],exp(-r2))/pow(pi,1.5)
+            self.assertAlmostEqual(norm,1.0,4)
+
+    def testEvalBfs(self):
+        from PyQuante.Ints import getbasis
+        from PyQuante.CGBF import eval_bfs
+        from PyQuante.NumWrap import array
+        bfs = getbasis(h2o)
+        xyz = array([(0.1,0.2,0.3),(-0.5,1.1,0.7),(1.3,-0.4,-0.9)])
+        amps,grads,laps = eval_bfs(bfs,xyz,2)
+        h = 1e-4
+        for i in xrange(len(xyz)):
+            x,y,z = xyz[i]
+            for ibf in xrange(len(bfs)):
+                self.assertAlmostEqual(amps[i,ibf],bfs[ibf].amp(x,y,z),8)
+                gx,gy,gz = bfs[ibf].grad(x,y,z)
+                self.assertAlmostEqual(grads[i,ibf,0],gx,8)
+                self.assertAlmostEqual(grads[i,ibf,1],gy,8)
+                self.assertAlmostEqual(grads[i,ibf,2],gz,8)
+            # Check the gradient and laplacian against finite differences
+            lap = -6*amps[i]
+            for k in xrange(3):
+                diff = 0
+                for sign in [1,-1]:
+                    shifted = xyz[i:i+1].copy()
+                    shifted[0,k] += sign*h
+                    amp = eval_bfs(bfs,shifted)[0]
+                    lap = lap + amp
+                    diff = diff + sign*amp
+                for ibf in xrange(len(bfs)):
+                    self.assertAlmostEqual(grads[i,ibf,k],diff[ibf]/(2*h),5)
+            for ibf in xrange(len(bfs)):
+                self.assertAlmostEqual(laps[i,ibf],lap[ibf]/(h*h),3)
+
+    def testGridBlocks(self):
+        from PyQuante.MG2 import MG2
+        from PyQuante.Ints import getbasis
+        from PyQuante.CGBF import eval_bfs
+        bfs = getbasis(h2o)
+        gr = MG2(h2o)
+        gr.add_basis(bfs)
+        dense = eval_bfs(bfs,gr.xyzw[:,:3])
+        self.assertTrue(abs(dense-gr.get_bfgrid()).max() < 1e-9)
+        nstored = sum([block.bfgrid.size for block in gr.blocks])
+        self.assertTrue(nstored < dense.size)
+
+    def testXCMatrix(self):
+        # The blocked matrix products should match the pairwise sums
+        from PyQuante.MG2 import MG2
+        from PyQuante.Ints import getbasis
+        from PyQuante.CGBF import eval_bfs
+        from PyQuante.dft import xc_matrix
+        from PyQuante.NumWrap import dot,exp
+        bfs = getbasis(h2)
+        gr = MG2(h2,do_grad_dens=True)
+        gr.add_basis(bfs)
+        xyz = gr.xyzw[:,:3]
+        wv = gr.xyzw[:,3]*exp(-(xyz*xyz).sum(1))
+        A = 0.1*xyz*wv[:,None]
+        Fxc = xc_matrix(gr,wv,A)
+        b,g = eval_bfs(bfs,xyz,1)
+        for i in xrange(len(bfs)):
+            for j in xrange(len(bfs)):
+                Fij = dot(wv*b[:,i],b[:,j]) \
+                      + (A*(b[:,i,None]*g[:,j]+b[:,j,None]*g[:,i])).sum()
+                self.assertAlmostEqual(Fxc[i,j],Fij,8)
+
+    def testStreamedGrid(self):
+        # Uncached blocks are recomputed, and should give the same results
+        from PyQuante.MG2 import MG2
+        from PyQuante.Ints import getbasis
+        from PyQuante.dft import xc_matrix
+        from PyQuante.NumWrap import identity
+        bfs = getbasis(h2)
+        D = 0.1*identity(len(bfs),'d')
+        grs = []
+        for cache in [None,0]:
+            gr = MG2(h2,do_grad_dens=True,grid_block_points=100,
+                     grid_cache_size=cache)
+            gr.add_basis(bfs)
+            gr.set_density(D)
+            grs.append(gr)
+        cached,streamed = grs
+        self.assertTrue(max([b.npts for b in streamed.blocks]) <= 100)
+        self.assertTrue(streamed.blocks[0].bfgrid is None)
+        self.assertTrue(abs(cached.density-streamed.density).max() < 1e-12)
+        self.assertTrue(abs(cached.gamma-streamed.gamma).max() < 1e-12)
+        wv = cached.weights()
+        A = 0.1*cached.grada
+        Fc = xc_matrix(cached,wv,A)
+        Fs = xc_matrix(streamed,wv,A)
+        self.assertTrue(abs(Fc-Fs).max() < 1e-12)
+
+    def testMovedGrid(self):
+        # A moved grid should match a new one, and keep the basis
+        # functions over the blocks that the moved atom doesn't touch
+        from PyQuante.MG2 import MG2
+        from PyQuante.Ints import getbasis
+        from PyQuante.CGBF import eval_bfs
+        from PyQuante.NumWrap import argsort
+        atoms = [(atom.atno,atom.pos()) for atom in h2o.atoms]
+        x,y,z = atoms[2][1]
+        atoms[2] = (1,(x,y+0.3,z-0.1))
+        moved = Molecule('H2O',atoms)
+        gr = MG2(h2o,bf_cutoff=1e-3)
+        gr.add_basis(getbasis(h2o))
+        before = [block.bfgrid for block in gr.blocks]
+        bfs = getbasis(moved)
+        gr.update_geometry(moved,bfs)
+        fresh = MG2(moved,bf_cutoff=1e-3)
+        xyzw = gr.xyzw[argsort(gr.order)]
+        self.assertTrue(abs(xyzw-fresh.xyzw[argsort(fresh.order)]).max()
+                        < 1e-12)
+        for block in gr.blocks:
+            if not len(block.ibfs): continue
+            amps = eval_bfs([bfs[i] for i in block.ibfs],gr.xyzw[block.sl,:3])
+            self.assertTrue(abs(amps-block.bfgrid).max() < 1e-12)
+        kept = [i for i in xrange(len(before))
+                if gr.blocks[i].bfgrid is before[i]]
+        self.assertTrue(0 < len(kept) < len(before))
+
+    def testThreadedGrid(self):
+        # Threads mustn't change the density, energy or XC matrix at all
+        from PyQuante.MG2 import MG2
+        from PyQuante.Ints import getbasis
+        from PyQuante.dft import getXC
+        from PyQuante.NumWrap import identity
+        bfs = getbasis(h2o)
+        D = 0.1*identity(len(bfs),'d')
+        results = []
+        for nthreads in [1,3]:
+            gr = MG2(h2o,do_grad_dens=True,grid_block_points=200,
+                     nthreads=nthreads)
+            gr.add_basis(bfs)
+            gr.set_density(D)
+            Exc,Fxc = getXC(gr,10,functional='BLYP')
+            results.append((gr.density,gr.gamma,Fxc,Exc))
+        # All the calls share the threaded grid's pool
+        pool = gr.get_pool()
+        gr.set_density(D)
+        self.assertTrue(gr.get_pool() is pool)
+        gr.close()
+        for serial,threaded in zip(*results):
+            self.assertTrue((serial == threaded).all())
+
+    def testVectorFunctionals(self):
+        # The array functionals should match the per-point functions
+        from PyQuante import DFunctionals as DF
+        from PyQuante.NumWrap import array
+        def spin(f,na,nb,gaa,gab,gbb):
+            fa,va = f(na)
+            fb,vb = f(nb)
+            return fa+fb,va,vb,0,0,0
+        def total(f,na,nb,gaa,gab,gbb):
+            fc,dr,dg = f(na+nb,gaa+gbb+2*gab)
+            return fc,dr,dr,dg,2*dg,dg
+        def becke(na,nb,gaa,gab,gbb):
+            fa,va,ga = DF.xb(na,gaa,return_flag=1)
+            fb,vb,gb = DF.xb(nb,gbb,return_flag=1)
+            return fa+fb,va,vb,ga,0,gb
+        scalar = {
+            DF.S : lambda *args: spin(DF.xs,*args),
+            DF.VWN : lambda na,nb,*g: DF.cvwn(na,nb)+(0,0,0),
+            DF.PW : lambda na,nb,*g: DF.pw(na,nb)+(0,0,0),
+            DF.B : becke,
+            DF.LYP : lambda na,nb,gaa,gab,gbb:
+                DF.clyp(na,nb,gaa,gab,gbb,return_flag=1),
+            DF.AM05 : lambda *args: total(DF.am05xc,*args),
+            DF.EXXC1 : lambda *args: total(DF.c1,*args),
+            }
+        points = []
+        for rho in [0,1e-14,1e-11,1e-9,1e-6,1e-3,0.02,0.3,1.,7.]:
+            for frac in [0.5,0.3,0.999]:
+                for s in [0,1e-8,0.3,1.5,6.]:
+                    na,nb = frac*rho,(1-frac)*rho
+                    gaa = (s*pow(na,4./3.))**2
+                    gbb = (s*pow(nb,4./3.))**2
+                    points.append((na,nb,gaa,0.4*(gaa*gbb)**0.5,gbb))
+        dens = array([p[:2] for p in points]).transpose()
+        gamma = array([p[2:] for p in points]).transpose()
+        funcs = [f for f in DF.xfuncs.values()+DF.cfuncs.values() if f]
+        for func in set(funcs+[DF.EXXC1]):
+            terms = func(dens,gamma)
+            for i in xrange(len(points)):
+                ref = scalar[func](*points[i])
+                for k in xrange(6):
+                    self.assertTrue(abs(terms[k][i]-ref[k])
+                                    <= 1e-12*max(1,abs(ref[k])))
+
+    def testFunctionalDerivatives(self):
+        # The analytic derivatives should match numder's finite differences
+        from PyQuante.DFunctionals import xfuncs,cfuncs,numder
+        from PyQuante.NumWrap import array,maximum
+        points = []
+        for rho in [0.01,0.3,2.]:
+            for frac in [0.5,0.3]:
+                for s in [0.3,1.5]:
+                    na,nb = frac*rho,(1-frac)*rho
+                    gaa = (s*pow(na,4./3.))**2
+                    gbb = (s*pow(nb,4./3.))**2
+                    points.append((na,nb,gaa,0.4*(gaa*gbb)**0.5,gbb))
+        dens = array([p[:2] for p in points]).transpose()
+        gamma = array([p[2:] for p in points]).transpose()
+        done = []
+        for xc,funcs in [('x',xfuncs),('c',cfuncs)]:
+            for name,func in funcs.items():
+                if not func or func in done: continue
+                done.append(func)
+                terms = func(dens,gamma)[1:]
+                nterms = numder(xc,name,dens,gamma)
+                for k in xrange(5):
+                    err = abs(terms[k]-nterms[k])/maximum(abs(nterms[k]),1e-3)
+                    self.assertTrue(err.max() < 1e-6)
+
+    def testCoulombOnly(self):
+        # The Coulomb-only paths should all give the same J, and the
+        # density fitted one the same Coulomb energy to about 1e-3
+        from PyQuante.Ints import getbasis,getints,get2ints,getJ,fetch_jints
+        from PyQuante.LA2 import geigh,mkdens,trace2
+        from PyQuante.NumWrap import zeros,dot
+        bfs = getbasis(h2)
+        nbf = len(bfs)
+        S,h,Ints = getints(bfs,h2,exchange=False)
+        self.assertEqual(Ints.kints,None)
+        orbe,orbs = geigh(h,S)
+        D = mkdens(orbs,0,1)
+        J = zeros((nbf,nbf),'d')
+        for i in xrange(nbf):
+            for j in xrange(nbf):
+                J[i,j] = dot(fetch_jints(Ints,i,j,nbf),D.ravel())
+        self.assertTrue(abs(getJ(Ints,D)-J).max() < 1e-12)
+        packed = get2ints(bfs,sortints=False)
+        self.assertTrue(abs(getJ(packed,D)-J).max() < 1e-12)
+        S,h,fit = getints(bfs,h2,exchange=False,density_fit=True)
+        self.assertAlmostEqual(trace2(D,getJ(fit,D)),trace2(D,J),3)
+
+    def testPrunedGrid(self):
+        # SG-1 should need far fewer points than the 194-point grid,
+        # and still give the same LDA energy
+        from PyQuante.MG2 import MG2
+        full = MG2(h2o)
+        sg1 = MG2(h2o,pruning='SG1')
+        self.assertEqual(sum(sg1.atom_npts),len(sg1))
+        self.assertTrue(len(sg1) < 0.7*len(full))
+        h2_lda = SCF(h2,method='DFT',functional="SVWN",pruning='SG1')
+        h2_lda.iterate()
+        self.assertAlmostEqual(h2_lda.energy,-1.135061,4)
+
+    def testQuadratureTables(self):
+        # The binary grids: unit vectors with weights summing to 1 for
+        # Lebedev, and weights summing to 2 over (-1,1) for Legendre
+        from PyQuante.Lebedev import Lebedev
+        from PyQuante.Legendre import Legendre
+        for n in Lebedev:
+            grid = Lebedev[n]
+            self.assertEqual(grid.shape,(n,4))
+            self.assertTrue(abs((grid[:,:3]**2).sum(1)-1).max() < 1e-12)
+            self.assertAlmostEqual(grid[:,3].sum(),1.0,12)
+        for n in Legendre:
+            self.assertEqual(Legendre[n].shape,(n,2))
+            self.assertAlmostEqual(Legendre[n][:,1].sum(),2.0,12)
+        self.assertTrue(Lebedev[194] is Lebedev[194])
+
+    def testFermiDirac(self):
+        # Batched spins share the solver, but get their own Fermi levels
+        from PyQuante.fermi_dirac import get_efermi,get_fermi_occs,\
+             get_entropy
+        from PyQuante.NumWrap import array,newaxis,log
+        orbe = array([[-1.2,-0.5,-0.31,-0.3,0.1,0.4],
+                      [-1.1,-0.45,-0.35,0.05,0.2,0.5]])
+        temp = 5e4
+        efermi = get_efermi([5,3],orbe,temp)
+        occs = get_fermi_occs(efermi[:,newaxis],orbe,temp)
+        for i,nel in enumerate([5,3]):
+            self.assertAlmostEqual(efermi[i],get_efermi(nel,orbe[i],temp),8)
+            self.assertAlmostEqual(2*occs[i].sum(),nel,8)
+        f = occs[0]
+        from PyQuante.Constants import Kboltz
+        entropy = Kboltz*temp*(f*log(f)+(1-f)*log(1-f)).sum()
+        self.assertAlmostEqual(get_entropy(occs,temp)[0],entropy,12)
+        # One level shared by weighted sets, as for k-points
+        efermi = get_efermi(7,orbe,temp,weights=[0.25,0.75])
+        occs = get_fermi_occs(efermi,orbe,temp)
+        self.assertAlmostEqual(2*(0.25*occs[0].sum()+0.75*occs[1].sum()),7,8)
+        # Occupations far from the Fermi level don't overflow
+        self.assertEqual(list(get_fermi_occs(0.,[-1e5,1e5],1.)),[1.,0.])
+
+    def testTransformInts(self):
+        # Blocked GEMM transformation against the textbook sum
+        from PyQuante.Ints import getbasis,get2ints,transform_ints
+        from PyQuante.cints import ijkl2intindex
+        from PyQuante.NumWrap import zeros,dot,eigh
+        bfs = getbasis(h2)
+        nbf = len(bfs)
+        Ints = get2ints(bfs)
+        aoints = zeros((nbf,nbf,nbf,nbf),'d')
+        for i in xrange(nbf):
+            for j in xrange(nbf):
+                for k in xrange(nbf):
+                    for l in xrange(nbf):
+                        aoints[i,j,k,l] = Ints[ijkl2intindex(i,j,k,l)]
+        orbs = eigh(aoints[0,0])[1]
+        occ,virt = orbs[:,:2],orbs[:,2:]
+        ints = transform_ints(Ints,(occ,virt,occ,virt),block_size=7)
+        ref = aoints
+        for C in [virt,occ,virt,occ]:
+            ref = dot(ref,C).transpose((3,0,1,2))
+        self.assertTrue(abs(ints-ref).max() < 1e-10)
+        packed = transform_ints(Ints,orbs,packed=True)
+        full = transform_ints(Ints,orbs)
+        self.assertAlmostEqual(packed[ijkl2intindex(1,3,2,0)],full[3,1,0,2],10)
+
     ########## Basis set tests ##########
 
     def testSTO3G(self):
@@ -201,6 +596,16 @@ class UnitTests(unittest.TestCase):
         self.assertAlmostEqual(e1[0],e2[0],6)
         self.assertAlmostEqual(e1[0],e3[0],6)
 
+    def testGeneralizedEigensolver(self):
+        from PyQuante.LA2 import geigh, GeneralizedEigensolver
+        solver = SCF(h2,method="HF")
+        h,S = solver.h, solver.S
+        e1,v1 = geigh(h,S)
+        for orthog in ['Sym','Can','Chol','Cut']:
+            e2,v2 = GeneralizedEigensolver(S,orthog=orthog).solve(h)
+            self.assertAlmostEqual(e1[0],e2[0],6)
+            self.assertAlmostEqual(e1[-1],e2[-1],6)
+
     def testMP2(self):
         solv = SCF(h2,method="HF")
         solv.iterate()
@@ -209,6 +614,26 @@ class UnitTests(unittest.TestCase):
         emp2 = MP2(solv.ERI,solv.solver.orbs,solv.solver.orbe,nclosed,nbf-nclosed)
         self.assertAlmostEqual(solv.energy+emp2,-1.157660,4)        
 
+    def testMP2Batched(self):
+        # One occupied orbital per batch, half transformed ints on disk
+        from PyQuante.MP import MP2Pairs
+        solv = SCF(lih,method="HF")
+        solv.iterate()
+        nclosed,nopen = lih.get_closedopen()
+        nbf = len(solv.basis_set.get())
+        orbs,orbe = solv.solver.orbs,solv.solver.orbe
+        emp2 = MP2(solv.ERI,orbs,orbe,nclosed,nbf-nclosed)
+        Epairs = MP2Pairs(solv.ERI,orbs,orbe,nclosed,nbf-nclosed,
+                          memory=1e-6,scratch=True,block_size=17)
+        self.assertEqual(Epairs.shape,(nclosed,nclosed))
+        self.assertAlmostEqual(Epairs.sum(),emp2,10)
+        self.assertAlmostEqual(Epairs[0,1],Epairs[1,0],10)
+
+    def testRIMP2(self):
+        for molecule in [h2,he,lih]:
+            emp2,erimp2 = rimp2(molecule)
+            self.assertAlmostEqual(erimp2,emp2,4)
+
     def testCIS(self):
         solv = SCF(h2,method="HF")
         solv.iterate()
@@ -220,6 +645,41 @@ class UnitTests(unittest.TestCase):
                    nvirt,solv.energy)
         self.assertAlmostEqual(Ecis[0],-0.573134,3)
 
+    def testCISDavidson(self):
+        # Matrix-free lowest roots against the full CIS matrix
+        solv = SCF(lih,method="HF")
+        solv.iterate()
+        nclosed,nopen = lih.get_closedopen()
+        nbf = len(solv.basis_set.get())
+        args = (solv.ERI,solv.solver.orbs,solv.solver.orbe,nclosed,
+                nbf-nclosed,solv.energy)
+        Eref = CIS(*args)
+        Ecis = CIS(*args,nroots=3,nguess=6,rtol=1e-6)
+        self.assertEqual(len(Ecis),3)
+        for i in xrange(3):
+            self.assertAlmostEqual(Ecis[i],Eref[i],8)
+
+    def testFCIDavidson(self):
+        # Slater-Condon diagonal and Davidson roots against the full
+        #  CI matrix, for the 225 determinants of LiH/sto-3g
+        from PyQuante.FullCI import FCISolver,FCIExactSolver
+        from PyQuante.NumWrap import diagonal
+        solv = SCF(lih,method="HF",basis="sto-3g")
+        solv.iterate()
+        args = (solv.h,solv.ERI,lih.get_enuke(),solv.solver.orbs,4,1,0)
+        exact = FCIExactSolver(*args)
+        Eref,Vref = exact.diagonalize()
+        fci = FCISolver(*args,k=3,tol=1e-8,eigensolver='davidson')
+        diag = fci.get_diagonal()
+        Hdiag = diagonal(exact.H_mat)
+        for i in xrange(len(Hdiag)):
+            self.assertAlmostEqual(diag[i],Hdiag[i],10)
+        Edav,Vdav = fci.iterate()
+        Eeigsh,Veigsh = FCISolver(*args,k=3).iterate()
+        for i in xrange(3):
+            self.assertAlmostEqual(Edav[i],Eref[i],6)
+            self.assertAlmostEqual(Eeigsh[i],Eref[i],6)
+
     def testLiH_OEP_AN(self):
         do_oep_an = True
         lih_hf = SCF(lih,method="HF")
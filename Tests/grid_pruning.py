@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""\
+Accuracy versus cost of the pruned atomic grids. Runs an LDA calculation
+on water with the default 194-point grid and with each pruned grid, and
+reports the number of grid points, the time, and the energy relative to
+the largest (SG3) grid.
+"""
+
+from time import time
+from PyQuante.dft import dft
+from PyQuante.MG2 import MG2
+from PyQuante.Molecule import Molecule
+
+r = 1./0.5291772
+h2o=Molecule('h2o',atomlist = [(8,(0,0,0)),(1,(r,0,0)),(1,(0,r,0))])
+
+def run(pruning):
+    t0 = time()
+    en,orbe,orbs = dft(h2o,functional='SVWN',pruning=pruning)
+    return len(MG2(h2o,pruning=pruning)),time()-t0,en
+
+def main():
+    results = [(pruning,run(pruning))
+               for pruning in [None,'SG1','SG2','SG3']]
+    eref = results[-1][1][2]
+    print "%-6s %8s %8s %14s %10s" % ('Grid','Points','Time','Energy','Error')
+    for pruning,(npts,t,en) in results:
+        print "%-6s %8d %8.2f %14.8f %10.2e" % (pruning,npts,t,en,en-eref)
+    return
+
+if __name__ == '__main__': main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""\
+RI-MP2 against canonical MP2 for the molecules of h2_mp2.py, he_mp2.py,
+lih_mp2.py and ch4_mp2.py, with the default even-tempered auxiliary
+basis. The two correlation energies must agree to within the
+tolerance for the molecule. Methane takes a while.
+"""
+
+import unittest, sciunittest
+
+from PyQuante.Ints import getbasis,getints
+from PyQuante.hartree_fock import rhf
+from PyQuante.Molecule import Molecule
+from PyQuante.MP import MP2,RIMP2
+
+# Fitting error allowed in the correlation energy, in Hartree. The
+# errors are a few 1e-6 for H2 and He, and 4e-5 for LiH.
+tolerance = {'h2':1e-4,'He':1e-4,'lih':1e-4,'ch4':5e-4}
+name = "RI_MP2"
+
+h2 = Molecule('h2',[(1,(1.,0,0)),(1,(-1.,0,0))])
+he = Molecule('He',[(2,(0,0,0))],units='Angstroms')
+lih = Molecule('lih',
+               [(3,( .0000000000, .0000000000, .0000000000)),
+                (1,( .0000000000, .0000000000,1.629912))],
+               units='Angstroms')
+ch4 = Molecule('ch4',
+               [(6,( .0000000000, .0000000000, .0000000000)),
+                (1,( .0000000000, .0000000000,1.0836058890)),
+                (1,(1.0216334297, .0000000000,-.3612019630)),
+                (1,(-.5108167148, .8847605034,-.3612019630)),
+                (1,(-.5108167148,-.8847605034,-.3612019630))],
+               units='Angstroms')
+
+def main(atoms):
+    "Return the MP2 and RI-MP2 correlation energies of atoms"
+    bfs = getbasis(atoms)
+    nbf = len(bfs)
+    nocc,nopen = atoms.get_closedopen()
+    S,h,Ints = getints(bfs,atoms)
+    en,orbe,orbs = rhf(atoms,integrals=(S,h,Ints))
+    emp2 = MP2(Ints,orbs,orbe,nocc,nbf-nocc)
+    erimp2 = RIMP2(bfs,atoms,orbs,orbe,nocc,nbf-nocc)
+    return emp2,erimp2
+
+class RIMP2Test(sciunittest.TestCase):
+    def check(self,atoms):
+        emp2,erimp2 = main(atoms)
+        self.assertInside(erimp2, emp2, tolerance[atoms.name])
+
+    def testH2(self):
+        """RI-MP2 of H2 within 1e-4 of MP2?"""
+        self.check(h2)
+
+    def testHe(self):
+        """RI-MP2 of He within 1e-4 of MP2?"""
+        self.check(he)
+
+    def testLiH(self):
+        """RI-MP2 of LiH within 1e-4 of MP2?"""
+        self.check(lih)
+
+    def testCH4(self):
+        """RI-MP2 of CH4 within 5e-4 of MP2?"""
+        self.check(ch4)
+
+def suite():
+    return unittest.TestLoader().loadTestsFromTestCase(RIMP2Test)
+
+if __name__ == '__main__':
+    import unittest
+    unittest.TextTestRunner(verbosity=2).run(suite())
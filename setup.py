@@ -115,5 +115,6 @@ setup(name="PyQuante",
       platforms = ["any"],
       classifiers = filter(None,classifiers.split("\n")),
       packages = ['PyQuante','PyQuante.Basis','PyQuante.IO','PyQuante.IO.FormatHandlers'],
+      package_data = {'PyQuante':['GridData/*.dat']},
       ext_modules = ext_modules
       )